@@ -3,31 +3,38 @@
 #####################################################################################################################################
 # NATIVE MODULES
 import csv
-import json
+import hashlib
+import multiprocessing
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import asdict, is_dataclass
-
-# import datetime
-from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 from loguru import logger
 from rich.console import Console
 
+#####################################################################################################################################
+# TensorFlow reads these when it is first imported (transformers can pull it in), so they must be set
+# before any AI module is imported.
+# oneDNN is left at TensorFlow's default (enabled), which speeds up transformer encoder inference on x86-64.
+# If a model regresses with it, run with TF_ENABLE_ONEDNN_OPTS=0 set in the environment.
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "2"  # 0 = DEBUG, 1 = INFO, 2 = WARNING, 3 = ERROR
+
 #####################################################################################################################################
 # HELPER MODULES
+import numpy as np
+import orjson
 from tqdm.auto import tqdm
 
 #####################################################################################################################################
 # AI SPECIFIC MODULES
-from transformers import logging as hf_logging
-
-from modules.ai_model_loading import load_models
+# transformers / torch are imported lazily inside the worker functions below, so importing this
+# file (or starting the main process) does not pay for loading the AI stack
 
 #####################################################################################################################################
 # PROJECT SPECIFIC MODULES
-from modules.ai_models_output import generate_ai_model_results
 from modules.analysis_config_loader import load_analysis_config
 from modules.date_functions import extract_date_time_from_json_filename
 from modules.generate_chunk_profections import calculate_current_profections
@@ -40,16 +47,13 @@ from modules.helper_functions import insert_keys, print_table
 from modules.idioms_and_beliefs import load_iodlect
 from modules.audio_file_metadata import generate_audio_metadata
 
-analysis_config = load_analysis_config()
+# Spawned worker processes re-import this file; they get the parent's already-parsed config
+# through _init_worker instead of reading and validating the TOML again
+analysis_config = (
+    load_analysis_config() if multiprocessing.parent_process() is None else None
+)
 
 #####################################################################################################################################
-# Set the logging level to error to suppress warnings
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "2"  # 0 = DEBUG, 1 = INFO, 2 = WARNING, 3 = ERROR
-os.environ["TF_ENABLE_ONEDNN_OPTS"] = "0"
-hf_logging.set_verbosity_error()
-
-os.system("clear")
-
 # Create a rich console
 console = Console()
 
@@ -57,7 +61,528 @@ console = Console()
 file_console = Console(color_system=None)
 
 
+# Transcription JSON files, and the analysis outputs to skip: the older timestamped ones
+# (YYYY-MM-DD - HH-MM-SS before .json) and the current " - analysis_<source hash>" ones
+_JSON_SUFFIXES = (".json", ".JSON")
+_SKIP_RE = re.compile(
+    r".*(_\d{4}-\d{2}-\d{2} - \d{2}-\d{2}-\d{2}| - analysis_[0-9a-f]{16})\.json$",
+    re.IGNORECASE,
+)
+
+# Suffix the transcription script adds to the audio file stem; stripping it gives the audio stem back
+_TRANSCRIPT_SUFFIX = " - large-v2 - SR"
+
+# Source audio files that transcriptions are matched against
+_AUDIO_SUFFIXES = (".mp3", ".MP3", ".flac", ".FLAC")
+
+# Number of chunks sent through a model per call
+AI_MODEL_BATCH_SIZE = 16
+
+# Background threads per worker process that hash / parse source audio files; kept low so
+# the reads do not thrash a spinning disk
+AUDIO_METADATA_MAX_WORKERS = 2
+
+# Set CHIMERA_DEBUG_JSON=1 (or true / yes / on) to write indented (human readable) analysis JSON,
+# and to log the model configs and each chunk's model results; compact JSON and no such logging otherwise
+DEBUG_JSON = os.environ.get("CHIMERA_DEBUG_JSON", "").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+JSON_DUMP_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_NON_STR_KEYS
+    | (orjson.OPT_INDENT_2 if DEBUG_JSON else 0)
+)
+
+
+def _dumps(obj):
+    """Indented JSON text for the CHIMERA_DEBUG_JSON debug logging."""
+    return orjson.dumps(
+        obj,
+        option=orjson.OPT_INDENT_2
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    ).decode()
+
+
+# Precomputed indents, indexed by nesting depth, for the model config tables
+INDENT = ("", "  ", "    ", "      ")
+TAB_INDENT = ("", "\t", "\t\t", "\t\t\t")
+
+
 #####################################################################################################################################
+def _walk(d, depth=0, indent=INDENT, skip_keys=()):
+    """
+    Yields an indented, line-by-line representation of a (possibly nested) model configuration.
+
+    Args:
+        d (dict | dataclass): The configuration to format. Dataclasses are converted with `asdict`.
+        depth (int, optional): The nesting depth of `d`; selects the indent used for its keys. Defaults to 0.
+        indent (tuple[str, ...], optional): Indent strings indexed by depth. Defaults to `INDENT`.
+        skip_keys (tuple[str, ...], optional): Top-level keys to leave out. Defaults to ().
+            Keys starting with "_" (values derived from the other fields) are always left out.
+
+    Yields:
+        str: One formatted line per key, and per list item.
+
+    Notes:
+        - Intended for pretty-printing the config table, not for serialization.
+        - Depths deeper than `indent` reuse its last entry.
+    """
+    if is_dataclass(d):
+        d = asdict(d)
+
+    pad = indent[min(depth, len(indent) - 1)]
+    for key, value in d.items():
+        if key in skip_keys or key.startswith("_"):
+            continue
+
+        if isinstance(value, dict):
+            yield f"{pad}{key}:"
+            yield from _walk(value, depth + 1, indent)
+        elif isinstance(value, list):
+            yield f"{pad}{key}:"
+            item_pad = indent[min(depth + 1, len(indent) - 1)]
+            for item in value:
+                yield f"{item_pad}{item}"
+        else:
+            yield f"{pad}{key}: {value}"
+
+
+#####################################################################################################################################
+# Astrology results only move meaningfully from minute to minute, so chunks that start within the same
+# minute share one calculation. The caches are keyed by "YYYY-MM-DDTHH:MM" and cleared for every file.
+@lru_cache(maxsize=4096)
+def _cached_chunk_transits(start_minute, orb):
+    return calculate_chunk_transits(f"{start_minute}:00", orb)
+
+
+@lru_cache(maxsize=4096)
+def _cached_chunk_profections(start_minute):
+    return calculate_current_profections(
+        f"{start_minute}:00", analysis_config.astrology_variables
+    )
+
+
+@lru_cache(maxsize=4096)
+def _cached_chunk_zrs_data(start_minute, pos_file, pof_file):
+    return generate_zrs_data(pos_file, pof_file, f"{start_minute}:00")
+
+
+# Created on first use inside each worker process, so no threads exist before a fork
+@lru_cache(maxsize=None)
+def _audio_metadata_executor():
+    return ThreadPoolExecutor(max_workers=AUDIO_METADATA_MAX_WORKERS)
+
+
+#####################################################################################################################################
+# Set inside each worker process by _init_worker: the loaded models, the inputs shared by
+# every file, and the row the worker draws its chunk progress bar on
+_worker_active_models = None
+_worker_labels = None
+_worker_questions = None
+_worker_idiolect = None
+_worker_active_model_configs = None
+_worker_pbar_position = 1
+
+
+#####################################################################################################################################
+def _init_worker(
+    dict_of_active_models,
+    parent_analysis_config,
+    labels,
+    questions,
+    idiolect,
+    active_model_configs,
+    worker_count,
+):
+    """
+    Loads the active AI models, and the inputs shared by every file, into module-level globals for a worker process.
+
+    Args:
+        dict_of_active_models (list[dict]): The active model configurations, converted to dictionaries.
+        parent_analysis_config (AnalysisConfig): The analysis configuration loaded by the main process.
+        labels (list[str]): Custom labels for the label-aware models.
+        questions (list[dict]): Custom questions for the QnA-capable models.
+        idiolect (list): The loaded personal idiolect.
+        active_model_configs (list[ModelConfig]): The model configurations marked for use.
+        worker_count (multiprocessing.Value): A shared counter of started workers; it numbers each
+            worker's chunk progress bar row.
+
+    Side Effects:
+        - Sets the module-level `_worker_*` variables and `analysis_config`.
+
+    Notes:
+        - Loaded models (GPU tensors, HF pipelines) cannot be pickled, so each worker loads its own copy.
+        - The labels, questions, idiolect, and model configs are sent once per worker here, instead of
+          being pickled with every submitted file.
+        - The AI modules are imported here, so only the worker processes load transformers / torch.
+    """
+    global _worker_active_models, analysis_config
+    global _worker_labels, _worker_questions, _worker_idiolect
+    global _worker_active_model_configs, _worker_pbar_position
+
+    analysis_config = parent_analysis_config
+    _worker_labels = labels
+    _worker_questions = questions
+    _worker_idiolect = idiolect
+    _worker_active_model_configs = active_model_configs
+
+    # Row 0 is the file progress bar; each worker gets its own row below it
+    with worker_count.get_lock():
+        worker_count.value += 1
+        _worker_pbar_position = worker_count.value
+
+    from transformers import logging as hf_logging
+
+    from modules.ai_model_loading import load_models
+
+    # Set the logging level to error to suppress warnings
+    hf_logging.set_verbosity_error()
+
+    _worker_active_models = load_models(dict_of_active_models)
+
+
+#####################################################################################################################################
+@logger.catch
+def process_one_file(file_path, audio_file_name):
+    """
+    Runs the full chunk analysis for a single transcription JSON file and writes the analysis JSON.
+
+    Args:
+        file_path (Path): The transcription JSON file to analyze.
+        audio_file_name (Path | None): The source audio file matching `file_path`, or None if there is none.
+
+    Returns:
+        Path | None: The path of the analysis JSON file that was written, or that already existed.
+            None if no source audio file was found for `file_path`, or if the analysis failed.
+
+    Notes:
+        - Errors are logged by `@logger.catch` rather than raised; a missing source audio file is
+          reported as a `FileNotFoundError` before any chunk is analyzed.
+        - Runs inside a worker process; the config, models, labels, questions, idiolect, and model
+          configs are the worker globals set by `_init_worker`.
+        - The output name carries a hash of the source file's mtime and size, so an unchanged
+          transcription is skipped on re-runs and a changed one is analyzed again.
+        - The JSON is written to a `.json.tmp` file and moved into place, so a crash never leaves
+          a partial analysis behind.
+        - The source audio is hashed and parsed on a background thread while the chunks are analyzed.
+    """
+    # Imported lazily with the rest of the AI stack; after the first file this is a sys.modules lookup
+    from modules.ai_models_output import generate_ai_model_results_batched
+
+    analysis_output_directory = analysis_config.analysis_output_directory
+
+    # Bound the astrology caches to a single file
+    _cached_chunk_transits.cache_clear()
+    _cached_chunk_profections.cache_clear()
+    _cached_chunk_zrs_data.cache_clear()
+
+    file_name = file_path.name
+
+    # Construct the full output file path and file name from the source file's mtime / size
+    file_stat = file_path.stat()
+    file_name_suffix = hashlib.sha1(
+        f"{file_stat.st_mtime_ns}:{file_stat.st_size}".encode()
+    ).hexdigest()[:16]
+    output_file_path = (
+        analysis_output_directory
+        / f"{Path(file_name).stem} - analysis_{file_name_suffix}.json"
+    )
+
+    if output_file_path.exists():
+        logger.info(f"Skipping, analysis already exists: {output_file_path}")
+        return output_file_path
+
+    logger.info(f"Processing: {file_path}")
+
+    # Fail fast rather than after all chunks are analyzed
+    if audio_file_name is None:
+        raise FileNotFoundError(f"No source audio file found for: {file_path}")
+
+    # Hash and parse the source audio in the background while the chunks are analyzed;
+    # hashlib and MediaInfo release the GIL, so the disk reads overlap the model work
+    audio_metadata_future = _audio_metadata_executor().submit(
+        generate_audio_metadata, audio_file_name
+    )
+
+    # Obtain date, time, and audio duration information from base filename
+    (
+        file_calendar_start_datetime,
+        file_calendar_start_datetime_str,
+        file_calendar_end_datetime,
+        file_calendar_start_datetime_str,
+        file_calendar_start_date,
+        file_calendar_start_time,
+        file_calendar_end_date,
+        file_calendar_end_time,
+        file_total_duration_in_seconds,
+    ) = extract_date_time_from_json_filename(file_path)
+
+    # Convert total duration from seconds to hours, minutes, seconds
+    file_duration_hours, remainder = divmod(
+        int(file_total_duration_in_seconds), 3600
+    )
+    file_duration_minutes, file_duration_seconds = divmod(remainder, 60)
+    # Running sets of every tag / keyphrase seen across the file's chunks
+    file_tag_set = set()
+    file_keyphrase_set = set()
+    #####################################################################################################################################
+
+    # Create chunks
+    chunks = create_chunk_data(file_path)
+
+    all_chunk_details = []
+    chunk_details = {}
+
+    #####################################################################################################################################
+    # Run the AI models over all of the chunks up front so they can be batched
+    chunk_texts = [chunk["chunk_text"] for chunk in chunks]
+    chunk_calendar_start_datetimes = [
+        chunk["transcription_time_data"]["chunk_calendar_start_datetime"]
+        for chunk in chunks
+    ]
+
+    # None if the model run failed (already logged by @logger.catch); the file is still written
+    # with empty model results and whatever astrology / metadata results succeed
+    all_ai_model_results = generate_ai_model_results_batched(
+        chunk_texts,
+        _worker_active_model_configs,
+        _worker_active_models,
+        _worker_labels,
+        _worker_questions,
+        _worker_idiolect,
+        chunk_calendar_start_datetimes,
+        batch_size=AI_MODEL_BATCH_SIZE,
+    ) or [{} for _ in chunks]
+    #####################################################################################################################################
+    # Adjust every chunk's audio and calendar times in one vectorized pass:
+    # one second earlier for the start, one second later for the end
+    chunk_time_data = [chunk["transcription_time_data"] for chunk in chunks]
+    one_second = np.timedelta64(1, "s")
+
+    adjusted_audio_start_locations = (
+        np.array(
+            [float(t["chunk_audio_start_time_location"]) for t in chunk_time_data]
+        )
+        - 1
+    )
+    # This is most likely the first chunk, and if the start time is less than 1 second, we might
+    # as well start from the very beginning of the audio file.
+    adjusted_audio_start_locations = np.where(
+        adjusted_audio_start_locations < 1, 0.00, adjusted_audio_start_locations
+    ).tolist()
+    adjusted_audio_end_locations = (
+        np.array([float(t["chunk_audio_end_time_location"]) for t in chunk_time_data])
+        + 1
+    ).tolist()
+
+    # datetime64[us] keeps microsecond precision; .tolist() converts back to datetime objects
+    adjusted_calendar_start_datetimes = (
+        np.array(chunk_calendar_start_datetimes, dtype="datetime64[us]") - one_second
+    ).tolist()
+    adjusted_calendar_end_datetimes = (
+        np.array(
+            [t["chunk_calendar_end_datetime"] for t in chunk_time_data],
+            dtype="datetime64[us]",
+        )
+        + one_second
+    ).tolist()
+    #####################################################################################################################################
+
+    chunk_pbar = tqdm(
+        total=len(chunks),
+        position=_worker_pbar_position,
+        unit="chunk",
+        leave=False,
+        mininterval=0.5,
+    )
+
+    # Start processing each chunk
+    for chunk_index, (chunk, ai_model_results) in enumerate(
+        zip(chunks, all_ai_model_results)
+    ):
+        chunk_calendar_start_datetime = chunk["transcription_time_data"][
+            "chunk_calendar_start_datetime"
+        ]
+        if DEBUG_JSON:
+            logger.debug(f"ai_model_results:\n\n{_dumps(ai_model_results)}")
+
+        # "YYYY-MM-DDTHH:MM"
+        chunk_start_minute = chunk_calendar_start_datetime[:16]
+
+        chunk_transits = _cached_chunk_transits(
+            chunk_start_minute,
+            analysis_config.astrology_variables.planet_and_aspect_orb,
+        )
+
+        chunk_profections = _cached_chunk_profections(chunk_start_minute)
+
+        chunk_zrs_data = _cached_chunk_zrs_data(
+            chunk_start_minute,
+            analysis_config.astrology_variables.pos_file,
+            analysis_config.astrology_variables.pof_file,
+        )
+        #####################################################################################################################################
+        # Update the chunk_tags list with a sorted, unique list of tags from the QnA responses
+        updated_chunk_tags = generate_chunk_tags(
+            chunk,
+            ai_model_results,
+            model_name="knowledgator/gliner-multitask-large-v0.5",
+            model_key="qna",
+            chunk_key="chunk_tags",
+        )
+        chunk["chunk_tags"] = updated_chunk_tags
+        file_tag_set.update(updated_chunk_tags)
+        #####################################################################################################################################
+        # Update the chunk_keyphrases with keyphrases returned by the model
+        updated_chunk_keyphrases = generate_chunk_tags(
+            chunk,
+            ai_model_results,
+            model_name="ml6team/keyphrase-extraction-kbir-inspec",
+            model_key=None,
+            chunk_key="chunk_keyphrases",
+        )
+        # print(updated_chunk_keyphrases)
+        # input("\n\nHERE\n\n")
+        chunk["chunk_keyphrases"] = updated_chunk_keyphrases
+        file_keyphrase_set.update(updated_chunk_keyphrases)
+        ####################################################################################################################################
+
+        ####################################################################################################################################
+
+        # The adjusted start and end times for the chunk within the audio file
+        adjusted_chunk_audio_start_time_location = adjusted_audio_start_locations[
+            chunk_index
+        ]
+        adjusted_chunk_audio_end_time_location = adjusted_audio_end_locations[
+            chunk_index
+        ]
+
+        # Calculate the adjusted chunk duration
+        # We will use this in the filname for the chunk audio file
+        chunk_duration = int(
+            adjusted_chunk_audio_end_time_location
+            - adjusted_chunk_audio_start_time_location
+        )
+
+        chunk_audio_file_name = f"{audio_file_name.stem} - chunk - {chunk["chunk_id"]:0{4}} of {len(chunks):0{4}} - {chunk_duration}{audio_file_name.suffix}"
+        chunk_json_file_name = f"{audio_file_name.stem} - chunk - {chunk["chunk_id"]:0{4}} of {len(chunks):0{4}} - {chunk_duration}.json"
+
+        chunk_source_file_data = {
+            "source_audio_file_name": audio_file_name.name,
+            "source_json_file_name": file_path.name,
+            "chunk_audio_file_name": chunk_audio_file_name,
+            "total_number_of_chunks": len(chunks),
+        }
+
+        updated_chunk = insert_keys(
+            chunk, insert_after_key="chunk_id", new_items=chunk_source_file_data
+        )
+
+        ####################################################################################################################################
+        # Adjusted times
+        adjusted_chunk_calendar_start_datetime = adjusted_calendar_start_datetimes[
+            chunk_index
+        ]
+        adjusted_chunk_calendar_end_datetime = adjusted_calendar_end_datetimes[
+            chunk_index
+        ]
+
+        adjusted_chunk_duration = calculate_duration(
+            adjusted_chunk_calendar_start_datetime,
+            adjusted_chunk_calendar_end_datetime,
+            key_prefix="adjusted",
+        )
+
+        adjusted_chunk_time_data = {
+            "adjusted_chunk_time_data": {
+                "adjusted_chunk_audio_start_time_location": adjusted_chunk_audio_start_time_location,
+                "adjusted_chunk_calendar_start_datetime": adjusted_chunk_calendar_start_datetime.isoformat(),
+                "adjusted_chunk_audio_end_time_location": adjusted_chunk_audio_end_time_location,
+                "adjusted_chunk_calendar_end_datetime": adjusted_chunk_calendar_end_datetime.isoformat(),
+                **adjusted_chunk_duration,
+            }
+        }
+
+        updated_chunk = insert_keys(
+            updated_chunk,
+            insert_after_key="transcription_time_data",
+            new_items=adjusted_chunk_time_data,
+        )
+        ####################################################################################################################################
+
+        ####################################################################################################################################
+        # The dictionary that contains all of the data regarding the analysis of a chunk
+        chunk_details = {
+            # **chunk,
+            **updated_chunk,
+            "chunk_analysis": {
+                **ai_model_results,
+                **chunk_transits,
+                **chunk_profections,
+                **chunk_zrs_data,
+            },
+        }
+        #####################################################################################################################################
+        all_chunk_details.append(chunk_details)
+
+        chunk_pbar.update(1)
+        #####################################################################################################################################
+    chunk_pbar.close()
+    #####################################################################################################################################
+
+    # The running sets are already deduplicated; just sort them
+    file_all_chunk_tags = sorted(file_tag_set)
+
+    file_all_keyphrases = sorted(file_keyphrase_set)
+
+    file_chunk_root = generate_chunk_root(all_chunk_details)
+
+    file_time_data = {
+        "file_time_data": {
+            "file_calendar_start_datetime": file_calendar_start_datetime,
+            "file_calendar_start_date": file_calendar_start_date,
+            "file_calendar_start_time": file_calendar_start_time,
+            "file_calendar_end_datetime": file_calendar_start_datetime,
+            "file_calendar_end_date": file_calendar_end_date,
+            "file_calendar_end_time": file_calendar_end_time,
+            "file_duration_hours": file_duration_hours,
+            "file_duration_minutes": file_duration_minutes,
+            "file_duration_seconds": file_duration_seconds,
+            "file_total_duration_in_seconds": file_total_duration_in_seconds,
+        }
+    }
+
+    audio_file_metadata, original_meta_data = audio_metadata_future.result()
+
+    # The dictionary that makes up the metadata file for each audio journal analusr
+    file_contents = {
+        "original_trasncript_filename": file_name,
+        # "source_audio_file_name": audio_file_name.name,
+        **audio_file_metadata,
+        **file_time_data,
+        "file_all_chunk_tags": file_all_chunk_tags,
+        "file_all_keyphrases": file_all_keyphrases,
+        "file_chunk_root": file_chunk_root,
+        "chunks": all_chunk_details,
+    }
+    #####################################################################################################################################
+    # Write the file_content dictionary to as a JSON object; orjson serializes straight to UTF-8 bytes.
+    # Write to a temporary file first and swap it in, so the output is either complete or absent
+    tmp_output_file_path = output_file_path.with_suffix(".json.tmp")
+    with open(tmp_output_file_path, "wb", buffering=1 << 20) as file:
+        file.write(orjson.dumps(file_contents, option=JSON_DUMP_OPTIONS))
+
+    os.replace(tmp_output_file_path, output_file_path)
+
+    logger.info(f"Analysis written to: {output_file_path}\n")
+    #####################################################################################################################################
+
+    return output_file_path
 
 
 #####################################################################################################################################
@@ -78,12 +603,13 @@ if __name__ == "__main__":
 
     # Load custom labels
     if analysis_config.analysis_label_file_path:
-        with open(
-            analysis_config.analysis_label_file_path,
-            "r",
-            encoding="utf-8",
-        ) as file:
-            labels = [line.strip() for line in file]
+        # One read and a C-level split instead of iterating the file line by line
+        labels = [
+            line.strip()
+            for line in Path(analysis_config.analysis_label_file_path)
+            .read_text(encoding="utf-8")
+            .splitlines()
+        ]
 
         number_of_labels = len(labels)
     else:
@@ -98,11 +624,9 @@ if __name__ == "__main__":
             encoding="utf-8",
             newline="",
         ) as csvfile:
-            reader = csv.DictReader(csvfile)
-            all_questions = [dict(row) for row in reader]
+            # DictReader already yields a dict per row
+            questions = list(csv.DictReader(csvfile))
 
-        # Now you have a list of dicts
-        questions = all_questions
         number_of_questions = len(questions)
     else:
         questions = []
@@ -132,6 +656,7 @@ if __name__ == "__main__":
     local_print_models = []
     server_print_models = []
     active_model_configs = []
+    dict_of_active_models = []
 
     # Start processing model configuration data
     for current_model in model_configs:
@@ -145,77 +670,13 @@ if __name__ == "__main__":
             continue
 
         if use_model.strip().lower() == "yes":
+            # Convert once; the same dict feeds both the printout and the workers
+            current_model_dict = asdict(current_model)
             active_model_configs.append(current_model)
+            dict_of_active_models.append(current_model_dict)
 
             if model_host == "local":
-
-                #####################################################################################################################################
-                @logger.catch
-                def format_second_level_dict(d):
-                    """
-                    Formats a nested dictionary up to two levels deep into an indented string.
-
-                    This helper function takes a dictionary and returns a formatted string representation,
-                    displaying only the first and second levels of nested keys and values. If any value at
-                    the second level is itself a dictionary (i.e., a third level exists), it formats the
-                    third level values but does not recurse beyond that.
-
-                    Args:
-                        d (dict): A dictionary with nested structure, where values at the first level
-                            may themselves be dictionaries (and potentially include a third level).
-
-                    Returns:
-                        str: A string with a readable, line-by-line, indented representation of the
-                        nested dictionary structure.
-
-                    Side Effects:
-                        None
-
-                    Notes:
-                        - This function is intended for **pretty-printing** or logging purposes, not for
-                        serialization or machine-readable output.
-                        - The formatting follows this indentation pattern:
-                            key:
-                            sub_key: sub_value
-                            sub_key:
-                                sub_sub_key: sub_sub_value
-                        - The function does **not** format values that are not dictionaries at the top level;
-                        they are skipped entirely.
-                        - Depth is fixed: it does not recurse beyond the third level.
-
-                    Caveats:
-                        - Keys and values are converted to strings using `str()`, which may not preserve
-                        original types or formatting (e.g., for dates or custom objects).
-                        - The order of keys is preserved only if the input dictionary is an `OrderedDict`
-                        or Python 3.7+ where dicts maintain insertion order.
-                        - Top-level keys with non-dict values are ignored entirely (i.e., not shown in output).
-
-                    Raises:
-                        None
-                    """
-                    if is_dataclass(d):
-                        d = asdict(d)
-
-                    formatted = []
-                    for key, value in d.items():
-                        if isinstance(value, dict):
-                            formatted.append(f"{key}:")
-                            for sub_key, sub_value in value.items():
-                                if isinstance(sub_value, dict):
-                                    formatted.append(f"  {sub_key}:")
-                                    for sub_sub_key, sub_sub_value in sub_value.items():
-                                        formatted.append(
-                                            f"    {sub_sub_key}: {sub_sub_value}"
-                                        )
-                                else:
-                                    formatted.append(f"  {sub_key}: {sub_value}")
-                        else:
-                            formatted.append(f"{key}: {value}")
-                    return "\n".join(formatted)
-
-                #####################################################################################################################################
-
-                second_level_info = format_second_level_dict(current_model)
+                second_level_info = "\n".join(_walk(current_model_dict))
 
                 if second_level_info:
                     model_info = f"{model_name} / {model_type}\n{second_level_info}"
@@ -225,23 +686,12 @@ if __name__ == "__main__":
                 local_print_models.append(model_info)
 
             elif model_host == "server":
-                server_details = []
-                model_dict = asdict(current_model)  # Convert ModelConfig to dict
-                for key, value in model_dict.items():
-                    if key not in ["model_name", "model_type", "model_host"]:
-                        if isinstance(value, dict):
-                            server_details.append(f"\t{key}:")
-                            for sub_key, sub_value in value.items():
-                                if isinstance(sub_value, dict):
-                                    server_details.append(f"\t\t{sub_key}:")
-                                    for sub_sub_key, sub_sub_value in sub_value.items():
-                                        server_details.append(
-                                            f"\t\t\t{sub_sub_key}: {sub_sub_value}"
-                                        )
-                                else:
-                                    server_details.append(f"\t\t{sub_key}: {sub_value}")
-                        else:
-                            server_details.append(f"\t{key}: {value}")
+                server_details = _walk(
+                    current_model_dict,
+                    depth=1,
+                    indent=TAB_INDENT,
+                    skip_keys=("model_name", "model_type", "model_host"),
+                )
 
                 server_info = f"{model_name} / {model_type}\n" + "\n".join(
                     server_details
@@ -255,28 +705,39 @@ if __name__ == "__main__":
         analysis_config.analysis_source_audio_file_directory
     )
 
-    # Get a list of all files in the directory
-    json_files_in_directory = [
-        entry
+    # Ensure these are Path objects if not already
+    analysis_directories_to_process = [Path(d) for d in analysis_directories_to_process]
+    ignored_directories = set(Path(d) for d in analysis_directories_to_ignore)
+
+    # Scan each directory once (non-recursive), skipping pattern matches;
+    # DirEntry.is_file() reuses the stat data gathered by the scan
+    json_by_dir = {
+        directory: [
+            Path(entry.path)
+            for entry in os.scandir(directory)
+            if entry.is_file()
+            and entry.name.endswith(_JSON_SUFFIXES)
+            and not _SKIP_RE.match(entry.name)
+        ]
         for directory in analysis_directories_to_process
-        if directory.is_dir()
-        for entry in directory.iterdir()
-        if entry.is_file() and str(entry).strip().lower().endswith(".json")
-    ]
-    audio_files_in_directory = [
-        entry
-        for entry in analysis_source_audio_file_directory.iterdir()
-        if (entry.is_file() and str(entry).strip().lower().endswith((".mp3", ".flac")))
-    ]
+        if directory.is_dir() and directory not in ignored_directories
+    }
+    total_files = sum(len(json_files) for json_files in json_by_dir.values())
+
+    # Index the source audio files by stem; a transcription JSON is named
+    # "<audio stem> - large-v2 - SR.json"
+    audio_by_stem = {
+        Path(entry.name).stem: Path(entry.path)
+        for entry in os.scandir(analysis_source_audio_file_directory)
+        if entry.is_file() and entry.name.endswith(_AUDIO_SUFFIXES)
+    }
 
-    # Create chunks
-    for json_file_path in json_files_in_directory:
-        # Obtain corresponding audio file
-        audio_file_name = [
-            item
-            for item in audio_files_in_directory
-            if json_file_path.stem.replace(" - large-v2 - SR", "") in item.name
-        ]
+    # Strip the transcription suffix from each JSON file once, up front
+    cleaned_stems = {
+        file_path: file_path.stem.replace(_TRANSCRIPT_SUFFIX, "")
+        for json_files in json_by_dir.values()
+        for file_path in json_files
+    }
     #####################################################################################################################################
     config_for_table = {
         key: value
@@ -309,330 +770,52 @@ if __name__ == "__main__":
 
     # #####################################################################################################################################
     # Load all active models into memory
-    dict_of_active_models = [asdict(model) for model in active_model_configs]
     logger.info("Loading AI models")
-    # logger.info(
-    #     f"active_model_configs:\n\n{json.dumps(dict_of_active_models, indent=4)}"
-    # )
-    active_models = load_models(dict_of_active_models)
-    # logger.info(f"active_models:\n\n{json.dumps(active_models, indent=4)}")
+    if DEBUG_JSON:
+        logger.debug(f"active_model_configs:\n\n{_dumps(dict_of_active_models)}")
     #####################################################################################################################################
 
-# Regex to detect pattern: YYYY-MM-DD - HH-MM-SS before .json
-skip_pattern = re.compile(
-    r".*_\d{4}-\d{2}-\d{2} - \d{2}-\d{2}-\d{2}\.json$", re.IGNORECASE
-)
-
-# Ensure these are lists of Path objects if not already
-analysis_directories_to_process = [Path(d) for d in analysis_directories_to_process]
-analysis_directories_to_ignore = set(Path(d) for d in analysis_directories_to_ignore)
-
-
-# Calculate total number of JSON files (non-recursive), skipping pattern matches
-total_files = sum(
-    len(
-        [
-            f
-            for f in directory.iterdir()
-            if f.is_file()
-            and f.suffix.lower() == ".json"
-            and not skip_pattern.match(f.name)
-        ]
+    #####################################################################################################################################
+    # Process the files concurrently; each worker loads its own copy of the models and gets
+    # the config, labels, questions, and idiolect once, through _init_worker
+    max_workers = int(analysis_config.analysis_variables.get("analysis_max_workers", 1))
+    # Ensure the output folder exists once, before any file is processed
+    os.makedirs(analysis_output_directory, exist_ok=True)
+
+    start_method = (
+        "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
     )
-    for directory in analysis_directories_to_process
-    if directory not in analysis_directories_to_ignore
-)
 
-with tqdm(
-    total=total_files, position=0, desc="Processing Files", unit="file"
-) as file_pbar:
-    for directory in analysis_directories_to_process:
-        if directory in analysis_directories_to_ignore:
-            continue
-
-        json_files = [
-            f
-            for f in directory.iterdir()
-            if f.is_file()
-            and f.suffix.lower() == ".json"
-            and not skip_pattern.match(f.name)
-        ]
-
-        for file_path in json_files:
-            file_name = file_path.name
-            logger.info(f"Processing: {file_path}")
-
-            # Obtain corresponding audio file
-            audio_file_name = [
-                item
-                for item in audio_files_in_directory
-                if json_file_path.stem.replace(" - large-v2 - SR", "") in item.name
-            ]
-
-            # Your processing code here
-
-            file_pbar.update(1)
-
-            # Obtain date, time, and audio duration information from base filename
-            (
-                file_calendar_start_datetime,
-                file_calendar_start_datetime_str,
-                file_calendar_end_datetime,
-                file_calendar_start_datetime_str,
-                file_calendar_start_date,
-                file_calendar_start_time,
-                file_calendar_end_date,
-                file_calendar_end_time,
-                file_total_duration_in_seconds,
-            ) = extract_date_time_from_json_filename(file_path)
-
-            # Convert total duration from seconds to hours, minutes, seconds
-            file_duration_hours, remainder = divmod(
-                int(file_total_duration_in_seconds), 3600
+    mp_context = multiprocessing.get_context(start_method)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(
+            dict_of_active_models,
+            analysis_config,
+            labels,
+            questions,
+            idiolect,
+            active_model_configs,
+            mp_context.Value("i", 0),
+        ),
+    ) as executor:
+        futures = [
+            executor.submit(
+                process_one_file,
+                file_path,
+                audio_by_stem.get(cleaned_stems[file_path]),
             )
-            file_duration_minutes, file_duration_seconds = divmod(remainder, 60)
-            tmp_file_chunk_tags = []
-            tmp_file_keyphrases = []
-            #####################################################################################################################################
-
-            # Create chunks
-            chunks = create_chunk_data(file_path)
-
-            all_chunk_details = []
-            chunk_details = {}
-
-            chunk_pbar = tqdm(total=len(chunks), position=1, unit="chunk", leave=False)
-
-            # Start processing each chunk
-            for chunk in chunks:
-                chunk_calendar_start_datetime = chunk["transcription_time_data"][
-                    "chunk_calendar_start_datetime"
-                ]
-                chunk_calendar_end_datetime = chunk["transcription_time_data"][
-                    "chunk_calendar_end_datetime"
-                ]
-                chunk_text = chunk["chunk_text"]
-                #####################################################################################################################################
-                ai_model_results = generate_ai_model_results(
-                    chunk_text,
-                    active_model_configs,
-                    active_models,
-                    labels,
-                    questions,
-                    idiolect,
-                    chunk_calendar_start_datetime,
-                )
-                #####################################################################################################################################
-
-                chunk_transits = calculate_chunk_transits(
-                    chunk_calendar_start_datetime,
-                    analysis_config.astrology_variables.planet_and_aspect_orb,
-                )
-
-                chunk_profections = calculate_current_profections(
-                    chunk_calendar_start_datetime, analysis_config.astrology_variables
-                )
-
-                chunk_zrs_data = generate_zrs_data(
-                    analysis_config.astrology_variables.pos_file,
-                    analysis_config.astrology_variables.pof_file,
-                    chunk_calendar_start_datetime,
-                )
-                #####################################################################################################################################
-                # Update the chunk_tags list with a sorted, unique list of tags from the QnA responses
-                updated_chunk_tags = generate_chunk_tags(
-                    chunk,
-                    ai_model_results,
-                    model_name="knowledgator/gliner-multitask-large-v0.5",
-                    model_key="qna",
-                    chunk_key="chunk_tags",
-                )
-                chunk["chunk_tags"] = updated_chunk_tags
-                tmp_file_chunk_tags.append(updated_chunk_tags)
-                #####################################################################################################################################
-                # Update the chunk_keyphrases with keyphrases returned by the model
-                updated_chunk_keyphrases = generate_chunk_tags(
-                    chunk,
-                    ai_model_results,
-                    model_name="ml6team/keyphrase-extraction-kbir-inspec",
-                    model_key=None,
-                    chunk_key="chunk_keyphrases",
-                )
-                # print(updated_chunk_keyphrases)
-                # input("\n\nHERE\n\n")
-                chunk["chunk_keyphrases"] = updated_chunk_keyphrases
-                tmp_file_keyphrases.append(updated_chunk_keyphrases)
-                ####################################################################################################################################
-
-                ####################################################################################################################################
-
-                # Adjust the time we will use as the start time for the chunk within the audio file
-                adjusted_chunk_audio_start_time_location = (
-                    float(
-                        chunk["transcription_time_data"][
-                            "chunk_audio_start_time_location"
-                        ]
-                    )
-                    - 1
-                )
-
-                # Adjust the time we will use as the end time for the chunk within the audio file
-                adjusted_chunk_audio_end_time_location = (
-                    float(
-                        chunk["transcription_time_data"][
-                            "chunk_audio_end_time_location"
-                        ]
-                    )
-                    + 1
-                )
-
-                # This is most likely the first chunk, and if the start time is less than 1 second, we might
-                # as well start from the very beginning of the audio file.
-                if adjusted_chunk_audio_start_time_location < 1:
-                    adjusted_chunk_audio_start_time_location = 0.00
-
-                # Calculate the adjusted chunk duration
-                # We will use this in the filname for the chunk audio file
-                chunk_duration = int(
-                    adjusted_chunk_audio_end_time_location
-                    - adjusted_chunk_audio_start_time_location
-                )
-
-                chunk_audio_file_name = f"{audio_file_name[0].stem} - chunk - {chunk["chunk_id"]:0{4}} of {len(chunks):0{4}} - {chunk_duration}{audio_file_name[0].suffix}"
-                chunk_json_file_name = f"{audio_file_name[0].stem} - chunk - {chunk["chunk_id"]:0{4}} of {len(chunks):0{4}} - {chunk_duration}.json"
-
-                chunk_source_file_data = {
-                    "source_audio_file_name": audio_file_name[0].name,
-                    "source_json_file_name": json_file_path.name,
-                    "chunk_audio_file_name": chunk_audio_file_name,
-                    "total_number_of_chunks": len(chunks),
-                }
-
-                updated_chunk = insert_keys(
-                    chunk, insert_after_key="chunk_id", new_items=chunk_source_file_data
-                )
-
-                # Parse string to datetime
-                chunk_calendar_start_datetime_dt = datetime.fromisoformat(
-                    chunk_calendar_start_datetime
-                )
-                chunk_calendar_end_datetime_dt = datetime.fromisoformat(
-                    chunk_calendar_end_datetime
-                )
-
-                ####################################################################################################################################
-                # Adjust times
-                adjusted_chunk_calendar_start_datetime = (
-                    chunk_calendar_start_datetime_dt + timedelta(seconds=-1)
-                )
-                adjusted_chunk_calendar_end_datetime = (
-                    chunk_calendar_end_datetime_dt + timedelta(seconds=1)
-                )
-
-                adjusted_chunk_duration = calculate_duration(
-                    adjusted_chunk_calendar_start_datetime,
-                    adjusted_chunk_calendar_end_datetime,
-                    key_prefix="adjusted",
-                )
-
-                adjusted_chunk_time_data = {
-                    "adjusted_chunk_time_data": {
-                        "adjusted_chunk_audio_start_time_location": adjusted_chunk_audio_start_time_location,
-                        "adjusted_chunk_calendar_start_datetime": adjusted_chunk_calendar_start_datetime.isoformat(),
-                        "adjusted_chunk_audio_end_time_location": adjusted_chunk_audio_end_time_location,
-                        "adjusted_chunk_calendar_end_datetime": adjusted_chunk_calendar_end_datetime.isoformat(),
-                        **adjusted_chunk_duration,
-                    }
-                }
-
-                updated_chunk = insert_keys(
-                    updated_chunk,
-                    insert_after_key="transcription_time_data",
-                    new_items=adjusted_chunk_time_data,
-                )
-                ####################################################################################################################################
-
-                ####################################################################################################################################
-                # The dictionary that contains all of the data regarding the analysis of a chunk
-                chunk_details = {
-                    # **chunk,
-                    **updated_chunk,
-                    "chunk_analysis": {
-                        **ai_model_results,
-                        **chunk_transits,
-                        **chunk_profections,
-                        **chunk_zrs_data,
-                    },
-                }
-                #####################################################################################################################################
-                all_chunk_details.append(chunk_details)
-
-                chunk_pbar.close()
-                #####################################################################################################################################
-            file_pbar.update()
-            #####################################################################################################################################
-
-            # Flatten the list of lists and deduplicate
-            file_all_chunk_tags = sorted(
-                set(tag for sublist in tmp_file_chunk_tags for tag in sublist)
-            )
-
-            file_all_keyphrases = sorted(
-                set(
-                    keyphrase
-                    for sublist in tmp_file_keyphrases
-                    for keyphrase in sublist
-                )
-            )
-
-            file_chunk_root = generate_chunk_root(all_chunk_details)
-
-            file_time_data = {
-                "file_time_data": {
-                    "file_calendar_start_datetime": file_calendar_start_datetime,
-                    "file_calendar_start_date": file_calendar_start_date,
-                    "file_calendar_start_time": file_calendar_start_time,
-                    "file_calendar_end_datetime": file_calendar_start_datetime,
-                    "file_calendar_end_date": file_calendar_end_date,
-                    "file_calendar_end_time": file_calendar_end_time,
-                    "file_duration_hours": file_duration_hours,
-                    "file_duration_minutes": file_duration_minutes,
-                    "file_duration_seconds": file_duration_seconds,
-                    "file_total_duration_in_seconds": file_total_duration_in_seconds,
-                }
-            }
-
-            audio_file_metadata, original_meta_data = generate_audio_metadata(audio_file_name[0])
-
-            # The dictionary that makes up the metadata file for each audio journal analusr
-            file_contents = {
-                "original_trasncript_filename": file_name,
-                # "source_audio_file_name": audio_file_name[0].name,
-                **audio_file_metadata,
-                **file_time_data,
-                "file_all_chunk_tags": file_all_chunk_tags,
-                "file_all_keyphrases": file_all_keyphrases,
-                "file_chunk_root": file_chunk_root,
-                "chunks": all_chunk_details,
-            }
-            #####################################################################################################################################
-            # Adding a time stamp suffix for texting purposes; this will need to be removed in production
-            file_name_suffix = datetime.now().strftime("%Y-%m-%d - %H-%M-%S")
-
-            # Construct the full output file path and file name
-            output_file_path = (
-                analysis_output_directory
-                / f"{Path(file_name).stem} - analysis_{file_name_suffix}.json"
-            )
-
-            # Ensure the folder exists
-            os.makedirs(analysis_output_directory, exist_ok=True)
-
-            # Write the file_content dictionary to as a JSON object
-            with open(output_file_path, "w", encoding="utf-8") as file:
-                file.write(json.dumps(file_contents, indent=4))
+            for json_files in json_by_dir.values()
+            for file_path in json_files
+        ]
 
-            logger.info(f"Analysis written to: {output_file_path}\n")
-            #####################################################################################################################################
-        file_pbar.close()
+        with tqdm(
+            total=total_files, position=0, desc="Processing Files", unit="file"
+        ) as file_pbar:
+            for future in as_completed(futures):
+                future.result()
+                file_pbar.update(1)
 #####################################################################################################################################
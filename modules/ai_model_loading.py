@@ -1,30 +1,97 @@
 #####################################################################################################################################
 # NATIVE MODULES
 import gc
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-import spacy
+#####################################################################################################################################
+# Must be set before the first CUDA allocation. Expandable segments let the blocks freed by one model
+# be reused by the next instead of fragmenting the reserved pool while models are loaded one by one.
+os.environ.setdefault(
+    "PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:128"
+)
 
 #####################################################################################################################################
 # AI SPECIFIC MODULES
 import torch
-from gliclass import GLiClassModel, ZeroShotClassificationPipeline
-from gliner import GLiNER
+
+# Let the fp32 matmuls left after half-precision loading (fp32 checkpoints, GLiNER heads) run on
+# TF32 tensor cores on Ampere and newer GPUs; this has no effect on the CPU
+torch.set_float32_matmul_precision("high")
+
+# spacy, gliclass, and gliner are imported on first use (see get_spacy / get_gliclass / get_gliner)
 
 #####################################################################################################################################
 # HELPER MODULES
+from loguru import logger
 from tqdm.auto import tqdm
 from transformers import (
+    AutoConfig,
     AutoModelForQuestionAnswering,
     AutoModelForSequenceClassification,
     AutoModelForTokenClassification,
     AutoTokenizer,
+    BitsAndBytesConfig,
+    TokenClassificationPipeline,
     pipeline,
 )
+from transformers.pipelines import AggregationStrategy
 
-# import datetime
+import numpy as np
 
+# import datetime
 
-# import numpy as np
+#####################################################################################################################################
+# PROJECT SPECIFIC MODULES
+from .project_paths import PATHS
+
+# Load weights in half precision when they are headed for the GPU (their stored dtype otherwise),
+# and skip the extra fp32 copy made during init
+PRETRAINED_LOAD_KWARGS = {
+    "torch_dtype": torch.float16 if torch.cuda.is_available() else "auto",
+    "low_cpu_mem_usage": True,
+}
+
+# Set HF_HUB_OFFLINE=1 to never contact the Hugging Face Hub (everything must already be cached)
+HF_HUB_OFFLINE = os.environ.get("HF_HUB_OFFLINE", "").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+
+# model_type -> (transformers model class, needs a tokenizer) for the types that load a plain
+# transformers checkpoint; the remaining types are built by hand in load_model_on_cpu
+TRANSFORMERS_LOADERS = {
+    "sequence_classification": (AutoModelForSequenceClassification, True),
+    "token_classification": (AutoModelForTokenClassification, True),
+    "question-answering": (AutoModelForQuestionAnswering, True),
+    "keyphrase-extraction": (AutoModelForTokenClassification, True),
+    "zero_shot_classification": (AutoModelForSequenceClassification, True),
+}
+
+# Model types that can run as a quantized ONNX Runtime model on the CPU (onnx_int8 = "yes")
+ONNX_INT8_MODEL_TYPES = {
+    "sequence_classification",
+    "token_classification",
+    "keyphrase-extraction",
+}
+
+# Model types whose inference (sequence_classifier / token_classifier in ai_models_output) runs through
+# the make_predict forward pass, and so through its pinned input buffers on the GPU
+STAGED_INPUT_MODEL_TYPES = {
+    "sequence_classification",
+    "token_classification",
+}
+
+# Inputs per forward pass for Hugging Face pipelines when a model config has no batch_size
+DEFAULT_PIPELINE_BATCH_SIZE = 16
+
+# A model is only moved to the GPU if this multiple of its weight size still fits in free GPU memory;
+# the headroom covers activations and allocator overhead
+GPU_MEMORY_SAFETY_MARGIN = 1.2
 
 
 #####################################################################################################################################
@@ -32,9 +99,8 @@ def get_model_memory_usage(model):
     """
     Calculates the total memory usage of a PyTorch model in bytes.
 
-    This function iterates over all parameters of the given model and computes
-    the total memory usage by multiplying the number of elements by the size of
-    each element in bytes.
+    This function sums the storage size of all parameters and buffers of the given model,
+    counting storages shared between tensors (e.g., tied embeddings) only once.
 
     Args:
         model (torch.nn.Module): The PyTorch model whose memory usage is being calculated.
@@ -43,12 +109,27 @@ def get_model_memory_usage(model):
         int: The total memory usage of the model in bytes.
 
     Side Effects:
-        None
+        - Caches the result on the model as `model._chimera_mem_bytes`.
+
+    Notes:
+        - Moving a model between devices keeps its size, so the cached value stays valid across `.to(device)`;
+          a dtype change (e.g., `.half()`) does not, so measure after any dtype conversion.
     """
+    cached_memory = getattr(model, "_chimera_mem_bytes", None)
+    if cached_memory is not None:
+        return cached_memory
 
+    seen_storages = set()
     total_memory = 0
-    for param in model.parameters():
-        total_memory += param.numel() * param.element_size()
+    for tensor in itertools.chain(model.parameters(), model.buffers()):
+        storage = tensor.untyped_storage()
+        storage_key = (storage.device, storage.data_ptr())
+        if storage_key in seen_storages:
+            continue
+        seen_storages.add(storage_key)
+        total_memory += storage.nbytes()
+
+    model._chimera_mem_bytes = total_memory
     return total_memory
 
 
@@ -56,15 +137,18 @@ def get_model_memory_usage(model):
 
 
 #####################################################################################################################################
-def get_gpu_memory():
+def get_gpu_memory(device_index=None):
     """
     Retrieves the available and total GPU memory in megabytes.
 
     This function checks for the availability of a CUDA-enabled GPU and, if available,
-    queries memory usage statistics for device index 0. It calculates free memory as the
+    queries memory usage statistics for the given device. It calculates free memory as the
     difference between total memory and the sum of reserved and allocated memory. Values
     are returned in megabytes (MB).
 
+    Args:
+        device_index (int, optional): The CUDA device to query. Defaults to `torch.cuda.current_device()`.
+
     Returns:
         tuple[float, float]: A tuple containing:
             - free_memory_mb (float): The estimated free GPU memory in MB.
@@ -75,8 +159,8 @@ def get_gpu_memory():
         None
 
     Notes:
-        - This function only queries the first GPU (`device index 0`). Systems with multiple GPUs
-          will require modification to handle other devices.
+        - The queries run inside `torch.cuda.device(device_index)`, so no context is created on
+          cuda:0 when a different GPU is targeted.
         - The reported "free memory" is an approximation. CUDA memory management uses reserved
           memory blocks, so `free = total - (reserved + allocated)` may not reflect actual usable memory.
         - Requires PyTorch with CUDA support and a compatible GPU driver.
@@ -86,9 +170,13 @@ def get_gpu_memory():
         None
     """
     if torch.cuda.is_available():
-        total_memory = torch.cuda.get_device_properties(0).total_memory
-        reserved_memory = torch.cuda.memory_reserved(0)
-        allocated_memory = torch.cuda.memory_allocated(0)
+        if device_index is None:
+            device_index = torch.cuda.current_device()
+
+        with torch.cuda.device(device_index):
+            total_memory = torch.cuda.get_device_properties(device_index).total_memory
+            reserved_memory = torch.cuda.memory_reserved(device_index)
+            allocated_memory = torch.cuda.memory_allocated(device_index)
         free_memory = total_memory - (reserved_memory + allocated_memory)
         return free_memory / (1024**2), total_memory / (1024**2)  # Return in MB
     return 0, 0
@@ -121,20 +209,42 @@ def load_model_to_device(model, device):
 
     Side Effects:
         May move the model's parameters and buffers in-place to the specified device if it is a PyTorch model.
+        PyTorch models are also put in eval mode with `requires_grad` turned off for every parameter.
 
     Notes:
         - The function only attempts memory usage estimation for PyTorch models (`torch.nn.Module`).
         - Models not supporting the `.to()` method will be returned unchanged without warning.
-        - The memory usage estimation is based on parameter size only and does not include temporary tensors
-          or intermediate activations.
+        - The memory usage estimation is based on parameter and buffer sizes and does not include temporary
+          tensors or intermediate activations.
         - If the model is already on the target device, no actual memory transfer is performed.
+        - fp16 models placed on the CPU are upcast to fp32.
+        - bitsandbytes int8 models are left where they were loaded (on the GPU).
 
     Raises:
         None
     """
     # Only PyTorch models support the .to() method
     if isinstance(model, torch.nn.Module):
-        model = model.to(device)
+        if getattr(model, "is_loaded_in_8bit", False):
+            # bitsandbytes int8 models are placed on the GPU while loading and cannot be moved
+            pass
+        elif torch.device(device).type == "cuda":
+            # Make the target GPU current so the copy does not touch cuda:0
+            with torch.cuda.device(device):
+                model = model.to(device)
+        else:
+            model = model.to(device)
+
+            # Half precision is only meant for the GPU; many CPU kernels are slow or missing for fp16
+            first_param = next(model.parameters(), None)
+            if first_param is not None and first_param.dtype == torch.float16:
+                model = model.float()
+                model.__dict__.pop("_chimera_mem_bytes", None)  # size doubled
+
+        # Inference only: switch off dropout / batch-norm updates and autograd tracking once, here
+        model.eval()
+        model.requires_grad_(False)
+
         memory_usage_bytes = get_model_memory_usage(model)
         memory_usage_mb = memory_usage_bytes / (1024**2)  # Convert to MB
         return model, memory_usage_mb
@@ -146,6 +256,731 @@ def load_model_to_device(model, device):
 #####################################################################################################################################
 
 
+#####################################################################################################################################
+def choose_model_device(model_name, model, model_device, gpu_free_memory):
+    """
+    Pre-flight check that picks the device a model loaded on the CPU is placed on.
+
+    Args:
+        model_name (str): The model name, used for logging.
+        model (torch.nn.Module): The model, still on the CPU (bitsandbytes int8 models are already on the GPU).
+        model_device (str): The preferred device (`"cuda"` or `"cpu"`).
+        gpu_free_memory (float): The GPU memory (MB) not yet claimed by the models placed so far.
+
+    Returns:
+        str: `model_device`, or `"cpu"` when the model's size times `GPU_MEMORY_SAFETY_MARGIN` does not fit
+            in `gpu_free_memory`.
+
+    Notes:
+        - The weights are measured where they are, so a model that does not fit is never moved to the GPU
+          and copied back.
+        - bitsandbytes int8 models were quantized straight onto the GPU and stay there.
+    """
+    model_memory_usage = get_model_memory_usage(model) / (1024**2)
+    if (
+        model_device == "cuda"
+        and not getattr(model, "is_loaded_in_8bit", False)
+        and model_memory_usage * GPU_MEMORY_SAFETY_MARGIN > gpu_free_memory
+    ):
+        logger.info(
+            f"{model_name} ({model_memory_usage:.0f} MB) does not fit in the free GPU memory; using the CPU"
+        )
+        return "cpu"
+
+    return model_device
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def load_onnx_int8_model(model_name, model_type):
+    """
+    Loads a sequence or token classification model as a dynamically quantized (INT8) ONNX Runtime model.
+
+    The model is exported to ONNX and quantized the first time it is requested; the quantized model is
+    cached under `PATHS.output_model_cache` so later runs load it directly.
+
+    Args:
+        model_name (str): The Hugging Face model name (e.g., "ml6team/keyphrase-extraction-kbir-inspec").
+        model_type (str): The config model type; one of `ONNX_INT8_MODEL_TYPES`.
+
+    Returns:
+        ORTModelForTokenClassification | ORTModelForSequenceClassification: The quantized ONNX Runtime model.
+
+    Side Effects:
+        - Writes the quantized model and its config to `PATHS.output_model_cache / <model_name>`.
+
+    Notes:
+        - Requires the optional `optimum[onnxruntime]` package.
+        - Uses the AVX512-VNNI dynamic quantization config, which targets the int8 dot-product
+          instructions on modern Xeon/Ryzen CPUs; ONNX Runtime falls back to generic kernels elsewhere.
+        - ONNX Runtime fuses the attention and GELU blocks into single int8 ops, which is usually faster on
+          the CPU than PyTorch dynamic quantization (`quantize_for_cpu`).
+        - The returned model takes the same `**inputs` as the PyTorch model and returns torch logits, so
+          `sequence_classifier` / `token_classifier` use it unchanged.
+
+    Raises:
+        ImportError: If `optimum[onnxruntime]` is not installed.
+    """
+    from optimum.onnxruntime import (
+        ORTModelForSequenceClassification,
+        ORTModelForTokenClassification,
+        ORTQuantizer,
+    )
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    ort_model_class = (
+        ORTModelForSequenceClassification
+        if model_type == "sequence_classification"
+        else ORTModelForTokenClassification
+    )
+
+    cache_dir = PATHS.output_model_cache / model_name.replace("/", "__")
+    quantized_file_name = "model_quantized.onnx"
+
+    if not (cache_dir / quantized_file_name).exists():
+        logger.info(f"Exporting {model_name} to ONNX (INT8); this only happens once")
+        ort_model = ort_model_class.from_pretrained(model_name, export=True)
+        quantizer = ORTQuantizer.from_pretrained(ort_model)
+        quantization_config = AutoQuantizationConfig.avx512_vnni(
+            is_static=False, per_channel=False
+        )
+        quantizer.quantize(save_dir=cache_dir, quantization_config=quantization_config)
+
+    return ort_model_class.from_pretrained(cache_dir, file_name=quantized_file_name)
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+# The spaCy / GLiClass / GLiNER packages are slow to import, so they are only imported once a
+# config actually asks for one of their model types. lru_cache makes each import happen once.
+@lru_cache(maxsize=None)
+def get_spacy():
+    import spacy
+
+    return spacy
+
+
+@lru_cache(maxsize=None)
+def get_gliclass():
+    from gliclass import GLiClassModel, ZeroShotClassificationPipeline
+
+    return GLiClassModel, ZeroShotClassificationPipeline
+
+
+@lru_cache(maxsize=None)
+def get_gliner():
+    from gliner import GLiNER
+
+    return GLiNER
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def from_pretrained_local_first(model_class, model_name, **kwargs):
+    """
+    Loads a Hugging Face model or tokenizer from the local cache, only going to the Hub when it is not cached.
+
+    Args:
+        model_class (type): The class whose `from_pretrained` is called (e.g., `AutoTokenizer`).
+        model_name (str): The Hugging Face model name.
+        **kwargs: Passed through to `from_pretrained`.
+
+    Returns:
+        Any: The loaded model or tokenizer.
+
+    Notes:
+        - A plain `from_pretrained` sends a request to the Hub for every file even when the model is cached;
+          trying `local_files_only=True` first skips those round trips at startup.
+        - When `HF_HUB_OFFLINE` is set, the Hub is never contacted.
+        - Safetensors checkpoints are preferred (and memory-mapped) by `from_pretrained` whenever a model
+          has them; models that only ship `pytorch_model.bin` still load.
+
+    Raises:
+        OSError: If the model is not cached and cannot be downloaded (or `HF_HUB_OFFLINE` is set).
+    """
+    try:
+        return model_class.from_pretrained(
+            model_name, local_files_only=True, **kwargs
+        )
+    except OSError:
+        if HF_HUB_OFFLINE:
+            raise
+        return model_class.from_pretrained(model_name, **kwargs)
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+@lru_cache(maxsize=None)
+def get_tokenizer(model_name):
+    """
+    Loads the fast (Rust-backed) tokenizer for a model, once per model name.
+
+    Args:
+        model_name (str): The Hugging Face model name.
+
+    Returns:
+        PreTrainedTokenizerFast: The tokenizer for `model_name`.
+
+    Notes:
+        - Results are cached for the life of the process, so a model name listed under several
+          model types only parses its tokenizer files once.
+        - `use_fast=True` falls back to the Python tokenizer when a model has no fast version.
+    """
+    return from_pretrained_local_first(AutoTokenizer, model_name, use_fast=True)
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def allocate_input_buffers(tokenizer, batch_size):
+    """
+    Pre-allocates pinned host buffers used to stage tokenizer output before it is copied to the GPU.
+
+    Args:
+        tokenizer (PreTrainedTokenizerBase | None): The model's tokenizer; its `model_max_length` sizes the buffers.
+        batch_size (int): The largest number of sequences expected per forward pass.
+
+    Returns:
+        dict[str, torch.Tensor]: Flat, pinned int64 buffers for "input_ids", "attention_mask", and
+            "token_type_ids", each holding `batch_size * max_seq_len` elements.
+
+    Notes:
+        - `max_seq_len` is capped at 512, since many tokenizers report a huge sentinel value.
+        - The buffers are flat so any (batch, seq) shape up to their capacity is a contiguous view.
+    """
+    max_seq_len = min(getattr(tokenizer, "model_max_length", 512) or 512, 512)
+    return {
+        key: torch.empty(batch_size * max_seq_len, dtype=torch.long, pin_memory=True)
+        for key in ("input_ids", "attention_mask", "token_type_ids")
+    }
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def quantize_for_cpu(model, config):
+    """
+    Applies PyTorch dynamic int8 quantization to a CPU-placed transformers model whose config sets `quantization = "int8"`.
+
+    Args:
+        model (torch.nn.Module): The model, already placed on the CPU and in eval mode.
+        config (dict): The model's configuration dictionary.
+
+    Returns:
+        torch.nn.Module: The quantized model, or `model` unchanged when quantization is off or not possible.
+
+    Notes:
+        - Only the `nn.Linear` layers are quantized; their weights are stored as int8 and the matmuls run on the
+          FBGEMM / oneDNN int8 kernels. Activations are quantized on the fly, so no calibration data is needed.
+        - On a GPU the same "int8" setting is handled by bitsandbytes at load time (see `pretrained_load_kwargs`).
+        - Only the Hugging Face model types in `TRANSFORMERS_LOADERS` are quantized; GLiNER / GLiClass use
+          custom forward passes and are left as they are.
+        - Scores can differ slightly from the fp32 model.
+    """
+    if (
+        (config.get("quantization") or "").strip().lower() != "int8"
+        or config.get("model_type", "") not in TRANSFORMERS_LOADERS
+    ):
+        return model
+
+    try:
+        model = torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    except (RuntimeError, AssertionError) as error:
+        logger.warning(
+            f"Dynamic int8 quantization failed for {config.get('model_name', '')}; using fp32: {error}"
+        )
+        return model
+
+    model.__dict__.pop("_chimera_mem_bytes", None)  # weights shrank
+    return model
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def compile_model(model, device, config):
+    """
+    Compiles a GPU-placed model with `torch.compile` when its config opts in with `torch_compile = "yes"`.
+
+    Args:
+        model (torch.nn.Module): The model, already placed on `device` and in eval mode.
+        device (str): The device the model lives on (`"cuda"` or `"cpu"`).
+        config (dict): The model's configuration dictionary.
+
+    Returns:
+        torch.nn.Module: The compiled model, or `model` unchanged when compilation is off or not possible.
+
+    Notes:
+        - Uses `mode="reduce-overhead"`, which captures CUDA graphs to remove per-call kernel launch overhead.
+          The first calls (and every new input shape) pay a one-time compile cost.
+        - Only CUDA models are compiled; bitsandbytes int8 models are skipped.
+        - The returned module is only used for the forward pass; the original model is still stored under
+          "model" so attributes such as `model.config` keep working.
+    """
+    if (
+        (config.get("torch_compile") or "").strip().lower() != "yes"
+        or device != "cuda"
+        or not hasattr(torch, "compile")
+        or getattr(model, "is_loaded_in_8bit", False)
+    ):
+        return model
+
+    return torch.compile(model, mode="reduce-overhead", fullgraph=False)
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def make_predict(model, device, input_buffers=None):
+    """
+    Builds the forward-pass callable stored as a PyTorch model's "pipeline".
+
+    Args:
+        model (torch.nn.Module): The model to run.
+        device (str): The device the model lives on (`"cuda"` or `"cpu"`).
+        input_buffers (dict[str, torch.Tensor], optional): Pinned staging buffers from `allocate_input_buffers`.
+            Only used on CUDA. Defaults to None (buffers are allocated on first use).
+
+    Returns:
+        Callable[[dict], Any]: A function that moves a dict of input tensors to `device`
+            and returns the model outputs.
+
+    Notes:
+        - `model` and `device` are bound when the callable is built. A closure defined inside the
+          `load_models` loop would instead see whichever model the loop variables held last.
+        - On CUDA, CPU inputs are copied into the pinned staging buffers (grown when an input does not fit)
+          and sent to the GPU with `non_blocking=True`, so no pinned memory is allocated per call.
+        - Runs under `torch.inference_mode()`.
+    """
+    if device == "cuda":
+        staging_buffers = {} if input_buffers is None else input_buffers
+        copies_done = torch.cuda.Event()
+
+        def model_predict(inputs):
+            # The previous call's asynchronous copies must finish reading the buffers before they are reused
+            copies_done.synchronize()
+
+            device_inputs = {}
+            for k, v in inputs.items():
+                if v.device.type != "cpu":
+                    device_inputs[k] = v.to(device, non_blocking=True)
+                    continue
+
+                buffer = staging_buffers.get(k)
+                if (
+                    buffer is None
+                    or buffer.dtype != v.dtype
+                    or buffer.numel() < v.numel()
+                ):
+                    buffer = torch.empty(v.numel(), dtype=v.dtype, pin_memory=True)
+                    staging_buffers[k] = buffer
+
+                pinned = buffer[: v.numel()].view(v.shape)
+                pinned.copy_(v)
+                device_inputs[k] = pinned.to(device, non_blocking=True)
+            copies_done.record()
+
+            with torch.inference_mode():
+                return model(**device_inputs)
+
+    else:
+
+        def model_predict(inputs):
+            inputs = {k: v.to(device) for k, v in inputs.items()}
+            with torch.inference_mode():
+                return model(**inputs)
+
+    return model_predict
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def zero_shot_batch(
+    model,
+    tokenizer,
+    device,
+    batch_size=DEFAULT_PIPELINE_BATCH_SIZE,
+    hypothesis_template="This example is {}.",
+):
+    """
+    Builds a batched zero-shot classifier from an NLI sequence classification model.
+
+    The (text, label) premise/hypothesis pairs are tokenized with `padding="longest"` and scored `batch_size`
+    pairs per forward pass, instead of one pair at a time as the Hugging Face zero-shot pipeline does.
+
+    Args:
+        model (torch.nn.Module): An NLI model (e.g., one fine-tuned on MNLI) already placed on `device`.
+        tokenizer (PreTrainedTokenizerBase): The tokenizer for `model`.
+        device (str): The device the model lives on (`"cuda"` or `"cpu"`).
+        batch_size (int, optional): The number of premise/hypothesis pairs per forward pass.
+            Defaults to `DEFAULT_PIPELINE_BATCH_SIZE`.
+        hypothesis_template (str, optional): The hypothesis each candidate label is formatted into.
+            Defaults to "This example is {}.".
+
+    Returns:
+        Callable[[str | list[str], list[str]], dict | list[dict]]: A function called like the zero-shot
+            pipeline, `classify(texts, candidate_labels)`. For each text it returns a dict with "sequence",
+            "labels", and "scores", sorted by descending score; a single dict when `texts` is a string.
+
+    Notes:
+        - Scores are the softmax of the entailment logits across the candidate labels (single-label mode).
+        - Every text is paired with every label, so a batch of chunks against a large label file yields
+          thousands of pairs; slicing them keeps the activations of one forward pass bounded.
+        - The entailment class is read from `model.config.label2id`; the last class is used if none is named "entail*".
+    """
+    entailment_id = next(
+        (
+            label_id
+            for label, label_id in model.config.label2id.items()
+            if label.lower().startswith("entail")
+        ),
+        -1,
+    )
+
+    def zero_shot_classify(texts, candidate_labels):
+        single_text = isinstance(texts, str)
+        if single_text:
+            texts = [texts]
+
+        hypotheses = [hypothesis_template.format(label) for label in candidate_labels]
+        premises = [text for text in texts for _ in candidate_labels]
+        hypotheses = hypotheses * len(texts)
+
+        entailment_logits = []
+        for start in range(0, len(premises), batch_size):
+            inputs = tokenizer(
+                premises[start : start + batch_size],
+                hypotheses[start : start + batch_size],
+                padding="longest",
+                truncation="only_first",
+                return_tensors="pt",
+            )
+            inputs = {k: v.to(device) for k, v in inputs.items()}
+
+            with torch.inference_mode():
+                entailment_logits.append(model(**inputs).logits[:, entailment_id])
+
+        logits = torch.cat(entailment_logits)
+        scores = (
+            logits.float().view(len(texts), len(candidate_labels)).softmax(dim=-1)
+        ).tolist()
+
+        results = []
+        for text, text_scores in zip(texts, scores):
+            ranked = sorted(
+                zip(candidate_labels, text_scores), key=lambda x: x[1], reverse=True
+            )
+            results.append(
+                {
+                    "sequence": text,
+                    "labels": [label for label, _ in ranked],
+                    "scores": [score for _, score in ranked],
+                }
+            )
+
+        return results[0] if single_text else results
+
+    return zero_shot_classify
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def estimate_model_parameters(config):
+    """
+    Estimates a model's parameter count from its Hugging Face `config.json`, without loading any weights.
+
+    Args:
+        config (dict): A model configuration dictionary with at least "model_name" and "model_host".
+
+    Returns:
+        int: The estimated number of parameters, or 0 if the model is not local or has no
+            transformers-style config (e.g., spaCy and GLiNER models).
+
+    Notes:
+        - Uses the encoder estimate `vocab * hidden + layers * (4 * hidden^2 + 2 * hidden * intermediate)`;
+          it is only meant for ordering models by size, not for memory accounting.
+    """
+    if config.get("model_host", "") != "local":
+        return 0
+
+    try:
+        model_config = from_pretrained_local_first(
+            AutoConfig, config.get("model_name", "")
+        )
+    except (OSError, ValueError):
+        return 0
+
+    hidden_size = getattr(model_config, "hidden_size", 0) or 0
+    num_layers = getattr(model_config, "num_hidden_layers", 0) or 0
+    vocab_size = getattr(model_config, "vocab_size", 0) or 0
+    intermediate_size = getattr(model_config, "intermediate_size", 0) or 4 * hidden_size
+
+    return vocab_size * hidden_size + num_layers * (
+        4 * hidden_size**2 + 2 * hidden_size * intermediate_size
+    )
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def pretrained_load_kwargs(config):
+    """
+    Builds the `from_pretrained` keyword arguments for a model, applying its optional "quantization" setting.
+
+    Args:
+        config (dict): A model configuration dictionary; "quantization" may be "int8", "fp16", "bf16", or unset.
+
+    Returns:
+        dict: `PRETRAINED_LOAD_KWARGS`, updated for the requested quantization.
+
+    Notes:
+        - "fp16" loads the weights in half precision even when no GPU is present.
+        - "bf16" loads the weights in bfloat16, which keeps the fp32 exponent range, so models that overflow
+          in fp16 stay stable. It is kept on the CPU too, where recent CPUs have native bf16 matmuls.
+        - "int8" uses bitsandbytes (`BitsAndBytesConfig(load_in_8bit=True)`), which needs CUDA and the optional
+          `bitsandbytes` package. The weights are quantized straight onto the current GPU while loading,
+          so these models skip the CPU-side placement step. Without CUDA the model is loaded unquantized here
+          and `quantize_for_cpu` applies dynamic int8 quantization after placement instead.
+    """
+    quantization = (config.get("quantization") or "").strip().lower()
+    load_kwargs = dict(PRETRAINED_LOAD_KWARGS)
+
+    if quantization == "fp16":
+        load_kwargs["torch_dtype"] = torch.float16
+    elif quantization == "bf16":
+        load_kwargs["torch_dtype"] = torch.bfloat16
+    elif quantization == "int8":
+        if torch.cuda.is_available():
+            load_kwargs["quantization_config"] = BitsAndBytesConfig(load_in_8bit=True)
+            load_kwargs["device_map"] = {"": torch.cuda.current_device()}
+
+    return load_kwargs
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def get_bio_tag_ids(model):
+    """
+    Collects the label ids of a token classification model's BIO "B-" and "I-" tags, and its labels as a list.
+
+    Args:
+        model (PreTrainedModel): A token classification model with `config.id2label`.
+
+    Returns:
+        dict: "b_ids" and "i_ids", each a NumPy array of the label ids whose names start with "B-" / "I-",
+            and "id2label_list", the label names indexed by label id.
+
+    Notes:
+        - Stored with the model so `token_classifier` can group entity spans with NumPy instead of
+          checking every token's label string.
+    """
+    id2label = model.config.id2label
+    return {
+        "id2label_list": [id2label[idx] for idx in range(model.config.num_labels)],
+        "b_ids": np.array(
+            [idx for idx, label in id2label.items() if label.startswith("B-")],
+            dtype=np.int64,
+        ),
+        "i_ids": np.array(
+            [idx for idx, label in id2label.items() if label.startswith("I-")],
+            dtype=np.int64,
+        ),
+    }
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def warm_up_model(model_name, model_predict, tokenizer):
+    """
+    Runs one small dummy batch through a GPU model so its first real inference is not a cold start.
+
+    Args:
+        model_name (str): The model name, used for logging.
+        model_predict (Callable[[dict], Any]): The callable built by `make_predict`.
+        tokenizer (PreTrainedTokenizerBase): The model's tokenizer.
+
+    Returns:
+        bool: True if the dummy forward pass ran, False if it raised.
+
+    Side Effects:
+        - Picks cuDNN algorithms, triggers any `torch.compile` compilation, and leaves activation-sized
+          blocks in the CUDA caching allocator.
+
+    Notes:
+        - A failed warm-up only logs a warning; the model is still used. For a `torch.compile`d model
+          `load_models` falls back to the eager model instead.
+    """
+    try:
+        dummy_inputs = tokenizer(
+            "warmup",
+            return_tensors="pt",
+            padding="max_length",
+            max_length=32,
+            truncation=True,
+        )
+        model_predict(dict(dummy_inputs))
+        torch.cuda.synchronize()
+    except Exception as e:
+        logger.warning(f"Warm-up forward pass failed for {model_name}: {e}")
+        return False
+
+    return True
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def load_model_on_cpu(config):
+    """
+    Loads a single locally hosted model, its tokenizer, and any pipeline it needs into host memory.
+
+    This is the I/O-bound half of model loading (reading weights from disk or downloading them from
+    the Hugging Face Hub). It does not touch the GPU, so several calls can safely run at the same time
+    from a thread pool; device placement is done afterwards, one model at a time, by `load_models`.
+
+    Args:
+        config (dict): A model configuration dictionary with at least "model_name" and "model_type",
+            and optionally "model_pipeline_task", "onnx_int8", "batch_size", "quantization", and
+            "pipe_disable" (spaCy components to switch off).
+
+    Returns:
+        tuple[Any, Any, Any, Any]: A tuple containing:
+            - model: The loaded model object, or None for pipeline-only model types.
+            - tokenizer: The tokenizer associated with the model, if applicable.
+            - model_pipeline: The pipeline built for the model, if the model type needs one.
+            - keyphrase_pipeline: The ONNX keyphrase pipeline, if one was built.
+
+    Notes:
+        - Falls back to TensorFlow weights (`from_tf=True`) when a model has no PyTorch checkpoint.
+        - Hugging Face pipelines are created on the CPU (in fp16 when a GPU is available) and batch
+          `batch_size` inputs per forward pass (default `DEFAULT_PIPELINE_BATCH_SIZE`). `load_models` places
+          their model afterwards, through the same GPU memory check as every other model.
+
+    Raises:
+        OSError: If model loading fails for a reason other than missing PyTorch weights.
+        ValueError: If the config specifies an unsupported `model_type`.
+    """
+    model_name = config.get("model_name", "")
+    model_type = config.get("model_type", "")
+    model_pipeline_task = config.get("model_pipeline_task", "")
+
+    model = None
+    tokenizer = None
+    model_pipeline = None
+    keyphrase_pipeline = None
+
+    load_kwargs = pretrained_load_kwargs(config)
+    pipeline_kwargs = {
+        "device": "cpu",
+        "batch_size": int(config.get("batch_size") or DEFAULT_PIPELINE_BATCH_SIZE),
+        "torch_dtype": torch.float16 if torch.cuda.is_available() else None,
+    }
+
+    try:
+        if model_type in TRANSFORMERS_LOADERS:
+            model_class, needs_tokenizer = TRANSFORMERS_LOADERS[model_type]
+            if needs_tokenizer:
+                tokenizer = get_tokenizer(model_name)
+
+            if (
+                model_type in ONNX_INT8_MODEL_TYPES
+                and (config.get("onnx_int8") or "").strip().lower() == "yes"
+            ):
+                try:
+                    model = load_onnx_int8_model(model_name, model_type)
+                    if model_type == "keyphrase-extraction":
+                        keyphrase_pipeline = TokenClassificationPipeline(
+                            model=model,
+                            tokenizer=tokenizer,
+                            aggregation_strategy=AggregationStrategy.SIMPLE,
+                            framework="pt",
+                        )
+                except ImportError:
+                    logger.warning(
+                        f"optimum[onnxruntime] is not installed; loading {model_name} with PyTorch"
+                    )
+
+            # zero_shot_classification: an NLI model; its batched classifier is built by
+            # load_models once the model is placed
+            if model is None:
+                model = from_pretrained_local_first(
+                    model_class, model_name, **load_kwargs
+                )
+        elif model_type == "gliclass":
+            GLiClassModel, ZeroShotClassificationPipeline = get_gliclass()
+            model = GLiClassModel.from_pretrained(model_name)
+            tokenizer = get_tokenizer(model_name)
+            model_pipeline = ZeroShotClassificationPipeline(
+                model,
+                tokenizer,
+                classification_type="multi-label",
+                progress_bar=False,
+            )
+        elif model_type == "gliner":
+            model = get_gliner().from_pretrained(model_name)
+        elif model_type == "spacy":
+            # Components listed in pipe_disable are loaded but never run
+            model = get_spacy().load(
+                model_name, disable=config.get("pipe_disable") or []
+            )
+        elif model_type == "pipeline":
+            # Reuse the shared tokenizer instead of letting pipeline() parse its own copy;
+            # models without one (e.g., non-text tasks) let pipeline() decide
+            try:
+                tokenizer = get_tokenizer(model_name)
+            except (OSError, ValueError):
+                tokenizer = None
+            model_pipeline = pipeline(
+                model_pipeline_task,
+                model=model_name,
+                tokenizer=tokenizer,
+                **pipeline_kwargs,
+            )
+        else:
+            raise ValueError(f"Unsupported model type: {model_type}")
+
+    except OSError as e:
+        if (
+            "does not appear to have a file named pytorch_model.bin" in str(e)
+            and model_type in TRANSFORMERS_LOADERS
+        ):
+            model_class, needs_tokenizer = TRANSFORMERS_LOADERS[model_type]
+            model = from_pretrained_local_first(model_class, model_name, from_tf=True)
+            if needs_tokenizer:
+                tokenizer = get_tokenizer(model_name)
+        else:
+            raise e
+
+    return model, tokenizer, model_pipeline, keyphrase_pipeline
+
+
+#####################################################################################################################################
+
+
 #####################################################################################################################################
 def load_models(active_model_configs):
     """
@@ -164,19 +999,28 @@ def load_models(active_model_configs):
     Returns:
         dict: A dictionary mapping model names to sub-dictionaries containing the following keys:
             - "model": The loaded model object (or config dict if `model_host` is "server").
+            - "compiled_model": The `torch.compile`d model when its config opted in, else the same object as "model".
             - "tokenizer": The tokenizer associated with the model, if applicable.
             - "pipeline": A callable or pipeline for inference (e.g., `transformers.pipeline`,
               GLiClass pipeline, or a custom wrapper around `model.forward()`).
+            - "keyphrase_pipeline": The keyphrase pipeline (PyTorch or ONNX) of a keyphrase-extraction model.
+            - "input_buffers": The pinned input staging buffers of a GPU-placed model in `STAGED_INPUT_MODEL_TYPES`,
+              else None.
+            - "device": The `torch.device` a PyTorch model was placed on, else None.
+            - "b_ids" / "i_ids" / "id2label_list": The BIO tag label ids and label names of a token
+              classification model (see `get_bio_tag_ids`).
 
     Side Effects:
+        - Reads / downloads the local models concurrently on up to 8 threads (see `load_model_on_cpu`).
         - Allocates GPU memory by loading models to device if available.
         - Caches loaded models in memory to avoid reloading from disk.
         - Prints progress bars to the console via `tqdm`.
-        - Calls `gc.collect()` and `torch.cuda.empty_cache()` to manage memory.
+        - Calls `gc.collect()` and `torch.cuda.empty_cache()` once, after all models are loaded.
 
     Notes:
         - Only models with `"use_model": "yes"` (case-insensitive) in their config are loaded.
-        - Models are loaded to GPU if available, and automatically fall back to CPU if memory is insufficient.
+        - Models are loaded to GPU if available. A model whose size (times `GPU_MEMORY_SAFETY_MARGIN`) does not
+          fit in the remaining GPU memory is kept on the CPU instead.
         - Supported model types include:
             - `"sequence_classification"`
             - `"token_classification"`
@@ -190,8 +1034,8 @@ def load_models(active_model_configs):
         - Server-hosted models are not loaded locally; instead, their config is passed through unchanged.
 
     Caveats:
-        - The function assumes `torch`, `transformers`, `spacy`, and any custom model classes
-          (e.g., `GLiClassModel`, `GLiNER`) are imported and available in the current environment.
+        - The function assumes `torch`, `transformers`, and, for the configs that use them, `spacy`,
+          `gliclass`, and `gliner` are installed; the latter three are only imported when needed.
         - Memory usage estimation is based on parameter size and does not account for runtime tensors.
         - Model loading exceptions are partially caught and handled only for missing PyTorch model files;
           other exceptions are re-raised.
@@ -204,135 +1048,165 @@ def load_models(active_model_configs):
 
     models = {}
     cached_models = {}  # Cache loaded models to avoid reloading from disk
-    gpu_free_memory, gpu_total_memory = get_gpu_memory()
-
-    for config in tqdm(active_model_configs, leave=True):
-        use_model = config.get("use_model", "")
-        if use_model.strip().lower() != "yes":
-            continue  # Skip this model if it's not marked for use
-
-        model_name = config.get("model_name", "")
-        model_type = config.get("model_type", "")
-        model_pipeline_task = config.get("model_pipeline_task", "")
-        model_device = "cuda" if torch.cuda.is_available() else "cpu"
-        model_host = config.get("model_host", "")
-
-        model = None
-        tokenizer = None
-        model_pipeline = None
-        model_memory_usage = 0
-
-        # Check if model is already cached
-        if model_name in cached_models:
-            model, tokenizer, model_pipeline = cached_models[model_name]
-            models[model_name] = {
-                "model": model,
-                "tokenizer": tokenizer,
-                "pipeline": model_pipeline,
-            }
-            continue
-
-        if model_host == "local":
-            try:
-                if model_type == "sequence_classification":
-                    model = AutoModelForSequenceClassification.from_pretrained(
-                        model_name
+    gpu_free_memory, gpu_total_memory = get_gpu_memory(
+        torch.cuda.current_device() if torch.cuda.is_available() else None
+    )
+
+    # Skip any model that is not marked for use
+    active_configs = [
+        config
+        for config in active_model_configs
+        if config.get("use_model", "").strip().lower() == "yes"
+    ]
+
+    # Place the largest models first, so they get contiguous GPU memory before the small ones
+    # fragment it; sorted() is stable, so equally sized (or unknown) models keep config order
+    placement_order = sorted(
+        active_configs, key=estimate_model_parameters, reverse=True
+    )
+
+    # One CPU-side load per unique local model; the first config for a model name wins
+    local_configs = {}
+    for config in placement_order:
+        if config.get("model_host", "") == "local":
+            local_configs.setdefault(config.get("model_name", ""), config)
+
+    # Phase 1: read / download every local model concurrently; this is I/O bound.
+    # Phase 2 (the loop below): place the models on a device one at a time, largest first,
+    # so the GPU memory accounting stays serial while later loads are still running
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(8, len(local_configs)))
+    ) as executor:
+        cpu_loads = {
+            model_name: executor.submit(load_model_on_cpu, config)
+            for model_name, config in local_configs.items()
+        }
+
+        for config in tqdm(placement_order, leave=True):
+            model_name = config.get("model_name", "")
+            model_device = "cuda" if torch.cuda.is_available() else "cpu"
+            model_host = config.get("model_host", "")
+
+            model_memory_usage = 0
+
+            # Check if model is already cached
+            if model_name in cached_models:
+                models[model_name] = dict(cached_models[model_name])
+                continue
+
+            if model_host == "local":
+                model, tokenizer, model_pipeline, keyphrase_pipeline = cpu_loads[
+                    model_name
+                ].result()
+                input_buffers = None
+
+                if isinstance(model, torch.nn.Module):
+                    model_device = choose_model_device(
+                        model_name, model, model_device, gpu_free_memory
                     )
-                    tokenizer = AutoTokenizer.from_pretrained(model_name)
-                elif model_type == "token_classification":
-                    model = AutoModelForTokenClassification.from_pretrained(model_name)
-                    tokenizer = AutoTokenizer.from_pretrained(model_name)
-                elif model_type == "question-answering":
-                    model = AutoModelForQuestionAnswering.from_pretrained(model_name)
-                    tokenizer = AutoTokenizer.from_pretrained(model_name)
-                elif model_type == "keyphrase-extraction":
-                    # extractor = KeyphraseExtractionPipeline(model=model_name)
-                    model = AutoModelForTokenClassification.from_pretrained(model_name)
-                    tokenizer = AutoTokenizer.from_pretrained(model_name)
-                elif model_type == "zero_shot_classification":
-                    model_pipeline = pipeline(
-                        "zero-shot-classification", model=model_name
-                    )
-                elif model_type == "gliclass":
-                    model = GLiClassModel.from_pretrained(model_name)
-                    tokenizer = AutoTokenizer.from_pretrained(model_name)
-                    model_pipeline = ZeroShotClassificationPipeline(
-                        model,
-                        tokenizer,
-                        classification_type="multi-label",
-                        progress_bar=False,
-                    )
-                elif model_type == "gliner":
-                    model = GLiNER.from_pretrained(model_name)
-                elif model_type == "spacy":
-                    model = spacy.load(model_name)
-                elif model_type == "pipeline":
-                    model_pipeline = pipeline(model_pipeline_task, model=model_name)
-                else:
-                    raise ValueError(f"Unsupported model type: {model_type}")
-
-                if model_device == "cuda" and isinstance(model, torch.nn.Module):
                     model, model_memory_usage = load_model_to_device(
                         model, model_device
                     )
-                    gpu_free_memory -= model_memory_usage
-
-                if gpu_free_memory < 0 and isinstance(model, torch.nn.Module):
-                    model_device = "cpu"
-                    model, model_memory_usage = load_model_to_device(
-                        model, model_device
+                    if model_device == "cuda":
+                        gpu_free_memory -= model_memory_usage
+                    else:
+                        model = quantize_for_cpu(model, config)
+                elif config.get("model_type", "") == "pipeline" and isinstance(
+                    getattr(model_pipeline, "model", None), torch.nn.Module
+                ):
+                    # pipeline() built its model on the CPU; place it like any other model
+                    model_device = choose_model_device(
+                        model_name, model_pipeline.model, model_device, gpu_free_memory
                     )
-
-            except OSError as e:
-                if "does not appear to have a file named pytorch_model.bin" in str(e):
-                    if model_type == "sequence_classification":
-                        model = AutoModelForSequenceClassification.from_pretrained(
-                            model_name, from_tf=True
-                        )
-                    elif model_type == "token_classification":
-                        model = AutoModelForTokenClassification.from_pretrained(
-                            model_name, from_tf=True
-                        )
-                    tokenizer = AutoTokenizer.from_pretrained(model_name)
-
+                    model_pipeline.model, model_memory_usage = load_model_to_device(
+                        model_pipeline.model, model_device
+                    )
+                    # The pipeline moves its inputs to .device on every call
+                    model_pipeline.device = torch.device(model_device)
                     if model_device == "cuda":
-                        model, model_memory_usage = load_model_to_device(
-                            model, model_device
-                        )
                         gpu_free_memory -= model_memory_usage
 
-                    if gpu_free_memory < 0:
-                        model_device = "cpu"
-                        model, model_memory_usage = load_model_to_device(
-                            model, model_device
+                compiled_model = model
+                if config.get("model_type", "") == "zero_shot_classification":
+                    model_pipeline = zero_shot_batch(
+                        model,
+                        tokenizer,
+                        model_device,
+                        batch_size=int(
+                            config.get("batch_size") or DEFAULT_PIPELINE_BATCH_SIZE
+                        ),
+                    )
+                elif isinstance(model, torch.nn.Module):
+                    if (
+                        model_device == "cuda"
+                        and config.get("model_type", "") in STAGED_INPUT_MODEL_TYPES
+                    ):
+                        batch_size = int(
+                            config.get("batch_size") or DEFAULT_PIPELINE_BATCH_SIZE
                         )
-                else:
-                    raise e
-
-            if isinstance(model, torch.nn.Module):
-
-                def model_predict(inputs):
-                    inputs = {k: v.to(model_device) for k, v in inputs.items()}
-                    with torch.no_grad():
-                        outputs = model(**inputs)
-                    return outputs
-
-                model_pipeline = model_predict
-
-            cached_models[model_name] = (model, tokenizer, model_pipeline)
+                        input_buffers = allocate_input_buffers(tokenizer, batch_size)
+                    compiled_model = compile_model(model, model_device, config)
+                    model_pipeline = make_predict(
+                        compiled_model, model_device, input_buffers
+                    )
 
-            models[model_name] = {
-                "model": model,
-                "tokenizer": tokenizer,
-                "pipeline": model_pipeline,
-            }
+                    # Build the keyphrase pipeline once here, on the model's final device,
+                    # instead of once per chunk (ONNX models got theirs while loading)
+                    if (
+                        config.get("model_type", "") == "keyphrase-extraction"
+                        and keyphrase_pipeline is None
+                    ):
+                        keyphrase_pipeline = TokenClassificationPipeline(
+                            model=model,
+                            tokenizer=tokenizer,
+                            aggregation_strategy=AggregationStrategy.SIMPLE,
+                            batch_size=int(
+                                config.get("batch_size") or DEFAULT_PIPELINE_BATCH_SIZE
+                            ),
+                            device=next(model.parameters()).device,
+                        )
 
-            gc.collect()
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
+                    if (
+                        model_device == "cuda"
+                        and tokenizer is not None
+                        and config.get("model_type", "") in TRANSFORMERS_LOADERS
+                        and not warm_up_model(model_name, model_pipeline, tokenizer)
+                        and compiled_model is not model
+                    ):
+                        # Compilation errors only surface on the first call; run eagerly instead
+                        logger.warning(f"Using {model_name} without torch.compile")
+                        compiled_model = model
+                        model_pipeline = make_predict(
+                            model, model_device, input_buffers
+                        )
 
-        elif model_host == "server":
-            models[model_name] = {**config}
+                models[model_name] = {
+                    "model": model,
+                    "compiled_model": compiled_model,
+                    "tokenizer": tokenizer,
+                    "pipeline": model_pipeline,
+                    "keyphrase_pipeline": keyphrase_pipeline,
+                    "input_buffers": input_buffers,
+                    # ONNX Runtime models report their (CPU) device themselves
+                    "device": (
+                        next(model.parameters()).device
+                        if isinstance(model, torch.nn.Module)
+                        else getattr(model, "device", None)
+                    ),
+                }
+                if config.get("model_type", "") == "token_classification":
+                    models[model_name].update(get_bio_tag_ids(model))
+                cached_models[model_name] = models[model_name]
+
+            elif model_host == "server":
+                models[model_name] = {**config}
+
+    # Release loading leftovers once, after every model is in place. The device guard keeps
+    # empty_cache() from creating a CUDA context on cuda:0 when another device is current
+    gc.collect()
+    if torch.cuda.is_available():
+        with torch.cuda.device(torch.cuda.current_device()):
+            torch.cuda.empty_cache()
 
     return models
 
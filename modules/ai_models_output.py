@@ -1,8 +1,9 @@
 #####################################################################################################################################
 # NATIVE MODULES
-import json
-import os
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 
 #####################################################################################################################################
 # AI SPECIFIC MODULES
@@ -10,12 +11,10 @@ import torch
 
 #####################################################################################################################################
 # HELPER MODULES
+import numpy as np
 from loguru import logger
 from tqdm.auto import tqdm
-from transformers import TokenClassificationPipeline
 from transformers import logging as hf_logging
-from transformers import pipeline
-from transformers.pipelines import AggregationStrategy
 
 from .corenlp_data import generate_corenlp_output
 
@@ -25,14 +24,68 @@ from .idioms_and_beliefs import process_doc, rank_idiolect_data
 
 #####################################################################################################################################
 # Set the logging level to error to suppress warnings
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "2"  # 0 = DEBUG, 1 = INFO, 2 = WARNING, 3 = ERROR
-os.environ["TF_ENABLE_ONEDNN_OPTS"] = "0"
+# (the TensorFlow env vars are set by the main script, before any AI module is imported)
 hf_logging.set_verbosity_error()
+
+# Questions per forward pass when batching Q&A pipeline inputs
+QNA_BATCH_SIZE = 16
+
+# Question prompts per forward pass for GLiNER Q&A
+GLINER_QNA_BATCH_SIZE = 8
+
+# Concurrent requests per CoreNLP server while annotating a file's chunks
+CORENLP_MAX_WORKERS = 4
+
+# Chunks with fewer characters than this (after stripping) are not sent to the Q&A / GLiNER models
+MIN_QNA_CONTEXT_CHARS = 16
+
+# Model types that generate_ai_model_results_batched runs over several chunks per call
+BATCHED_MODEL_TYPES = {
+    "keyphrase-extraction",
+    "sequence_classification",
+    "token_classification",
+    "pipeline",
+    "gliclass",
+    "spacy",
+}
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+# transformers.pipeline pulls in the whole pipelines package, which is only needed when a
+# Q&A model is configured. lru_cache makes the import happen once.
+@lru_cache(maxsize=None)
+def get_hf_pipeline():
+    from transformers import pipeline
+
+    return pipeline
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def autocast_dtype(model):
+    """
+    Pick the half-precision dtype a model's GPU forward pass is autocast to.
+
+    Args:
+        model (torch.nn.Module): The loaded model.
+
+    Returns:
+        torch.dtype: `torch.bfloat16` for a model whose weights were loaded in bf16 (`quantization = "bf16"`),
+        otherwise `torch.float16`.
+    """
+    # Autocasting a bf16 model to fp16 would cast every weight again on each matmul
+    if getattr(model, "dtype", None) == torch.bfloat16:
+        return torch.bfloat16
+    return torch.float16
+
+
 #####################################################################################################################################
 
 
 #####################################################################################################################################
-@logger.catch
 def format_score(score, decimal_places=20):
     """
     Format a floating-point score to a specified number of decimal places.
@@ -66,18 +119,20 @@ def format_score(score, decimal_places=20):
 
 #####################################################################################################################################
 @logger.catch
-def sequence_classifier(chunk_text, model_config_name, models):
+@torch.inference_mode()
+def sequence_classifier(chunk_texts, model_config_name, models):
     """
-    Classify a given text chunk using a pre-loaded sequence classification model.
+    Classify a batch of text chunks using a pre-loaded sequence classification model.
 
     Args:
-        chunk_text (str): The input text to be classified.
+        chunk_texts (list[str]): The input texts to be classified; they are run through the model as one padded batch.
         model_config_name (str): The key for retrieving the model, tokenizer, and pipeline from the `models` dictionary.
         db_table (str): The name of the database table associated with this classification (currently unused).
         models (dict): A dictionary containing model configurations, including model, tokenizer, and pipeline.
 
     Returns:
-        list[dict]: A list of dictionaries, each containing:
+        list[list[dict]]: One result list per input text, in the same order as `chunk_texts`. Each is a list of
+        dictionaries, each containing:
             - 'label' (str): The predicted class label (human-readable if using KoalaAI/Text-Moderation).
             - 'score' (str): The classification confidence as a string with high decimal precision.
 
@@ -90,6 +145,7 @@ def sequence_classifier(chunk_text, model_config_name, models):
         - Applies softmax to output logits to derive probability scores for each class.
         - Supports custom label mappings for specific models like "KoalaAI/Text-Moderation".
         - Output scores are formatted as strings with up to 20 decimal places for consistency and traceability.
+        - On CUDA the forward pass runs under fp16 autocast (bf16 for models loaded in bf16); the softmax is computed in fp32.
 
     Caveats:
         - Inputs exceeding 512 tokens are truncated, potentially omitting context.
@@ -104,41 +160,44 @@ def sequence_classifier(chunk_text, model_config_name, models):
     # Retrieve the model, tokenizer, and pipeline from the models dictionary
     sequence_classifier_model = models[model_config_name].get("model", None)
     sequence_classifier_tokenizer = models[model_config_name].get("tokenizer", None)
+    # The forward pass built by make_predict (ai_model_loading): it runs the torch.compile'd
+    # model when the config opted in, and on CUDA stages the inputs through the model's
+    # pinned input buffers. ONNX Runtime models have none and are called directly
     sequence_classifier_pipeline = models[model_config_name].get("pipeline", None)
 
-    # Identify the device of the model
-    device = next(sequence_classifier_model.parameters()).device
+    # The device the model was placed on at load time
+    device = models[model_config_name]["device"]
 
-    # Tokenize the input text and move the inputs to the same device as the model
+    # Tokenize the input texts
     inputs = sequence_classifier_tokenizer(
-        chunk_text,
+        chunk_texts,
         return_tensors="pt",
         truncation=True,  # Truncate text to the model's max length
-        padding=True,  # Add padding to the text if needed
+        padding=True,  # Pad the texts to the longest one in the batch
         max_length=512,  # Ensure text does not exceed the model's max length
-    ).to(
-        device
-    )  # Move input tensors to the model's device
+    )
 
-    # Run the model with the inputs
-    outputs = sequence_classifier_model(**inputs)
+    # Run the model with the inputs; matmuls run in half precision on the GPU
+    with torch.autocast(
+        device_type=device.type,
+        dtype=autocast_dtype(sequence_classifier_model),
+        enabled=device.type == "cuda",
+    ):
+        if sequence_classifier_pipeline is not None:
+            outputs = sequence_classifier_pipeline(dict(inputs))
+        else:
+            outputs = sequence_classifier_model(**inputs)
 
-    # Get the predicted logits
-    logits = outputs.logits
+    # Get the predicted logits, back in fp32 so the softmax stays numerically stable
+    logits = outputs.logits.float()
 
-    # Apply softmax to get probabilities (scores)
-    probabilities = logits.softmax(dim=-1).squeeze().tolist()
+    # Apply softmax to get probabilities (scores) and sort every row on the model's device,
+    # so only the final, already ordered values are copied back to Python. Every label is
+    # kept, even near-zero ones: generate_chunk_root picks its rule by the number of labels
+    probabilities = logits.softmax(dim=-1)
+    top = torch.topk(probabilities, k=probabilities.shape[-1], dim=-1)
 
-    # Retrieve the labels
     id2label = sequence_classifier_model.config.id2label
-    labels = [id2label[idx] for idx in range(len(probabilities))]
-
-    # Combine labels and probabilities
-    label_prob_pairs = list(zip(labels, probabilities))
-    label_prob_pairs.sort(key=lambda item: item[1], reverse=True)
-
-    results = []
-
     if model_config_name == "KoalaAI/Text-Moderation":
         # Human-readable labels based on model card
         label_definitions = {
@@ -153,19 +212,24 @@ def sequence_classifier(chunk_text, model_config_name, models):
             "OK": "Okay",
         }
         # Map to human-readable labels
-        for label, probability in label_prob_pairs:
-            human_readable_label = label_definitions.get(label, "Unknown")
-            results.append(
-                {"label": human_readable_label, "score": format_score(probability)}
-            )
+        id2label = {
+            idx: label_definitions.get(label, "Unknown")
+            for idx, label in id2label.items()
+        }
 
-    else:
-        results = [
-            {"label": label, "score": format_score(score)}
-            for label, score in label_prob_pairs
+    # Combine labels and probabilities, highest probability first; the score formatting
+    # is the same as format_score(), inlined to skip a function call per label
+    batch_results = [
+        [
+            {"label": id2label[idx], "score": f"{probability:.20f}"}
+            for idx, probability in zip(row_indices, row_probabilities)
         ]
+        for row_indices, row_probabilities in zip(
+            top.indices.tolist(), top.values.tolist()
+        )
+    ]
 
-    return results
+    return batch_results
 
 
 #####################################################################################################################################
@@ -173,20 +237,22 @@ def sequence_classifier(chunk_text, model_config_name, models):
 
 #####################################################################################################################################
 @logger.catch
-def token_classifier(chunk_text, model_config_name, models):
+@torch.inference_mode()
+def token_classifier(chunk_texts, model_config_name, models):
     """
-    Perform token classification (e.g., Named Entity Recognition) on a given text chunk using a specified model.
+    Perform token classification (e.g., Named Entity Recognition) on a batch of text chunks using a specified model.
 
     Args:
-        chunk_text (str): The input text to classify at the token level.
+        chunk_texts (list[str]): The input texts to classify at the token level; they are run through the model
+            as one padded batch.
         model_config_name (str): The key identifying the model configuration within the `models` dictionary.
         models (dict): A dictionary containing preloaded model configurations, including:
             - 'model': The token classification model.
             - 'tokenizer': The tokenizer associated with the model.
-            - 'pipeline' (optional): Predefined pipeline (unused in this function).
+            - 'pipeline' (optional): The forward pass built by `make_predict` (see `ai_model_loading`).
 
     Returns:
-        list[str]: A sorted list of unique entity strings identified in the input text.
+        list[list[str]]: One sorted list of unique entity strings per input text, in the same order as `chunk_texts`.
 
     Side Effects:
         - Utilizes GPU or CPU resources depending on where the model is loaded.
@@ -196,11 +262,12 @@ def token_classifier(chunk_text, model_config_name, models):
         - Entity spans are extracted by aggregating tokens tagged with BIO-format labels (e.g., B-ORG, I-ORG).
         - Only entities of at least 4 characters and not containing '#' are returned.
         - Duplicate entities are removed and final results are sorted alphabetically.
+        - Padding tokens are dropped (via the attention mask) before grouping, so each text gets the same
+          entities it would get on its own.
 
     Caveats:
         - Only the first 512 tokens are considered due to model input constraints; longer texts will be truncated.
         - Assumes that the tokenizer and model are compatible and correctly initialized under the given `model_config_name`.
-        - The 'pipeline' entry in the models dictionary is unused and may be a remnant of a previous implementation pattern.
 
     Important Considerations:
         - Model performance depends heavily on domain-specific training. Custom or fine-tuned models may produce more relevant entities.
@@ -211,59 +278,71 @@ def token_classifier(chunk_text, model_config_name, models):
     # token_classifier_model, token_classifier_tokenizer = models[model_config_name]
     token_classifier_model = models[model_config_name].get("model", None)
     token_classifier_tokenizer = models[model_config_name].get("tokenizer", None)
+    # The make_predict forward pass (compiled model, pinned input buffers on CUDA);
+    # None for ONNX Runtime models, which are called directly
     token_classifier_pipeline = models[model_config_name].get("pipeline", None)
 
-    # Identify the device of the model
-    device = next(token_classifier_model.parameters()).device
+    # The device the model was placed on at load time
+    device = models[model_config_name]["device"]
 
-    # Tokenize the input text and move the inputs to the same device as the model
-    inputs = token_classifier_tokenizer(
-        chunk_text,
+    # Tokenize the input texts; the CPU tensors are also used for the token ids and
+    # attention mask below
+    encoded = token_classifier_tokenizer(
+        chunk_texts,
         return_tensors="pt",
         truncation=True,  # Truncate text to the model's max length
+        padding=True,  # Pad the texts to the longest one in the batch
         max_length=512,  # Ensure text does not exceed the model's max length
-    ).to(
-        device
-    )  # Move input tensors to the model's device
+    )
 
-    outputs = token_classifier_model(**inputs).logits
+    with torch.autocast(
+        device_type=device.type,
+        dtype=autocast_dtype(token_classifier_model),
+        enabled=device.type == "cuda",
+    ):
+        if token_classifier_pipeline is not None:
+            outputs = token_classifier_pipeline(dict(encoded)).logits
+        else:
+            outputs = token_classifier_model(**encoded).logits
     predictions = torch.argmax(outputs, dim=2)
-    tokens = token_classifier_tokenizer.convert_ids_to_tokens(inputs["input_ids"][0])
-    labels = [
-        token_classifier_model.config.id2label[pred.item()] for pred in predictions[0]
-    ]
+    # One device-to-host copy for the whole batch instead of one .item() sync per token
+    batch_prediction_ids = predictions.cpu().numpy()
+    batch_input_ids = encoded["input_ids"].numpy()
+    batch_token_mask = encoded["attention_mask"].numpy().astype(bool)
+    b_ids = models[model_config_name]["b_ids"]
+    i_ids = models[model_config_name]["i_ids"]
+
+    batch_results = []
+    for prediction_ids, input_ids, token_mask in zip(
+        batch_prediction_ids, batch_input_ids, batch_token_mask
+    ):
+        # Drop the padding tokens
+        prediction_ids = prediction_ids[token_mask]
+        tokens = token_classifier_tokenizer.convert_ids_to_tokens(
+            input_ids[token_mask].tolist()
+        )
 
-    entities = []
-    current_entity = []
-    for token, label in zip(tokens, labels):
-        if label.startswith("B-"):
-            if current_entity:
-                entities.append(current_entity)
-                current_entity = []
-            current_entity.append((token, label[2:]))
-        elif label.startswith("I-") and current_entity:
-            current_entity.append((token, label[2:]))
-        else:
-            if current_entity:
-                entities.append(current_entity)
-                current_entity = []
-    if current_entity:
-        entities.append(current_entity)
-
-    all_entities = []
-    for entity in entities:
-        entity_tokens = " ".join([token for token, _ in entity])
-        if "#" not in entity_tokens and len(entity_tokens) >= 4:
-            all_entities.append(
-                {"entity_text": entity_tokens, "entity_type": entity[0][1]}
-            )
+        # BIO grouping: an entity starts at every B- token and runs over the I- tokens that
+        # directly follow it (an I- token without a preceding B- starts nothing)
+        is_i = np.isin(prediction_ids, i_ids)
+        entity_starts = np.flatnonzero(np.isin(prediction_ids, b_ids))
+        # The first non-I token after each start ends its entity
+        non_i_positions = np.append(np.flatnonzero(~is_i), len(prediction_ids))
+        entity_ends = non_i_positions[
+            np.searchsorted(non_i_positions, entity_starts + 1)
+        ]
 
-    entity_texts = [entity["entity_text"] for entity in all_entities]
+        # Only the entity text is returned, so collect it straight into a set (deduplicated)
+        entity_texts = set()
+        for start, end in zip(entity_starts.tolist(), entity_ends.tolist()):
+            entity_tokens = " ".join(tokens[start:end])
+            if "#" not in entity_tokens and len(entity_tokens) >= 4:
+                entity_texts.add(entity_tokens)
 
-    # Remove duplicates and sort the list
-    all_entities = sorted(set(entity_texts))
+        # Sort the deduplicated list
+        batch_results.append(sorted(entity_texts))
 
-    return all_entities
+    return batch_results
 
 
 #####################################################################################################################################
@@ -271,12 +350,13 @@ def token_classifier(chunk_text, model_config_name, models):
 
 #####################################################################################################################################
 @logger.catch
-def pipeline_classifier(chunk_text, model_config_name, models, labels):
+@torch.inference_mode()
+def pipeline_classifier(chunk_texts, model_config_name, models, labels):
     """
-    Perform zero-shot or multi-label classification on the provided text using a pipeline-based model.
+    Perform zero-shot or multi-label classification on a batch of texts using a pipeline-based model.
 
     Args:
-        chunk_text (str): The input text to classify.
+        chunk_texts (list[str]): The input texts to classify; they are passed to the pipeline in a single call.
         model_config_name (str): The key identifying the model configuration within the `models` dictionary.
         models (dict): A dictionary containing preloaded model components, including:
             - 'model': The model instance used for classification.
@@ -285,7 +365,8 @@ def pipeline_classifier(chunk_text, model_config_name, models, labels):
         labels (list[str]): A list of classification labels to use for zero-shot inference.
 
     Returns:
-        list[dict]: A list of dictionaries containing 'label' and 'score' pairs, sorted by descending score.
+        list[list[dict]]: One result per input text, in the same order as `chunk_texts`; each a list of
+        dictionaries containing 'label' and 'score' pairs, sorted by descending score.
 
     Side Effects:
         - Relies on external model inference using Hugging Face pipeline, which consumes memory and compute resources.
@@ -308,18 +389,51 @@ def pipeline_classifier(chunk_text, model_config_name, models, labels):
 
     pipeline_classifier_pipeline = models[model_config_name].get("pipeline", None)
 
-    data = pipeline_classifier_pipeline(chunk_text, labels)
+    # A list input returns one output per text; the pipeline batches them internally
+    batch_data = pipeline_classifier_pipeline(list(chunk_texts), labels)
+
+    return [format_pipeline_output(data) for data in batch_data]
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def format_pipeline_output(data):
+    """
+    Normalize one text's classification pipeline output into a list of 'label' / 'score' dictionaries.
+
+    Args:
+        data (list | dict): The pipeline output for a single text.
+
+    Returns:
+        list[dict]: 'label' and 'score' pairs, sorted by descending score.
+
+    Raises:
+        ValueError: If the output format is not recognized.
+
+    Notes:
+        - Supports lists of `{"label", "score"}` dictionaries (optionally nested once), a single such dictionary
+          (text classification pipelines with `top_k=1`), and zero-shot outputs with "sequence", "labels",
+          and "scores".
+    """
+    # A single top label comes back as a bare dictionary for batched inputs
+    if isinstance(data, dict) and "label" in data and "score" in data:
+        data = [data]
 
     # Flatten the list if it's nested
     if isinstance(data, list) and len(data) == 1 and isinstance(data[0], list):
         data = data[0]
 
-    # Determine the data type and transform accordingly
-    if isinstance(data, list) and all(
-        isinstance(item, dict) and "label" in item and "score" in item for item in data
+    # Determine the data type and transform accordingly; pipeline outputs are homogeneous,
+    # so the first item is enough to tell the format
+    if isinstance(data, list) and (
+        not data
+        or (isinstance(data[0], dict) and "label" in data[0] and "score" in data[0])
     ):
         # Data Type 1
-        transformed_data = sorted(data, key=lambda x: x["score"], reverse=True)
+        data.sort(key=itemgetter("score"), reverse=True)
+        transformed_data = data
     elif (
         isinstance(data, dict)
         and "sequence" in data
@@ -332,9 +446,7 @@ def pipeline_classifier(chunk_text, model_config_name, models, labels):
         transformed_data = [
             {"label": label, "score": score} for label, score in zip(labels, scores)
         ]
-        transformed_data = sorted(
-            transformed_data, key=lambda x: x["score"], reverse=True
-        )
+        transformed_data.sort(key=itemgetter("score"), reverse=True)
     else:
         raise ValueError("Unknown data format")
     return transformed_data
@@ -345,6 +457,7 @@ def pipeline_classifier(chunk_text, model_config_name, models, labels):
 
 #####################################################################################################################################
 @logger.catch
+@torch.inference_mode()
 def question_answering(chunk_text, model_config_name, models, questions):
     """
     Generates question-answer (Q&A) pairs using a GLiNER-based entity classification model.
@@ -362,13 +475,15 @@ def question_answering(chunk_text, model_config_name, models, questions):
 
     Side Effects:
         - Logs activity using `logger`, including a status message that questions are being processed.
-        - Displays a progress bar via `tqdm` for visual feedback during question processing.
+        - Stores the Q&A pipeline in `models[model_config_name]["qa_pipeline"]` on first use.
 
     Notes:
         - The model is prompted with a concatenated string of the form: `<question>\n<chunk_text>`.
         - Only questions that yield at least one match (entity labeled as "match", "answer", or "summary")
           will be included in the final result set.
         - Duplicate answers for the same question are removed using `set()` before adding to results.
+        - The Hugging Face pipeline is built once per model and reused for every question and chunk.
+        - All questions for a chunk are sent through the pipeline in one call, `QNA_BATCH_SIZE` at a time.
 
     Caveats:
         - Assumes the model implements a `predict_entities` method that accepts a prompt and list of labels.
@@ -383,6 +498,10 @@ def question_answering(chunk_text, model_config_name, models, questions):
         - The quality of Q&A generation is highly dependent on the model's training and label definitions.
     """
 
+    # Too little context to hold an answer; skip the forward passes
+    if not chunk_text or len(chunk_text.strip()) < MIN_QNA_CONTEXT_CHARS:
+        return []
+
     logger.info("question_answering PROCESSING QUESTIONS...")
     # Extract the model from the models dictionary
     question_answering_classifier_model = models[model_config_name].get("model", None)
@@ -390,27 +509,37 @@ def question_answering(chunk_text, model_config_name, models, questions):
         "tokenizer", None
     )
 
-    # Initialize the list for questions with answers
-    qna_results = []
-
-    # Run the model to get answers for all questions
-    for question_dict in tqdm(questions, desc="question"):
-        # Extract the question text
-        question_text = question_dict.get("question", "").strip()
-
-        # Prepare the model input
-        qna_input = {"question": question_text, "context": chunk_text}
-
-        # Run the model
-        qna_pipline = pipeline(
+    # Build the Q&A pipeline once and keep it with the model for later chunks;
+    # "pipeline" already holds the raw forward-pass callable for this model
+    qna_pipline = models[model_config_name].get("qa_pipeline")
+    if qna_pipline is None:
+        qna_pipline = get_hf_pipeline()(
             "question-answering",
             model=question_answering_classifier_model,
             tokenizer=question_answering_classifier_tokenizer,
+            device=question_answering_classifier_model.device,
         )
+        models[model_config_name]["qa_pipeline"] = qna_pipline
 
-        # logger.info(f"{json.dumps(qna_input, indent=4)}")
-        matches = qna_pipline(qna_input)
+    # Initialize the list for questions with answers
+    qna_results = []
+
+    # Prepare one model input per question, all against the same chunk
+    qna_inputs = [
+        {"question": question_dict.get("question", "").strip(), "context": chunk_text}
+        for question_dict in questions
+    ]
+    if not qna_inputs:
+        return qna_results
+
+    # Run every question through the pipeline in batches instead of one at a time
+    all_matches = qna_pipline(qna_inputs, batch_size=QNA_BATCH_SIZE)
 
+    # A single input comes back unwrapped
+    if len(qna_inputs) == 1:
+        all_matches = [all_matches]
+
+    for question_dict, matches in zip(questions, all_matches):
         if matches:
             if isinstance(matches, list):
                 answers = sorted(
@@ -434,6 +563,7 @@ def question_answering(chunk_text, model_config_name, models, questions):
 
 #####################################################################################################################################
 @logger.catch
+@torch.inference_mode()
 def gliner_generate_qna_results(chunk_text, model_config_name, models, questions):
     """
     Generates question-answer (Q&A) pairs using a GLiNER-based entity classification model.
@@ -451,10 +581,13 @@ def gliner_generate_qna_results(chunk_text, model_config_name, models, questions
 
     Side Effects:
         - Logs activity using `logger`, including a status message that questions are being processed.
-        - Displays a progress bar via `tqdm` for visual feedback during question processing.
+        - Displays a progress bar via `tqdm` for visual feedback during question processing, when the
+          questions are run one at a time.
 
     Notes:
         - The model is prompted with a concatenated string of the form: `<question>\n<chunk_text>`.
+        - All prompts are run through `batch_predict_entities` (`GLINER_QNA_BATCH_SIZE` at a time) when the
+          installed GLiNER version provides it, otherwise one `predict_entities` call per question.
         - Only questions that yield at least one match (entity labeled as "match", "answer", or "summary")
           will be included in the final result set.
         - Duplicate answers for the same question are removed using `set()` before adding to results.
@@ -472,6 +605,10 @@ def gliner_generate_qna_results(chunk_text, model_config_name, models, questions
         - The quality of Q&A generation is highly dependent on the model's training and label definitions.
     """
 
+    # Too little context to hold an answer; skip the forward passes
+    if not chunk_text or len(chunk_text.strip()) < MIN_QNA_CONTEXT_CHARS:
+        return []
+
     logger.info("PROCESSING QUESTIONS...")
     # Extract the model from the models dictionary
     gliner_classifier_model = models[model_config_name].get("model", None)
@@ -479,18 +616,25 @@ def gliner_generate_qna_results(chunk_text, model_config_name, models, questions
     # Initialize the list for questions with answers
     qna_results = []
 
-    # Run the model to get answers for all questions
-    for question_dict in tqdm(questions, desc="question"):
-        # Extract the question text
-        question_text = question_dict.get("question", "").strip()
-
-        # Prepare the model input
-        input_ = f"{question_text}\n{chunk_text}"
-        model_labels = ["match", "answer", "summary"]
+    # Prepare one model input per question
+    model_inputs = [
+        f"{question_dict.get('question', '').strip()}\n{chunk_text}"
+        for question_dict in questions
+    ]
+    model_labels = ["match", "answer", "summary"]
 
-        # Run the model
-        matches = gliner_classifier_model.predict_entities(input_, model_labels)
+    # Run the model over all questions in batches when this GLiNER version supports it
+    if hasattr(gliner_classifier_model, "batch_predict_entities"):
+        all_matches = gliner_classifier_model.batch_predict_entities(
+            model_inputs, model_labels, batch_size=GLINER_QNA_BATCH_SIZE
+        )
+    else:
+        all_matches = [
+            gliner_classifier_model.predict_entities(input_, model_labels)
+            for input_ in tqdm(model_inputs, desc="question")
+        ]
 
+    for question_dict, matches in zip(questions, all_matches):
         if matches:
             # Collect unique answers as a sorted list
             answers = sorted(
@@ -556,6 +700,7 @@ def gliner_generate_qna_results(chunk_text, model_config_name, models, questions
 
 #####################################################################################################################################
 @logger.catch
+@torch.inference_mode()
 def gliner_classifier(
     chunk_text,
     model_config_name,
@@ -603,6 +748,10 @@ def gliner_classifier(
 
     # if labels and not questions:
     if len(labels) > 0:
+        # Too little text to hold an entity; skip the forward pass
+        if not chunk_text or len(chunk_text.strip()) < MIN_QNA_CONTEXT_CHARS:
+            return []
+
         logger.info(f"Processing {len(labels)} labels")
         labels = gliner_classifier_model.predict_entities(chunk_text, labels)
         return labels
@@ -660,24 +809,318 @@ def spacy_classifier(chunk_text, model_config_name, models, idiolect):
 #####################################################################################################################################
 
 
+#####################################################################################################################################
+def dedupe_keyphrases(results):
+    """
+    Collect the unique keyphrase strings from a keyphrase pipeline's aggregated spans.
+
+    Args:
+        results (list[dict]): The spans returned by the keyphrase pipeline for one chunk.
+
+    Returns:
+        list[str]: The stripped keyphrases, without duplicates, in the order they first appear in the chunk.
+    """
+    # dict keys keep insertion order, so this dedupes in one pass without a sort
+    return list(dict.fromkeys(result["word"].strip() for result in results))
+
+
+#####################################################################################################################################
+
+
 #####################################################################################################################################
 @logger.catch
+@torch.inference_mode()
 def keyphrase_extraction(chunk_text, model_config_name, models):
-    # Initialize the pipeline using the provided model/tokenizer
-    pipeline = TokenClassificationPipeline(
-        model=models[model_config_name].get("model", None),
-        tokenizer=models[model_config_name].get("tokenizer", None),
-        aggregation_strategy=AggregationStrategy.SIMPLE,
-    )
+    # The pipeline built once at load time (PyTorch or ONNX INT8)
+    pipeline = models[model_config_name]["keyphrase_pipeline"]
 
     # Run the pipeline — this already applies aggregation and postprocessing
     results = pipeline(chunk_text)
 
-    # Extract and deduplicate keyphrases
-    keyphrases = sorted({result.get("word").strip() for result in results})
-
     # Return as a dictionary
-    return {"model_results": keyphrases}
+    return {"model_results": dedupe_keyphrases(results)}
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+@logger.catch
+@torch.inference_mode()
+def keyphrase_extraction_batched(
+    chunk_texts, model_config_name, models, batch_size=16
+):
+    """
+    Extract keyphrases from several text chunks with a single batched pipeline call.
+
+    Args:
+        chunk_texts (list[str]): The input text chunks.
+        model_config_name (str): The key identifying the model and tokenizer within the `models` dictionary.
+        models (dict): A dictionary of loaded models, tokenizers, and pipelines keyed by model name.
+        batch_size (int, optional): The number of chunks run through the model per forward pass. Defaults to 16.
+
+    Returns:
+        list[dict]: One `{"model_results": [...]}` dictionary per chunk, in the same order as `chunk_texts`,
+        each holding that chunk's deduplicated keyphrases.
+
+    Notes:
+        - Produces the same per-chunk output as `keyphrase_extraction`.
+    """
+    pipeline = models[model_config_name]["keyphrase_pipeline"]
+
+    # A list input returns one list of aggregated spans per chunk
+    batch_results = pipeline(chunk_texts, batch_size=batch_size)
+
+    return [{"model_results": dedupe_keyphrases(results)} for results in batch_results]
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+@dataclass
+class ChunkInputs:
+    """
+    The per-chunk inputs shared by every model handler called from `generate_ai_model_results`.
+    """
+
+    chunk_text: str
+    models: dict
+    labels: list
+    questions: list
+    idiolect: list
+    chunk_calendar_start_datetime: str
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def add_model_sub_results(ai_model_results, model_name, key, model_results):
+    """
+    Store one part (e.g., "qna" or "custom_labels") of a model's results, creating its entry if needed.
+    """
+    ai_model_results.setdefault(model_name, {"model_results": {}})["model_results"][
+        key
+    ] = model_results
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+def handle_keyphrase_extraction(ai_model_results, model_config, chunk):
+    """
+    Run a keyphrase extraction model on one chunk and store its keyphrases.
+
+    Args:
+        ai_model_results (dict): The chunk's results so far, keyed by model name; updated in place.
+        model_config (ModelConfig): The configuration of the model to run.
+        chunk (ChunkInputs): The chunk text and the inputs shared by every handler.
+    """
+    logger.info("IF: Keyphrase Extraction")
+    ai_model_results[model_config.model_name] = keyphrase_extraction(
+        chunk.chunk_text, model_config.model_name, chunk.models
+    )
+
+
+def handle_question_answering(ai_model_results, model_config, chunk):
+    """
+    Ask every custom question of the chunk with a Q&A model and store the answers under "qna".
+
+    Args:
+        ai_model_results (dict): The chunk's results so far, keyed by model name; updated in place.
+        model_config (ModelConfig): The configuration of the model to run.
+        chunk (ChunkInputs): The chunk text and the inputs shared by every handler.
+
+    Notes:
+        - Nothing is stored when there are no questions or none of them gets an answer.
+    """
+    logger.info("IF: question-answering")
+    if len(chunk.questions) > 0:
+        logger.info(f"Processing {len(chunk.questions)} questions")
+        model_results = question_answering(
+            chunk.chunk_text, model_config.model_name, chunk.models, chunk.questions
+        )
+        if len(model_results) > 0:
+            add_model_sub_results(
+                ai_model_results, model_config.model_name, "qna", model_results
+            )
+
+
+def handle_sequence_classification(ai_model_results, model_config, chunk):
+    """
+    Run a sequence classification model on one chunk and store its label scores.
+
+    Args:
+        ai_model_results (dict): The chunk's results so far, keyed by model name; updated in place.
+        model_config (ModelConfig): The configuration of the model to run.
+        chunk (ChunkInputs): The chunk text and the inputs shared by every handler.
+    """
+    logger.info("IF: sequence_classification")
+    batch_results = sequence_classifier(
+        [chunk.chunk_text], model_config.model_name, chunk.models
+    )
+    model_results = batch_results[0] if batch_results else None
+    ai_model_results[model_config.model_name] = {"model_results": model_results}
+
+
+def handle_token_classification(ai_model_results, model_config, chunk):
+    """
+    Run a token classification (NER) model on one chunk and store its entities.
+
+    Args:
+        ai_model_results (dict): The chunk's results so far, keyed by model name; updated in place.
+        model_config (ModelConfig): The configuration of the model to run.
+        chunk (ChunkInputs): The chunk text and the inputs shared by every handler.
+    """
+    logger.info("IF: token_classification")
+    batch_results = token_classifier(
+        [chunk.chunk_text], model_config.model_name, chunk.models
+    )
+    model_results = batch_results[0] if batch_results else None
+    ai_model_results[model_config.model_name] = {"model_results": model_results}
+
+
+def handle_pipeline(ai_model_results, model_config, chunk):
+    """
+    Run a pipeline or GLiClass model on one chunk against the custom labels and store its label scores.
+
+    Args:
+        ai_model_results (dict): The chunk's results so far, keyed by model name; updated in place.
+        model_config (ModelConfig): The configuration of the model to run.
+        chunk (ChunkInputs): The chunk text and the inputs shared by every handler.
+    """
+    logger.info("IF: pipeline OR gliclass")
+    batch_results = pipeline_classifier(
+        [chunk.chunk_text], model_config.model_name, chunk.models, chunk.labels
+    )
+    model_results = batch_results[0] if batch_results else None
+    ai_model_results[model_config.model_name] = {"model_results": model_results}
+
+
+def handle_gliner(ai_model_results, model_config, chunk):
+    """
+    Run a GLiNER model on one chunk and store its "custom_labels" and / or "qna" results.
+
+    Args:
+        ai_model_results (dict): The chunk's results so far, keyed by model name; updated in place.
+        model_config (ModelConfig): The configuration of the model to run.
+        chunk (ChunkInputs): The chunk text and the inputs shared by every handler.
+
+    Notes:
+        - Each pass only runs when its `enable_custom_labels` / `enable_qna` config flag is "yes".
+    """
+    model_name = model_config.model_name
+
+    # The two passes are not fused into one predict call: GLiNER puts every label in front of
+    # each input, so prepending the custom labels to the Q&A prompts (or the Q&A labels to the
+    # chunk) would push chunk text past the model's max length and change both outputs
+    if (model_config.enable_custom_labels or "").strip().lower() == "yes":
+        logger.info("IF: gliner/labels")
+        model_results = gliner_classifier(
+            chunk.chunk_text, model_name, chunk.models, chunk.labels
+        )
+        add_model_sub_results(
+            ai_model_results, model_name, "custom_labels", model_results
+        )
+
+    if (model_config.enable_qna or "").strip().lower() == "yes":
+        logger.info("IF: gliner/Q&A")
+        if len(chunk.questions) > 0:
+            logger.info(f"Processing {len(chunk.questions)} questions")
+            model_results = gliner_generate_qna_results(
+                chunk.chunk_text, model_name, chunk.models, chunk.questions
+            )
+            if len(model_results) > 0:
+                add_model_sub_results(
+                    ai_model_results, model_name, "qna", model_results
+                )
+
+
+def handle_spacy(ai_model_results, model_config, chunk):
+    """
+    Parse one chunk with a spaCy model and store its idiolect analysis.
+
+    Args:
+        ai_model_results (dict): The chunk's results so far, keyed by model name; updated in place.
+        model_config (ModelConfig): The configuration of the model to run.
+        chunk (ChunkInputs): The chunk text and the inputs shared by every handler.
+    """
+    logger.info("LOADING SPACY DOC")
+    doc = process_doc(chunk.chunk_text, model_config.model_name, chunk.models)
+
+    logger.info("IF: spacy")
+    model_results = spacy_classifier(
+        doc, model_config.model_name, chunk.models, chunk.idiolect
+    )
+    ai_model_results[model_config.model_name] = {"model_results": model_results}
+
+
+def handle_corenlp(ai_model_results, model_config, chunk):
+    """
+    Annotate one chunk on a Stanford CoreNLP server and store the annotations.
+
+    Args:
+        ai_model_results (dict): The chunk's results so far, keyed by model name; updated in place.
+        model_config (ModelConfig): The configuration of the model to run.
+        chunk (ChunkInputs): The chunk text and the inputs shared by every handler.
+
+    Notes:
+        - The server URL and annotator arguments come from `model_config._corenlp_args`, built once per config.
+    """
+    logger.info("IF: corenlp")
+    model_results = generate_corenlp_output(
+        chunk.chunk_text,
+        chunk.chunk_calendar_start_datetime,
+        *model_config._corenlp_args,
+    )
+    ai_model_results[model_config.model_name] = {"model_results": {**model_results}}
+
+
+def dedupe_model_configs(model_configs):
+    """
+    Drop repeated model configurations, keeping the first of each in order.
+
+    Args:
+        model_configs (list[ModelConfig]): The model configurations to run.
+
+    Returns:
+        list[ModelConfig]: The configurations whose (model_name, model_type, enable_qna, enable_custom_labels)
+        has not been seen earlier in the list.
+
+    Notes:
+        - A config repeated in a hand-edited TOML would otherwise run the same model over every chunk again,
+          only to overwrite (or append a copy of) the first run's results under the same model name.
+    """
+    seen = set()
+    unique_model_configs = []
+    for model_config in model_configs:
+        key = (
+            model_config.model_name,
+            model_config.model_type.strip().lower(),
+            (model_config.enable_qna or "").strip().lower(),
+            (model_config.enable_custom_labels or "").strip().lower(),
+        )
+        if key in seen:
+            continue
+        seen.add(key)
+        unique_model_configs.append(model_config)
+    return unique_model_configs
+
+
+# Normalized model_type -> handler that runs the model on one chunk and stores its results
+MODEL_TYPE_HANDLERS = {
+    "keyphrase-extraction": handle_keyphrase_extraction,
+    "question-answering": handle_question_answering,
+    "sequence_classification": handle_sequence_classification,
+    "token_classification": handle_token_classification,
+    "pipeline": handle_pipeline,
+    "gliclass": handle_pipeline,
+    "gliner": handle_gliner,
+    "spacy": handle_spacy,
+    "corenlp": handle_corenlp,
+}
 
 
 #####################################################################################################################################
@@ -720,7 +1163,8 @@ def generate_ai_model_results(
         - Prints the final results dictionary (`ai_model_results`) to standard output for inspection.
 
     Notes:
-        - Model type handling is case-insensitive and trimmed of whitespace.
+        - Model type handling is case-insensitive and trimmed of whitespace; each type is dispatched through
+          `MODEL_TYPE_HANDLERS`, and unknown types are skipped.
         - GLiNER-based models can perform both custom label extraction and question-answering, if enabled.
         - spaCy models are preprocessed with `process_doc()` and may reuse the same `Doc` object for multiple evaluations.
         - CoreNLP models require external server connectivity and correct annotator configuration.
@@ -732,156 +1176,248 @@ def generate_ai_model_results(
         - If no results are returned from a given model, its entry may be partially or entirely absent in the output.
 
     Important Considerations:
-        - Duplicate processing may occur if the same model configuration is repeated without deduplication.
+        - Repeated model configurations are run once (see `dedupe_model_configs`).
         - CoreNLP calls may fail silently if the external server is unavailable or misconfigured.
         - Model behavior is determined by the `model_type`, which must match expected values (e.g., "gliner", "spacy").
         - This function does not catch all runtime errors—ensure inputs are validated upstream.
     """
-    dict_of_model_configs = [asdict(model) for model in model_configs]
-    # logger.info(f"model_configs:\n\n{json.dumps(dict_of_model_configs, indent=4)}")
-    new_chunk = True
     ai_model_results = {}
+    chunk = ChunkInputs(
+        chunk_text=chunk_text,
+        models=models,
+        labels=labels,
+        questions=questions,
+        idiolect=idiolect,
+        chunk_calendar_start_datetime=chunk_calendar_start_datetime,
+    )
 
     #####################################################################################################################################
     # Start processing
-    for model_config in model_configs:
+    for model_config in dedupe_model_configs(model_configs):
 
         model_name = model_config.model_name
         logger.info(f"PROCESSING MODEL: {model_name}")
 
-        #####################################################################################################################################
-        # FRONT LOAD SOME MODELS PRIOR TO PROCESSING THEIR RESPECTIVE TABLES
-        if model_config.model_type.strip().lower() == "spacy":
-            logger.info("LOADING SPACY DOC")
-            doc = process_doc(chunk_text, model_name, models)
-
-        #####################################################################################################################################
-
-        #####################################################################################################################################
-
-        if model_config.model_type.strip().lower() == "keyphrase-extraction":
-            logger.info("IF: Keyphrase Extraction")
-            model_results = keyphrase_extraction(chunk_text, model_name, models)
-            ai_model_results[model_name] = model_results
-            # ai_model_results[model_name] = {
-            #     "model_results": {
-            #         "keyphrases": model_results,
-            #     }
-            # }
-
-        if model_config.model_type.strip().lower() == "question-answering":
-            logger.info("IF: question-answering")
-
-            if len(questions) > 0:
-                logger.info(f"Processing {len(questions)} questions")
-                model_results = question_answering(
-                    chunk_text, model_name, models, questions
-                )
-                if len(model_results) > 0:
-                    # Initialize if needed
-                    if model_name not in ai_model_results:
-                        ai_model_results[model_name] = {"model_results": {}}
+        # Normalize the model type once and hand the model to its handler
+        handler = MODEL_TYPE_HANDLERS.get(model_config.model_type.strip().lower())
+        if handler is not None:
+            handler(ai_model_results, model_config, chunk)
+
+    return ai_model_results
+
+
+#####################################################################################################################################
+
+
+#####################################################################################################################################
+@logger.catch
+def generate_ai_model_results_batched(
+    chunk_texts,
+    model_configs,
+    models,
+    labels,
+    questions,
+    idiolect,
+    chunk_calendar_start_datetimes,
+    batch_size=16,
+):
+    """
+    Generates AI model results for every chunk of a file, batching chunks through the models that support it.
+
+    Args:
+        chunk_texts (list[str]): The text of every chunk, in chunk order.
+        model_configs (list[ModelConfig]): The model configurations to run.
+        models (dict): A dictionary of loaded models, tokenizers, and pipelines keyed by model name.
+        labels (list[str]): A list of label strings used for classification tasks.
+        questions (list[dict]): A list of question dictionaries for Q&A-based extraction tasks.
+        idiolect (list[str]): A list of idiosyncratic lexical items for use with spaCy models.
+        chunk_calendar_start_datetimes (list[str]): The calendar start datetime of every chunk, parallel to `chunk_texts`.
+        batch_size (int, optional): The number of chunks sent through a model per call, unless the model's
+            config sets its own `batch_size`. Defaults to 16.
 
-                    # Add qna
-                    ai_model_results[model_name]["model_results"]["qna"] = model_results
+    Returns:
+        list[dict]: One `ai_model_results` dictionary per chunk, in the same order as `chunk_texts`, matching
+        what `generate_ai_model_results` returns for that chunk.
 
-        if model_config.model_type.strip().lower() == "sequence_classification":
-            logger.info("IF: sequence_classification")
+    Notes:
+        - Model types with a batched implementation (`BATCHED_MODEL_TYPES`) are run over `batch_size` chunks
+          per call; all other model types are dispatched chunk by chunk through `generate_ai_model_results`.
+        - Each spaCy model parses every chunk once; configs that share the model reuse the same `Doc`s.
+        - CoreNLP chunks are sent to the server concurrently, `CORENLP_MAX_WORKERS` requests at a time, before
+          the local models run (see `run_local_models`), and their results are collected after them.
+        - Results are assembled in `model_configs` order, so the per-chunk key order is unchanged.
+        - Repeated model configurations are run once (see `dedupe_model_configs`).
+    """
+    all_ai_model_results = [{} for _ in chunk_texts]
+    # spaCy model name -> the parsed Doc of every chunk, shared by configs using the same model
+    spacy_docs = {}
+    model_configs = dedupe_model_configs(model_configs)
+
+    with ThreadPoolExecutor(max_workers=CORENLP_MAX_WORKERS) as corenlp_executor:
+        # Network bound: every CoreNLP chunk is sent to the server before the local models
+        # run, so the round trips overlap with the GPU / CPU work; the results are
+        # collected last
+        corenlp_futures = {
+            model_config.model_name: [
+                corenlp_executor.submit(
+                    generate_ai_model_results,
+                    chunk_text,
+                    [model_config],
+                    models,
+                    labels,
+                    questions,
+                    idiolect,
+                    chunk_calendar_start_datetimes[chunk_index],
+                )
+                for chunk_index, chunk_text in enumerate(chunk_texts)
+            ]
+            for model_config in model_configs
+            if model_config.model_type.strip().lower() == "corenlp"
+        }
 
-            model_results = sequence_classifier(chunk_text, model_name, models)
-            ai_model_results[model_name] = {"model_results": model_results}
+        run_local_models(
+            chunk_texts,
+            model_configs,
+            models,
+            labels,
+            questions,
+            idiolect,
+            chunk_calendar_start_datetimes,
+            batch_size,
+            all_ai_model_results,
+            spacy_docs,
+        )
 
-        if model_config.model_type.strip().lower() == "token_classification":
-            logger.info("IF: token_classification")
+        for model_name, futures in corenlp_futures.items():
+            logger.info(f"COLLECTING MODEL: {model_name}")
+            for chunk_index, future in enumerate(futures):
+                chunk_results = future.result() or {}
+                # Fill the placeholder, which keeps the key in model_configs order
+                all_ai_model_results[chunk_index].update(chunk_results)
+                if chunk_results.get(model_name) is None:
+                    all_ai_model_results[chunk_index].pop(model_name, None)
 
-            model_results = token_classifier(chunk_text, model_name, models)
-            ai_model_results[model_name] = {"model_results": model_results}
+    return all_ai_model_results
 
-        if (model_config.model_type.strip().lower() == "pipeline") or (
-            model_config.model_type.strip().lower() == "gliclass"
-        ):
-            logger.info("IF: pipeline OR gliclass")
 
-            model_results = pipeline_classifier(chunk_text, model_name, models, labels)
-            ai_model_results[model_name] = {"model_results": model_results}
+#####################################################################################################################################
 
-        if (
-            model_config.model_type.strip().lower() == "gliner"
-            and model_config.enable_custom_labels.strip().lower() == "yes"
-        ):
-            logger.info("IF: gliner/labels")
 
-            model_results = gliner_classifier(
-                chunk_text,
-                model_name,
-                models,
-                labels,
-            )
+#####################################################################################################################################
+def run_local_models(
+    chunk_texts,
+    model_configs,
+    models,
+    labels,
+    questions,
+    idiolect,
+    chunk_calendar_start_datetimes,
+    batch_size,
+    all_ai_model_results,
+    spacy_docs,
+):
+    """
+    Runs every non-CoreNLP model over the chunks of a file for `generate_ai_model_results_batched`.
 
-            # Initialize if needed
-            if model_name not in ai_model_results:
-                ai_model_results[model_name] = {"model_results": {}}
-
-            # Add custom_labels
-            ai_model_results[model_name]["model_results"][
-                "custom_labels"
-            ] = model_results
-
-        if (
-            model_config.model_type.strip().lower() == "gliner"
-            and model_config.enable_qna.strip().lower() == "yes"
-        ):
-            logger.info("IF: gliner/Q&A")
-
-            if len(questions) > 0:
-                logger.info(f"Processing {len(questions)} questions")
-                model_results = gliner_generate_qna_results(
-                    chunk_text, model_name, models, questions
+    Args:
+        chunk_texts (list[str]): The text of every chunk, in chunk order.
+        model_configs (list[ModelConfig]): The deduplicated model configurations to run.
+        models (dict): A dictionary of loaded models, tokenizers, and pipelines keyed by model name.
+        labels (list[str]): A list of label strings used for classification tasks.
+        questions (list[dict]): A list of question dictionaries for Q&A-based extraction tasks.
+        idiolect (list[str]): A list of idiosyncratic lexical items for use with spaCy models.
+        chunk_calendar_start_datetimes (list[str]): The calendar start datetime of every chunk.
+        batch_size (int): The number of chunks sent through a model per call, for models whose config
+            sets no `batch_size` of its own.
+        all_ai_model_results (list[dict]): The per-chunk result dictionaries, filled in place.
+        spacy_docs (dict): spaCy model name -> the parsed Doc of every chunk, filled in place.
+
+    Side Effects:
+        - Adds each model's results to `all_ai_model_results`. CoreNLP models, which
+          `generate_ai_model_results_batched` runs in the background, get a `None` placeholder so their
+          results land in `model_configs` order once they are collected.
+    """
+    for model_config in model_configs:
+        model_name = model_config.model_name
+        model_type = model_config.model_type.strip().lower()
+        # A batch_size in the model's config (also used to size its pipeline and input buffers
+        # at load time) overrides the run-wide one
+        model_batch_size = int(model_config.batch_size or batch_size)
+
+        if model_type == "spacy" and model_name not in spacy_docs:
+            # nlp.pipe() parses the chunks in batches, once per spaCy model
+            spacy_docs[model_name] = list(
+                models[model_name]["model"].pipe(
+                    chunk_texts, batch_size=model_batch_size
                 )
-                if len(model_results) > 0:
-                    # Initialize if needed
-                    if model_name not in ai_model_results:
-                        ai_model_results[model_name] = {"model_results": {}}
-
-                    # Add qna
-                    ai_model_results[model_name]["model_results"]["qna"] = model_results
-
-        if model_config.model_type.strip().lower() == "spacy":
-            logger.info("IF: spacy")
-            model_results = spacy_classifier(doc, model_name, models, idiolect)
-            ai_model_results[model_name] = {"model_results": model_results}
-        #####################################################################################################################################
-
-        #####################################################################################################################################
-
-        if model_config.model_type.strip().lower() == "corenlp" and new_chunk == True:
-            logger.info("IF: corenlp")
-            server_address = model_config.server_address
-            server_port = model_config.server_port
-            annotators = model_config.annotators
-            pipelineLanguage = model_config.pipelineLanguage
-            outputFormat = model_config.outputFormat
-            ner_additional_tokensregex_rules_file = (
-                model_config.ner_additional_tokensregex_rules_file
             )
 
-            model_results = generate_corenlp_output(
+        if model_type in BATCHED_MODEL_TYPES:
+            logger.info(f"BATCHING MODEL: {model_name}")
+            for start in range(0, len(chunk_texts), model_batch_size):
+                batch_texts = chunk_texts[start : start + model_batch_size]
+                if model_type == "keyphrase-extraction":
+                    # None (a failed batch, logged by @logger.catch) only loses this
+                    # model's results for these chunks
+                    batch_results = keyphrase_extraction_batched(
+                        batch_texts, model_name, models, batch_size=model_batch_size
+                    ) or [{"model_results": None} for _ in batch_texts]
+                elif model_type == "spacy":
+                    docs = spacy_docs[model_name][start : start + model_batch_size]
+                    batch_results = [
+                        {
+                            "model_results": spacy_classifier(
+                                doc, model_name, models, idiolect
+                            )
+                        }
+                        for doc in docs
+                    ]
+                elif model_type in ("pipeline", "gliclass"):
+                    batch_results = [
+                        {"model_results": model_results}
+                        for model_results in pipeline_classifier(
+                            batch_texts, model_name, models, labels
+                        )
+                        or [None] * len(batch_texts)
+                    ]
+                elif model_type == "sequence_classification":
+                    # @logger.catch returns None for a failed batch (e.g., CUDA OOM); only that
+                    # model's results for those chunks are lost, as with a per-chunk failure
+                    batch_results = [
+                        {"model_results": model_results}
+                        for model_results in sequence_classifier(
+                            batch_texts, model_name, models
+                        )
+                        or [None] * len(batch_texts)
+                    ]
+                else:
+                    batch_results = [
+                        {"model_results": model_results}
+                        for model_results in token_classifier(
+                            batch_texts, model_name, models
+                        )
+                        or [None] * len(batch_texts)
+                    ]
+                for offset, model_results in enumerate(batch_results):
+                    all_ai_model_results[start + offset][model_name] = model_results
+            continue
+
+        if model_type == "corenlp":
+            for chunk_results in all_ai_model_results:
+                chunk_results[model_name] = None
+            continue
+
+        for chunk_index, chunk_text in enumerate(chunk_texts):
+            chunk_results = generate_ai_model_results(
                 chunk_text,
-                chunk_calendar_start_datetime,
-                server_address,
-                server_port,
-                annotators,
-                pipelineLanguage,
-                outputFormat,
-                ner_additional_tokensregex_rules_file,
+                [model_config],
+                models,
+                labels,
+                questions,
+                idiolect,
+                chunk_calendar_start_datetimes[chunk_index],
             )
-
-            ai_model_results[model_name] = {"model_results": {**model_results}}
-
-    # print("AI_MODEL_RESULTS:\n")
-    # print(f"{json.dumps(ai_model_results, indent=4)}")
-    # input("")
-    return ai_model_results
+            all_ai_model_results[chunk_index].update(chunk_results or {})
 
 
 #####################################################################################################################################
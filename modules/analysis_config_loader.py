@@ -1,17 +1,26 @@
+import os
 import sys
 import warnings
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
 
-import toml
 from loguru import logger
 
 from .project_paths import PATHS
 
 
-@dataclass
+# Model and astrology settings are read-only after loading; slots keep attribute access
+# and per-instance memory down, and frozen instances can be hashed / used as cache keys
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
     use_model: str
     model_name: str
@@ -26,9 +35,37 @@ class ModelConfig:
     outputFormat: Optional[str] = None
     ner_additional_regexner_mapping_file: Optional[str] = None
     ner_additional_tokensregex_rules_file: Optional[str] = None
+    onnx_int8: Optional[str] = None
+    batch_size: Optional[int] = None
+    quantization: Optional[str] = None
+    torch_compile: Optional[str] = None
+    pipe_disable: Optional[Tuple[str, ...]] = None
+    # Server settings in generate_corenlp_output's argument order, built once for corenlp models
+    _corenlp_args: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # frozen: derived values are set with object.__setattr__
+        if self.pipe_disable is not None:
+            object.__setattr__(self, "pipe_disable", tuple(self.pipe_disable))
+
+        if (self.model_type or "").strip().lower() == "corenlp":
+            object.__setattr__(
+                self,
+                "_corenlp_args",
+                (
+                    self.server_address,
+                    self.server_port,
+                    self.annotators,
+                    self.pipelineLanguage,
+                    self.outputFormat,
+                    self.ner_additional_tokensregex_rules_file,
+                ),
+            )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AstrologyConfig:
     planet_and_aspect_orb: str
     natal_date_and_time_of_birth: str
@@ -41,7 +78,7 @@ class AstrologyConfig:
     pof_file: str
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisConfig:
     # Core variables
     idiolect_file_path: Path
@@ -67,6 +104,47 @@ class AnalysisConfig:
     desired_date: datetime = datetime(2020, 5, 5)  # default
 
 
+# analysis_variables keys that must name an existing file or folder
+REQUIRED_PATH_KEYS = (
+    "idiolect_file_path",
+    "generated_from_corpus_idiotlect_output_path",
+    "analysis_output_directory",
+    "analysis_label_file_path",
+    "analysis_questions_file_path",
+)
+
+
+def find_missing_paths(named_paths):
+    """Return the (name, path) pairs whose path does not exist, listing each parent directory once."""
+    by_parent = defaultdict(list)
+    missing = []
+    for name, path in named_paths:
+        if path.name:
+            by_parent[path.parent].append((name, path))
+        # "" / "." / a drive root have no name to look up in a parent listing
+        elif not path.exists():
+            missing.append((name, path))
+
+    for parent, entries in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                # normcase: Windows paths are case-insensitive, like Path.exists() there
+                present = {os.path.normcase(entry.name) for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            missing.extend(entries)
+            continue
+        except OSError:  # e.g. no permission to list the parent; check one by one
+            missing.extend(entry for entry in entries if not entry[1].exists())
+            continue
+        missing.extend(
+            entry for entry in entries if os.path.normcase(entry[1].name) not in present
+        )
+
+    return missing
+
+
+# Parsed once per config file and process; later calls return the same AnalysisConfig
+@lru_cache(maxsize=4)
 def load_analysis_config(
     config_path: Optional[Path] = None,
 ) -> AnalysisConfig:
@@ -81,7 +159,8 @@ def load_analysis_config(
         )
         sys.exit(1)
 
-    config = toml.load(config_path)
+    with open(config_path, "rb") as f:
+        config = tomllib.load(f)
     analysis_variables = config.get("analysis_variables", {})
     astrology_variables = analysis_variables.get("astrology_variables", {})
     # === Environment variables & warnings ===
@@ -133,49 +212,49 @@ def load_analysis_config(
             ner_additional_tokensregex_rules_file=mc.get(
                 "ner_additional_tokensregex_rules_file"
             ),
+            onnx_int8=mc.get("onnx_int8"),
+            batch_size=mc.get("batch_size"),
+            quantization=mc.get("quantization"),
+            torch_compile=mc.get("torch_compile"),
+            pipe_disable=mc.get("pipe_disable"),
         )
         for mc in analysis_variables.get("model_configs", [])
     ]
 
     # === Build required paths ===
+    # A key left out of the TOML would otherwise become Path("") ("."), which always exists
+    missing_keys = [key for key in REQUIRED_PATH_KEYS if key not in analysis_variables]
     required_paths = {
-        "idiolect_file_path": Path(analysis_variables.get("idiolect_file_path", "")),
-        "generated_from_corpus_idiotlect_output_path": Path(
-            analysis_variables.get("generated_from_corpus_idiotlect_output_path", "")
-        ),
-        "analysis_output_directory": Path(
-            analysis_variables.get("analysis_output_directory", "")
-        ),
-        "analysis_label_file_path": Path(
-            analysis_variables.get("analysis_label_file_path", "")
-        ),
-        "analysis_questions_file_path": Path(
-            analysis_variables.get("analysis_questions_file_path", "")
-        ),
+        key: Path(analysis_variables.get(key, "")) for key in REQUIRED_PATH_KEYS
     }
 
-    # === Validate required paths ===
-    file_path_check = True
-    for name, path in required_paths.items():
-        if not path.exists():
-            logger.opt(colors=True).error(
-                f"{name}: <RED><white><b>{path}</b></white></RED> path not found."
-            )
-            file_path_check = False
-
-    # === Validate analysis_directories_to_process ===
     process_dirs = [
         Path(p) for p in analysis_variables.get("analysis_directories_to_process", [])
     ]
-    for p in process_dirs:
-        if not p.exists():
-            logger.opt(colors=True).error(
-                f"analysis_directories_to_process: <RED><white><b>{p}</b></white></RED> path not found."
-            )
-            file_path_check = False
 
-    # === Exit if any paths are invalid ===
-    if not file_path_check:
+    # === Validate required paths and analysis_directories_to_process ===
+    # One directory listing per parent folder instead of one stat per path
+    missing_paths = find_missing_paths(
+        [
+            (name, path)
+            for name, path in required_paths.items()
+            if name not in missing_keys
+        ]
+        + [("analysis_directories_to_process", p) for p in process_dirs]
+    )
+
+    # === Exit if any keys or paths are invalid, reporting all of them at once ===
+    if missing_keys or missing_paths:
+        problems = [
+            f"  {key}: <RED><white><b>missing from {config_path.name}</b></white></RED>"
+            for key in missing_keys
+        ] + [
+            f"  {name}: <RED><white><b>{path}</b></white></RED> path not found."
+            for name, path in missing_paths
+        ]
+        logger.opt(colors=True).error(
+            "Invalid analysis configuration:\n" + "\n".join(problems)
+        )
         sys.exit(1)
 
     # === Build and return config ===
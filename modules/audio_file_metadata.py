@@ -2,15 +2,40 @@
 # THIS FILE ALSO GENERATES THE MASTER CSV FILE FOR THE CORPUS
 
 import hashlib
-import re
+import mmap
+import os
+import threading
 from collections import OrderedDict
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional
 from zoneinfo import ZoneInfo
 
 import numpy as np
 from loguru import logger
 from pymediainfo import MediaInfo
 
+try:
+    from blake3 import blake3
+except ImportError:  # optional: pip install blake3
+    blake3 = None
+
+# Files smaller than this are read in one go; mapping them costs more than it saves
+SHA256_MMAP_MIN_BYTES = 1 << 20  # 1 MiB
+
+# Read size when a file has to be hashed in pieces; one buffer per thread, reused across files
+SHA256_READ_BUFFER_BYTES = 1 << 22  # 4 MiB
+_sha256_buffers = threading.local()
+
+# Set CHIMERA_HASH_ALGO=blake3 to identify audio files by a (much faster, multi-threaded) BLAKE3
+# hash; the default stays SHA-256 so existing corpus hashes keep matching. The algorithm is
+# stored next to the hash in the metadata JSON.
+HASH_ALGO = os.environ.get("CHIMERA_HASH_ALGO", "sha256").strip().lower()
+if HASH_ALGO == "blake3" and blake3 is None:
+    logger.warning("CHIMERA_HASH_ALGO=blake3 but blake3 is not installed; using SHA-256")
+    HASH_ALGO = "sha256"
+
 #####################################################################################################################################
 @logger.catch
 def flatten_json(json_data, ignore_keys=None):
@@ -30,11 +55,73 @@ def flatten_json(json_data, ignore_keys=None):
     return flat_data
 #####################################################################################################################################
 
+#####################################################################################################################################
+WEEKDAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+# The two layouts MediaInfo writes its dates in ("2025-07-04 17:18:37", "2025-07-04 22:22:50.460")
+MEDIAINFO_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+MEDIAINFO_DATETIME_MS_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+#####################################################################################################################################
+
+#####################################################################################################################################
+# Fixed-width timestamps are sliced straight into a datetime instead of going through
+# strptime's locale-aware regex machinery; anything else still goes to strptime.
+def parse_mediainfo_datetime(datetime_str, date_format=MEDIAINFO_DATETIME_FORMAT):
+    s = datetime_str
+    if date_format == MEDIAINFO_DATETIME_FORMAT:
+        is_fixed_width = len(s) == 19
+    elif date_format == MEDIAINFO_DATETIME_MS_FORMAT:
+        is_fixed_width = 21 <= len(s) <= 26 and s[19] == "."
+    else:
+        is_fixed_width = False
+
+    if (
+        is_fixed_width
+        and s[4] == s[7] == "-"
+        and s[10] == " "
+        and s[13] == s[16] == ":"
+    ):
+        return datetime(
+            int(s[0:4]),
+            int(s[5:7]),
+            int(s[8:10]),
+            int(s[11:13]),
+            int(s[14:16]),
+            int(s[17:19]),
+            int(s[20:].ljust(6, "0")) if len(s) > 19 else 0,
+        )
+
+    return datetime.strptime(s, date_format)
+#####################################################################################################################################
+
 #####################################################################################################################################
 @logger.catch
 def format_full_datetime(utc_datetime_str, timezone_label):
     # Remove the ' UTC' suffix and parse into datetime
-    dt = datetime.strptime(utc_datetime_str.replace(" UTC", ""), "%Y-%m-%d %H:%M:%S")
+    dt = parse_mediainfo_datetime(utc_datetime_str.replace(" UTC", ""))
 
     # Extract the day and get the correct suffix
     day = dt.day
@@ -43,14 +130,15 @@ def format_full_datetime(utc_datetime_str, timezone_label):
     else:
         suffix = {1: "st", 2: "nd", 3: "rd"}.get(day % 10, "th")
 
-    # Format with zero-padded day and hour (cross-platform safe)
-    formatted = dt.strftime("%A, %B {day}, %Y %I:%M%p").format(day=day)
-
-    # Remove leading zero from the hour (e.g., '05:18PM' -> '5:18PM')
-    formatted = re.sub(r"(\D)0(\d:)", r"\1\2", formatted)
+    # 12-hour clock without a leading zero (e.g., '5:18PM', not '05:18PM')
+    hour12 = dt.hour % 12 or 12
+    ampm = "AM" if dt.hour < 12 else "PM"
 
-    # Add the day suffix
-    formatted = formatted.replace(f"{day},", f"{day}{suffix},")
+    # Built from the datetime fields directly, so the names do not depend on the locale
+    formatted = (
+        f"{WEEKDAY_NAMES[dt.weekday()]}, {MONTH_NAMES[dt.month - 1]} {day}{suffix}, "
+        f"{dt.year} {hour12}:{dt.minute:02d}{ampm}"
+    )
 
     # Add the time zone label
     # full_formatted = f"{formatted} {timezone_label}"
@@ -60,12 +148,60 @@ def format_full_datetime(utc_datetime_str, timezone_label):
     return formatted
 #####################################################################################################################################
 
+#####################################################################################################################################
+# US time zones to check (from zoneinfo available zones, filtered)
+US_ZONE_NAMES = (
+    "America/New_York",  # Eastern Time (UTC-5 or UTC-4 DST)
+    "America/Chicago",  # Central Time (UTC-6 or UTC-5 DST)
+    "America/Denver",  # Mountain Time (UTC-7 or UTC-6 DST)
+    "America/Phoenix",  # Mountain Standard Time (no DST, UTC-7)
+    "America/Los_Angeles",  # Pacific Time (UTC-8 or UTC-7 DST)
+    "America/Anchorage",  # Alaska Time (UTC-9 or UTC-8 DST)
+    "Pacific/Honolulu",  # Hawaii-Aleutian Time (UTC-10 no DST)
+)
+
+# ZoneInfo objects are immutable, so each zone is loaded from tzdata once per process
+US_ZONES = tuple((zone_name, ZoneInfo(zone_name)) for zone_name in US_ZONE_NAMES)
+
+# Friendly names for US zones
+US_ZONE_FRIENDLY_NAMES = {
+    "America/New_York": "Eastern Time",
+    "America/Chicago": "Central Time",
+    "America/Denver": "Mountain Time",
+    "America/Phoenix": "Mountain Standard Time",
+    "America/Los_Angeles": "Pacific Time",
+    "America/Anchorage": "Alaska Time",
+    "Pacific/Honolulu": "Hawaii-Aleutian Time",
+}
+#####################################################################################################################################
+
+#####################################################################################################################################
+# UTC offset in minutes -> first zone in US_ZONE_NAMES with that offset, for one month.
+# None when any of the zones starts or ends DST during the month (the offset then
+# depends on the day and hour, so those months keep the exact per-zone check).
+@lru_cache(maxsize=None)
+def us_offset_table(year, month):
+    month_start = datetime(year, month, 1)
+    month_end = datetime(year + month // 12, month % 12 + 1, 1) - timedelta(minutes=1)
+
+    offset_table = {}
+    for zone_name, tz in US_ZONES:
+        start_offset = month_start.replace(tzinfo=tz).utcoffset()
+        if month_end.replace(tzinfo=tz).utcoffset() != start_offset:
+            return None
+        offset_table.setdefault(int(start_offset.total_seconds() // 60), zone_name)
+
+    return offset_table
+#####################################################################################################################################
+
 #####################################################################################################################################
 @logger.catch
 def get_utc_offset_and_us_timezone(local_str, utc_str):
     # Parse the datetime strings to naive datetime objects
-    local_dt = datetime.strptime(local_str, "%Y-%m-%d %H:%M:%S.%f")
-    utc_dt = datetime.strptime(utc_str.replace(" UTC", ""), "%Y-%m-%d %H:%M:%S.%f")
+    local_dt = parse_mediainfo_datetime(local_str, MEDIAINFO_DATETIME_MS_FORMAT)
+    utc_dt = parse_mediainfo_datetime(
+        utc_str.replace(" UTC", ""), MEDIAINFO_DATETIME_MS_FORMAT
+    )
 
     # Calculate the UTC offset as a timedelta
     offset = local_dt - utc_dt  # timedelta
@@ -78,51 +214,35 @@ def get_utc_offset_and_us_timezone(local_str, utc_str):
     minutes = abs_minutes % 60
     offset_str = f"{sign}{hours}:{minutes:02d}"
 
-    # US time zones to check (from zoneinfo available zones, filtered)
-    us_zones = [
-        "America/New_York",  # Eastern Time (UTC-5 or UTC-4 DST)
-        "America/Chicago",  # Central Time (UTC-6 or UTC-5 DST)
-        "America/Denver",  # Mountain Time (UTC-7 or UTC-6 DST)
-        "America/Phoenix",  # Mountain Standard Time (no DST, UTC-7)
-        "America/Los_Angeles",  # Pacific Time (UTC-8 or UTC-7 DST)
-        "America/Anchorage",  # Alaska Time (UTC-9 or UTC-8 DST)
-        "Pacific/Honolulu",  # Hawaii-Aleutian Time (UTC-10 no DST)
-    ]
-
     # Find which US time zone matches the offset at the local datetime
     matched_zone = None
-    for zone_name in us_zones:
-        tz = ZoneInfo(zone_name)
-        # Attach tzinfo to local_dt without changing the clock time (assume local_dt is in that timezone)
-        local_dt_tz = local_dt.replace(tzinfo=tz)
-        # Calculate offset from tzinfo
-        tz_offset = local_dt_tz.utcoffset()
-        if tz_offset == offset:
-            matched_zone = zone_name
-            break
+    offset_table = us_offset_table(local_dt.year, local_dt.month)
+    if offset_table is not None:
+        # Zone offsets are whole minutes, so anything else cannot match exactly
+        if offset == timedelta(minutes=total_minutes):
+            matched_zone = offset_table.get(total_minutes)
+    else:
+        # A DST change falls inside this month; check every zone at the exact time
+        for zone_name, tz in US_ZONES:
+            # Attach tzinfo to local_dt without changing the clock time (assume local_dt is in that timezone)
+            local_dt_tz = local_dt.replace(tzinfo=tz)
+            # Calculate offset from tzinfo
+            tz_offset = local_dt_tz.utcoffset()
+            if tz_offset == offset:
+                matched_zone = zone_name
+                break
 
     # If no exact match, fallback to closest zone by difference in offset (optional)
     if matched_zone is None:
 
-        def offset_diff(zone_name):
-            tz = ZoneInfo(zone_name)
-            local_dt_tz = local_dt.replace(tzinfo=tz)
+        def offset_diff(zone):
+            local_dt_tz = local_dt.replace(tzinfo=zone[1])
             tz_offset = local_dt_tz.utcoffset()
             return abs((tz_offset - offset).total_seconds())
 
-        matched_zone = min(us_zones, key=offset_diff)
-
-    # Friendly names for US zones
-    friendly_names = {
-        "America/New_York": "Eastern Time",
-        "America/Chicago": "Central Time",
-        "America/Denver": "Mountain Time",
-        "America/Phoenix": "Mountain Standard Time",
-        "America/Los_Angeles": "Pacific Time",
-        "America/Anchorage": "Alaska Time",
-        "Pacific/Honolulu": "Hawaii-Aleutian Time",
-    }
-    friendly_name = friendly_names.get(matched_zone, "Unknown Time")
+        matched_zone = min(US_ZONES, key=offset_diff)[0]
+
+    friendly_name = US_ZONE_FRIENDLY_NAMES.get(matched_zone, "Unknown Time")
 
     return offset_str, matched_zone, friendly_name
 #####################################################################################################################################
@@ -132,137 +252,327 @@ def get_utc_offset_and_us_timezone(local_str, utc_str):
 @logger.catch
 def compute_sha256(file_path):
     logger.info("Calculating SHA256...")
-    sha256 = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for block in iter(lambda: f.read(65536), b""):
-            sha256.update(block)
+    # Unbuffered: every read goes straight into our own buffer, without an extra copy
+    with open(file_path, "rb", buffering=0) as f:
+        file_size = os.fstat(f.fileno()).st_size
+        if file_size < SHA256_MMAP_MIN_BYTES:
+            return hashlib.sha256(f.read()).hexdigest()
+
+        # Hash the whole mapped file in one update() call; the OS pages it in as it is read
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        except (OSError, ValueError, OverflowError):
+            # Cannot be mapped (e.g. larger than the address space on 32-bit Python)
+            pass
+
+        buffer = getattr(_sha256_buffers, "buffer", None)
+        if buffer is None:
+            buffer = _sha256_buffers.buffer = bytearray(SHA256_READ_BUFFER_BYTES)
+        view = memoryview(buffer)
+
+        sha256 = hashlib.sha256()
+        while bytes_read := f.readinto(buffer):
+            sha256.update(view[:bytes_read])
     return sha256.hexdigest()
 #####################################################################################################################################
 
 #####################################################################################################################################
 @logger.catch
-def extract_mp3_info(file_path, sha256_hash):
-    file_general_file_name_extension = ""
-    file_general_complete_name = ""
-    file_general_folder_name = ""
-    file_general_number_of_audio_streams = ""
-    file_general_number_of_image_streams = ""
-    file_general_audio_codec = ""
-    file_general_image_codec = ""
-    file_general_internet_media_type = ""
-    file_general_total_file_size_in_bytes = ""
-    other_file_size_list = ""
-    file_general_total_file_size_pretty = ""
-    file_general_total_duration_in_milliseconds = ""
-    general_other_duration_list = ""
-    file_general_total_duration_timestamp = ""
-    file_general_overall_bitrate = ""
-    other_overall_bit_rate_list = ""
-    file_general_overall_bitrate_pretty = ""
-    file_general_stream_size_in_bytes = ""
-    other_stream_size_list = ""
-    file_general_stream_size_pretty = ""
-    file_general_proportion_of_this_stream = ""
+def compute_blake3(file_path):
+    logger.info("Calculating BLAKE3...")
+    if os.path.getsize(file_path) < SHA256_MMAP_MIN_BYTES:
+        with open(file_path, "rb") as f:
+            return blake3(f.read()).hexdigest()
+
+    # Maps the file itself and hashes it on all cores, without a Python read loop
+    hasher = blake3(max_threads=blake3.AUTO)
+    hasher.update_mmap(file_path)
+    return hasher.hexdigest()
+#####################################################################################################################################
+
+#####################################################################################################################################
+@logger.catch
+def compute_content_hash(file_path, algo=HASH_ALGO):
+    if algo == "blake3" and blake3 is not None:
+        return "blake3", compute_blake3(file_path)
+
+    return "sha256", compute_sha256(file_path)
+#####################################################################################################################################
+
+#####################################################################################################################################
+# Every value extract_mp3_info reads from MediaInfo's tracks; one slotted instance per file
+# replaces a function-local variable per field. "" marks a value the file did not have.
+@dataclass(slots=True)
+class Mp3Fields:
+    file_general_file_name_extension: Optional[str] = ""
+    file_general_complete_name: Optional[str] = ""
+    file_general_folder_name: Optional[str] = ""
+    file_general_number_of_audio_streams: Optional[str] = ""
+    file_general_number_of_image_streams: Optional[str] = ""
+    file_general_audio_codec: Optional[str] = ""
+    file_general_image_codec: Optional[str] = ""
+    file_general_internet_media_type: Optional[str] = ""
+    file_general_total_file_size_in_bytes: Optional[str] = ""
+    file_general_total_file_size_pretty: Optional[str] = ""
+    file_general_total_duration_in_milliseconds: Optional[str] = ""
+    file_general_total_duration_timestamp: Optional[str] = ""
+    file_general_overall_bitrate: Optional[str] = ""
+    file_general_overall_bitrate_pretty: Optional[str] = ""
+    file_general_stream_size_in_bytes: Optional[str] = ""
+    file_general_stream_size_pretty: Optional[str] = ""
+    file_general_proportion_of_this_stream: Optional[str] = ""
 
     ###########################################
     # FILE DATE SPECIFIC DATA
-    file_general_recorded_date_utc = ""
-    file_general_tagged_date_utc = ""
-    file_general_file_creation_date_utc = ""
-    file_general_file_creation_date__local = ""
-    file_gerneral_file_last_modification_date_utc = ""
-    file_general_file_last_modification_date__local = ""
+    file_general_recorded_date_utc: Optional[str] = ""
+    file_general_tagged_date_utc: Optional[str] = ""
+    file_general_file_creation_date_utc: Optional[str] = ""
+    file_general_file_creation_date__local: Optional[str] = ""
+    file_gerneral_file_last_modification_date_utc: Optional[str] = ""
+    file_general_file_last_modification_date__local: Optional[str] = ""
 
     ###########################################
     # TRACK SPECIFIC DATA
-    file_general_track_title = ""
-    file_general_track_album = ""
-    file_general_track_album_performer = ""
-    file_general_track_name = ""
-    file_general_track_name_position = ""
-    file_general_track_name_total = ""
-    file_general_track_more = ""
-    file_general_track_grouping = ""
-    file_general_track_performer = ""
-    file_general_track_genre = ""
+    file_general_track_title: Optional[str] = ""
+    file_general_track_album: Optional[str] = ""
+    file_general_track_album_performer: Optional[str] = ""
+    file_general_track_name: Optional[str] = ""
+    file_general_track_name_position: Optional[str] = ""
+    file_general_track_name_total: Optional[str] = ""
+    file_general_track_more: Optional[str] = ""
+    file_general_track_grouping: Optional[str] = ""
+    file_general_track_performer: Optional[str] = ""
+    file_general_track_genre: Optional[str] = ""
 
     ###########################################
     # MISC GENERAL DATA
-    file_general_track_writing_library = ""
-    file_general_comment = ""
-    file_general_id3v1_comment = ""
+    file_general_track_writing_library: Optional[str] = ""
+    file_general_comment: Optional[str] = ""
+    file_general_id3v1_comment: Optional[str] = ""
 
     ###########################################
     #  TRANSCRIPT GENERAL DATA
-    file_general_lyrics = ""
-    file_general_original_filename = ""
+    file_general_lyrics: Optional[str] = ""
+    file_general_original_filename: Optional[str] = ""
 
     ###########################################
     # GENERAL COVER ART DATA
-    file_general_has_cover = ""
-    file_general_cover_description = ""
-    file_general_cover_type = ""
-    file_general_cover_mime = ""
+    file_general_has_cover: Optional[str] = ""
+    file_general_cover_description: Optional[str] = ""
+    file_general_cover_type: Optional[str] = ""
+    file_general_cover_mime: Optional[str] = ""
 
     ###########################################
     # AUDIO STREAM SPECIFIC DATA
-    file_audio_commercial_name = ""
-    file_audio_format_version = ""
-    file_audio_format_profile = ""
-    file_audio_total_duration_in_milliseconds = ""
-    audio_other_duration_list = ""
-    file_audio_total_duration_timestamp = ""
-    file_audio_bit_rate_mode = ""
-    audio_other_bit_rate_mode_list = ""
-    file_audio_bit_rate_mode_pretty = ""
-    file_audio_bit_rate = ""
-    audio_other_bit_rate_list = ""
-    file_audio_bit_rate_pretty = ""
-    file_audio_channel_s = ""
-    audio_other_channel_s_list = ""
-    file_audio_channel_s_pretty = ""
-    file_audio_samples_per_frame = ""
-    file_audio_sampling_rate = ""
-    audio_other_sampling_rate_list = ""
-    file_audio_sampling_rate_pretty = ""
-    file_audio_samples_count = ""
-    file_audio_frame_rate = ""
-    audio_other_frame_rate_list = ""
-    file_audio_frame_rate_pretty = ""
-    file_audio_frame_count = ""
-    file_audio_compression_mode = ""
-    file_audio_stream_size_in_bytes = ""
-    audio_other_stream_size_list = ""
-    file_audio_stream_size_pretty = ""
-    file_audio_proportion_of_this_stream = ""
+    file_audio_commercial_name: Optional[str] = ""
+    file_audio_format_version: Optional[str] = ""
+    file_audio_format_profile: Optional[str] = ""
+    file_audio_total_duration_in_milliseconds: Optional[str] = ""
+    file_audio_total_duration_timestamp: Optional[str] = ""
+    file_audio_bit_rate_mode: Optional[str] = ""
+    file_audio_bit_rate_mode_pretty: Optional[str] = ""
+    file_audio_bit_rate: Optional[str] = ""
+    file_audio_bit_rate_pretty: Optional[str] = ""
+    file_audio_channel_s: Optional[str] = ""
+    file_audio_channel_s_pretty: Optional[str] = ""
+    file_audio_samples_per_frame: Optional[str] = ""
+    file_audio_sampling_rate: Optional[str] = ""
+    file_audio_sampling_rate_pretty: Optional[str] = ""
+    file_audio_samples_count: Optional[str] = ""
+    file_audio_frame_rate: Optional[str] = ""
+    file_audio_frame_rate_pretty: Optional[str] = ""
+    file_audio_frame_count: Optional[str] = ""
+    file_audio_compression_mode: Optional[str] = ""
+    file_audio_stream_size_in_bytes: Optional[str] = ""
+    file_audio_stream_size_pretty: Optional[str] = ""
+    file_audio_proportion_of_this_stream: Optional[str] = ""
 
     ###########################################
     # IMAGE STREAM SPECIFIC DATA
-    file_image_format_info = ""
-    file_image_commercial_name = ""
-    file_image_compression = ""
-    file_image_format_settings = ""
-    file_image_internet_media_type = ""
-    file_image_width = ""
-    file_image_height = ""
-    file_image_pixel_aspect_ratio = ""
-    file_image_display_aspect_ratio = ""
-    file_image_color_space = ""
-    file_image_bit_depth = ""
-    image_other_bit_depth_list = ""
-    file_image_bit_depth_pretty = ""
-    file_image_compression_mode = ""
-    file_image_stream_size_in_bytes = ""
-    image_other_stream_size = ""
-    file_image_stream_size_pretty = ""
-    file_image_proportion_of_this_stream = ""
-    full_recording_date_and_time = ""
-
-    utc_offset = ""
-    matched_tz = ""
-    tz_friendly_name = ""
-
-    full_recording_date_and_time = ""
+    file_image_format_info: Optional[str] = ""
+    file_image_commercial_name: Optional[str] = ""
+    file_image_compression: Optional[str] = ""
+    file_image_format_settings: Optional[str] = ""
+    file_image_internet_media_type: Optional[str] = ""
+    file_image_width: Optional[str] = ""
+    file_image_height: Optional[str] = ""
+    file_image_pixel_aspect_ratio: Optional[str] = ""
+    file_image_display_aspect_ratio: Optional[str] = ""
+    file_image_color_space: Optional[str] = ""
+    file_image_bit_depth: Optional[str] = ""
+    file_image_bit_depth_pretty: Optional[str] = ""
+    file_image_compression_mode: Optional[str] = ""
+    file_image_stream_size_in_bytes: Optional[str] = ""
+    file_image_stream_size_pretty: Optional[str] = ""
+    file_image_proportion_of_this_stream: Optional[str] = ""
+#####################################################################################################################################
+
+#####################################################################################################################################
+# (MediaInfo key, Mp3Fields attribute) pairs copied straight across for each track type
+_GENERAL_FIELDS = (
+    ###########################################
+    # TECHNICAL FILE SPECIFIC DATA
+    ("file_name_extension", "file_general_file_name_extension"),  # 2025-07-04 - 17-18-37 - 2025-07-04 - 17-19-06 - 29 - audio journal - TEST.mp3
+    ("complete_name", "file_general_complete_name"),  # C:\\temp\\audio_temp\\mp3_metadata_test\\2025-07-04 - 17-18-37 - 2025-07-04 - 17-19-06 - 29 - audio journal - TEST.mp3
+    ("folder_name", "file_general_folder_name"),  # C:\\temp\\audio_temp\\mp3_metadata_test
+    ("count_of_audio_streams", "file_general_number_of_audio_streams"),  # 1
+    ("count_of_image_streams", "file_general_number_of_image_streams"),  # 1
+    ("audio_codecs", "file_general_audio_codec"),  # MPEG Audio
+    ("codecs_image", "file_general_image_codec"),  # PNG
+    ("internet_media_type", "file_general_internet_media_type"),  # audio/mpeg
+    ("file_size", "file_general_total_file_size_in_bytes"),  # 702945
+    ("duration", "file_general_total_duration_in_milliseconds"),  # 29387
+    ("overall_bit_rate", "file_general_overall_bitrate"),  # 128000
+    ("stream_size", "file_general_stream_size_in_bytes"),
+    ("proportion_of_this_stream", "file_general_proportion_of_this_stream"),  # Raw number that could be converted to percentage (0.33110)
+    ###########################################
+    # FILE DATE SPECIFIC DATA
+    ("recorded_date", "file_general_recorded_date_utc"),  # 2025-07-04 17:18:37 UTC
+    ("tagged_date", "file_general_tagged_date_utc"),  # 2025-07-05 15:21:07 UTC
+    ("file_creation_date", "file_general_file_creation_date_utc"),  # 2025-07-04 22:22:50.460 UTC
+    ("file_creation_date__local", "file_general_file_creation_date__local"),  # 2025-07-04 17:22:50.460
+    ("file_last_modification_date", "file_gerneral_file_last_modification_date_utc"),  # 2025-07-05 20:21:10.740 UTC
+    ("file_last_modification_date__local", "file_general_file_last_modification_date__local"),  # 2025-07-05 15:21:10.740
+    ###########################################
+    # TRACK SPECIFIC DATA
+    ("title", "file_general_track_title"),  # 2025-07-04 - 17-18-37 - 2025-07-04 - 17-19-06
+    ("album", "file_general_track_album"),  # 2025-07-04 / What is the date this audio journal is related to?
+    ("album_performer", "file_general_track_album_performer"),  # The Real Zack Olinger / Who performed this album?
+    ("track_name", "file_general_track_name"),  # 2025-07-04 - 17-18-37 - 2025-07-04 - 17-19-06
+    ("track_name_position", "file_general_track_name_position"),  # 2 / Which track is this on this album?
+    ("track_name_total", "file_general_track_name_total"),  # 2 / How many tracks total on this album?
+    ("track_more", "file_general_track_more"),  # 07 / What month of the year is this track from?
+    ("grouping", "file_general_track_grouping"),  # 2025  / What year is this track from?
+    ("performer", "file_general_track_performer"),  # The Real Zack Olinger / Who performed this track?
+    ("genre", "file_general_track_genre"),  # Audio Journal
+    ###########################################
+    # MISC GENERAL DATA
+    ("writing_library", "file_general_track_writing_library"),  # LAME3.10
+    ("comment", "file_general_comment"),  # 29 - audio journal - TEST / What is left of the original file name?
+    ("id3v1_comment", "file_general_id3v1_comment"),  # 29 - audio journal - TEST / What is left of the original file name?
+    ###########################################
+    #  TRANSCRIPT GENERAL DATA
+    ("lyrics", "file_general_lyrics"),  # Embeded transcript text
+    ("original_filename", "file_general_original_filename"),  # 2025-07-04 - 17-18-37 - 2025-07-04 - 17-19-06 - 29 - audio journal - TEST - large-v2 - SR.txt / Where did the text for the transcript comee from?
+    ###########################################
+    # GENERAL COVER ART DATA
+    ("cover", "file_general_has_cover"),  # Yes / No
+    ("cover_description", "file_general_cover_description"),  # Cover
+    ("cover_type", "file_general_cover_type"),  # Cover (front)
+    ("cover_mime", "file_general_cover_mime"),  # image/png
+)
+
+_AUDIO_FIELDS = (
+    ("commercial_name", "file_audio_commercial_name"),  # MPEG Audio
+    ("format_version", "file_audio_format_version"),  # Version 1
+    ("format_profile", "file_audio_format_profile"),  # Layer 3
+    ("duration", "file_audio_total_duration_in_milliseconds"),  # 29388
+    ("bit_rate_mode", "file_audio_bit_rate_mode"),  # CBR
+    ("bit_rate", "file_audio_bit_rate"),  # 128000
+    ("channel_s", "file_audio_channel_s"),  # 1
+    ("samples_per_frame", "file_audio_samples_per_frame"),  # 1152
+    ("sampling_rate", "file_audio_sampling_rate"),  # 44100
+    ("samples_count", "file_audio_samples_count"),  # 1296000
+    ("frame_rate", "file_audio_frame_rate"),  # 38.281
+    ("frame_count", "file_audio_frame_count"),  # 1125
+    ("compression_mode", "file_audio_compression_mode"),  # Lossy
+    ("stream_size", "file_audio_stream_size_in_bytes"),  # 470203
+    ("proportion_of_this_stream", "file_audio_proportion_of_this_stream"),  # 0.66890
+)
+
+_IMAGE_FIELDS = (
+    ("format_info", "file_image_format_info"),  # Portable Network Graphic
+    ("commercial_name", "file_image_commercial_name"),  # PNG
+    ("compression", "file_image_compression"),  # Deflate
+    ("format_settings", "file_image_format_settings"),  # Linear
+    ("internet_media_type", "file_image_internet_media_type"),  # image/png
+    ("width", "file_image_width"),  # 3200
+    ("height", "file_image_height"),  # 3200
+    ("pixel_aspect_ratio", "file_image_pixel_aspect_ratio"),  # 1.000
+    ("display_aspect_ratio", "file_image_display_aspect_ratio"),  # 1.000
+    ("color_space", "file_image_color_space"),  # RGB
+    ("bit_depth", "file_image_bit_depth"),  # 8
+    ("compression_mode", "file_image_compression_mode"),  # Lossless
+    ("stream_size", "file_image_stream_size_in_bytes"),  # 230064
+    ("proportion_of_this_stream", "file_image_proportion_of_this_stream"),  # 0.32729
+)
+
+# (MediaInfo "other_*" list key, index of the human readable entry, Mp3Fields attribute)
+_GENERAL_PRETTY_FIELDS = (
+    ("other_file_size", 4, "file_general_total_file_size_pretty"),  # 686.5 KiB
+    ("other_duration", 4, "file_general_total_duration_timestamp"),  # 00:00:29.387
+    ("other_overall_bit_rate", 0, "file_general_overall_bitrate_pretty"),  # 128 kb/s
+    ("other_stream_size", 0, "file_general_stream_size_pretty"),  # 227 KiB (33%)
+)
+
+_AUDIO_PRETTY_FIELDS = (
+    ("other_bit_rate_mode", 0, "file_audio_bit_rate_mode_pretty"),  # Constant
+    ("other_bit_rate", 0, "file_audio_bit_rate_pretty"),  # 128 kb/s
+    ("other_channel_s", 0, "file_audio_channel_s_pretty"),  # 1 channel
+    ("other_sampling_rate", 0, "file_audio_sampling_rate_pretty"),  # 44.1 kHz
+    ("other_frame_rate", 0, "file_audio_frame_rate_pretty"),  # 38.281 FPS (1152 SPF)
+    ("other_stream_size", 4, "file_audio_stream_size_pretty"),  # 459.2 KiB
+)
+
+_IMAGE_PRETTY_FIELDS = (
+    ("other_bit_depth", 0, "file_image_bit_depth_pretty"),  # 8 bits
+    ("other_stream_size", 4, "file_image_stream_size_pretty"),  # 224.7 KiB
+)
+#####################################################################################################################################
+
+#####################################################################################################################################
+# The track helpers below run once per track inside extract_mp3_info, whose @logger.catch
+# handles any failure; a bad track fails the whole file instead of leaving it half filled
+def copy_track_fields(track, fields, field_pairs, pretty_fields):
+    for src, dst in field_pairs:
+        setattr(fields, dst, track.get(src, None))
+
+    for src, index, dst in pretty_fields:
+        other_values = track.get(src, [])
+        if len(other_values) > 0:
+            setattr(fields, dst, other_values[index])
+#####################################################################################################################################
+
+#####################################################################################################################################
+def _extract_general(track, fields):
+    copy_track_fields(track, fields, _GENERAL_FIELDS, _GENERAL_PRETTY_FIELDS)
+#####################################################################################################################################
+
+#####################################################################################################################################
+def _extract_audio(track, fields):
+    copy_track_fields(track, fields, _AUDIO_FIELDS, _AUDIO_PRETTY_FIELDS)
+
+    # MediaInfo always reports an audio duration, so this one is not guarded
+    audio_other_duration_list = track.get("other_duration", None)
+    fields.file_audio_total_duration_timestamp = audio_other_duration_list[
+        4
+    ]  # 00:00:29.388
+#####################################################################################################################################
+
+#####################################################################################################################################
+def _extract_image(track, fields):
+    copy_track_fields(track, fields, _IMAGE_FIELDS, _IMAGE_PRETTY_FIELDS)
+#####################################################################################################################################
+
+#####################################################################################################################################
+def _skip_track(track, fields):
+    # Menu / Text / Other tracks carry nothing that goes into the metadata JSON
+    pass
+#####################################################################################################################################
+
+#####################################################################################################################################
+_TRACK_HANDLERS = {
+    "General": _extract_general,
+    "Audio": _extract_audio,
+    "Image": _extract_image,
+}
+#####################################################################################################################################
+
+#####################################################################################################################################
+@logger.catch
+def extract_mp3_info(file_path, hash_algo, content_hash):
+    fields = Mp3Fields()
 
     logger.info("Extracting media info...")
     media_info_obj = MediaInfo.parse(file_path)
@@ -271,370 +581,125 @@ def extract_mp3_info(file_path, sha256_hash):
     tracks = media_info.get("tracks", [])
 
     for track in tracks:
-        if track.get("track_type") == "General":
-
-            ###########################################
-            # TECHNICAL FILE SPECIFIC DATA
-
-            file_general_file_name_extension = track.get(
-                "file_name_extension", None
-            )  # 2025-07-04 - 17-18-37 - 2025-07-04 - 17-19-06 - 29 - audio journal - TEST.mp3
-
-            file_general_complete_name = track.get(
-                "complete_name", None
-            )  # C:\\temp\\audio_temp\\mp3_metadata_test\\2025-07-04 - 17-18-37 - 2025-07-04 - 17-19-06 - 29 - audio journal - TEST.mp3
-
-            file_general_folder_name = track.get(
-                "folder_name", None
-            )  # C:\\temp\\audio_temp\\mp3_metadata_test
-
-            file_general_number_of_audio_streams = track.get(
-                "count_of_audio_streams", None
-            )  # 1
-            file_general_number_of_image_streams = track.get(
-                "count_of_image_streams", None
-            )  # 1
-            file_general_audio_codec = track.get("audio_codecs", None)  # MPEG Audio
-            file_general_image_codec = track.get("codecs_image", None)  # PNG
-            file_general_internet_media_type = track.get(
-                "internet_media_type", None
-            )  # audio/mpeg
-
-            file_general_total_file_size_in_bytes = track.get(
-                "file_size", None
-            )  # 702945
-            other_file_size_list = track.get("other_file_size", [])
-            if len(other_file_size_list) > 0:
-                file_general_total_file_size_pretty = other_file_size_list[4]  # 686.5 KiB
-
-            file_general_total_duration_in_milliseconds = track.get("duration")  # 29387
-            general_other_duration_list = track.get("other_duration", [])
-            if len(general_other_duration_list) > 0:
-                file_general_total_duration_timestamp = general_other_duration_list[
-                    4
-                ]  # 00:00:29.387
-
-            file_general_overall_bitrate = track.get("overall_bit_rate", None)  # 128000
-            other_overall_bit_rate_list = track.get("other_overall_bit_rate", [])
-            if len(other_overall_bit_rate_list) > 0:
-                file_general_overall_bitrate_pretty = other_overall_bit_rate_list[
-                    0
-                ]  # 128 kb/s
-
-            file_general_stream_size_in_bytes = track.get("stream_size", None)
-            other_stream_size_list = track.get("other_stream_size", [])
-            if len(other_stream_size_list) > 0:
-                file_general_stream_size_pretty = other_stream_size_list[0]  # 227 KiB (33%)
-
-            file_general_proportion_of_this_stream = track.get(
-                "proportion_of_this_stream", None
-            )  # Raw number that could be converted to percentage (0.33110)
-
-            ###########################################
-            # FILE DATE SPECIFIC DATA
-            file_general_recorded_date_utc = track.get(
-                "recorded_date", None
-            )  # 2025-07-04 17:18:37 UTC
-            file_general_tagged_date_utc = track.get(
-                "tagged_date", None
-            )  # 2025-07-05 15:21:07 UTC
-            file_general_file_creation_date_utc = track.get(
-                "file_creation_date", None
-            )  # 2025-07-04 22:22:50.460 UTC
-            file_general_file_creation_date__local = track.get(
-                "file_creation_date__local", None
-            )  # 2025-07-04 17:22:50.460
-            file_gerneral_file_last_modification_date_utc = track.get(
-                "file_last_modification_date", None
-            )  # 2025-07-05 20:21:10.740 UTC
-            file_general_file_last_modification_date__local = track.get(
-                "file_last_modification_date__local", None
-            )  # 2025-07-05 15:21:10.740
-
-            ###########################################
-            # TRACK SPECIFIC DATA
-            file_general_track_title = track.get(
-                "title", None
-            )  # 2025-07-04 - 17-18-37 - 2025-07-04 - 17-19-06
-            file_general_track_album = track.get(
-                "album", None
-            )  # 2025-07-04 / What is the date this audio journal is related to?
-            file_general_track_album_performer = track.get(
-                "album_performer", None
-            )  # The Real Zack Olinger / Who performed this album?
-            file_general_track_name = track.get(
-                "track_name", None
-            )  # 2025-07-04 - 17-18-37 - 2025-07-04 - 17-19-06
-            file_general_track_name_position = track.get(
-                "track_name_position", None
-            )  # 2 / Which track is this on this album?
-            file_general_track_name_total = track.get(
-                "track_name_total", None
-            )  # 2 / How many tracks total on this album?
-
-            file_general_track_more = track.get(
-                "track_more", None
-            )  # 07 / What month of the year is this track from?
-
-            file_general_track_grouping = track.get(
-                "grouping", None
-            )  # 2025  / What year is this track from?
-            file_general_track_performer = track.get(
-                "performer", None
-            )  # The Real Zack Olinger / Who performed this track?
-
-            file_general_track_genre = track.get("genre", None)  # Audio Journal
-
-            ###########################################
-            # MISC GENERAL DATA
-            file_general_track_writing_library = track.get(
-                "writing_library", None
-            )  # LAME3.10
-
-            file_general_comment = track.get(
-                "comment", None
-            )  # 29 - audio journal - TEST / What is left of the original file name?
-            file_general_id3v1_comment = track.get(
-                "id3v1_comment", None
-            )  # 29 - audio journal - TEST / What is left of the original file name?
-
-            ###########################################
-            #  TRANSCRIPT GENERAL DATA
-            file_general_lyrics = track.get("lyrics", None)  # Embeded transcript text
-            file_general_original_filename = track.get(
-                "original_filename", None
-            )  # 2025-07-04 - 17-18-37 - 2025-07-04 - 17-19-06 - 29 - audio journal - TEST - large-v2 - SR.txt / Where did the text for the transcript comee from?
-
-            ###########################################
-            # GENERAL COVER ART DATA
-            file_general_has_cover = track.get("cover", None)  # Yes / No
-            file_general_cover_description = track.get(
-                "cover_description", None
-            )  # Cover
-            file_general_cover_type = track.get("cover_type", None)  # Cover (front)
-            file_general_cover_mime = track.get("cover_mime", None)  # image/png
-
-        if track.get("track_type") == "Audio":
-
-            ###########################################
-            # AUDIO STREAM SPECIFIC DATA
-            file_audio_commercial_name = track.get(
-                "commercial_name", None
-            )  # MPEG Audio
-            file_audio_format_version = track.get("format_version", None)  # Version 1
-            file_audio_format_profile = track.get("format_profile", None)  # Layer 3
-            file_audio_total_duration_in_milliseconds = track.get(
-                "duration", None
-            )  # 29388
-            audio_other_duration_list = track.get("other_duration", None)
-            file_audio_total_duration_timestamp = audio_other_duration_list[
-                4
-            ]  # 00:00:29.388
-
-            file_audio_bit_rate_mode = track.get("bit_rate_mode", None)  # CBR
-            audio_other_bit_rate_mode_list = track.get("other_bit_rate_mode", [])
-            if len(audio_other_bit_rate_mode_list) > 0:
-                file_audio_bit_rate_mode_pretty = audio_other_bit_rate_mode_list[
-                    0
-                ]  # Constant
-
-            file_audio_bit_rate = track.get("bit_rate", None)  # 128000
-            audio_other_bit_rate_list = track.get("other_bit_rate", [])
-            if len(audio_other_bit_rate_list) > 0:
-                file_audio_bit_rate_pretty = audio_other_bit_rate_list[0]  # 128 kb/s
-
-            file_audio_channel_s = track.get("channel_s", None)  # 1
-            audio_other_channel_s_list = track.get("other_channel_s", [])
-            if len(audio_other_channel_s_list) > 0:
-                file_audio_channel_s_pretty = audio_other_channel_s_list[0]  # 1 channel
-
-            file_audio_samples_per_frame = track.get("samples_per_frame", None)  # 1152
-
-            file_audio_sampling_rate = track.get("sampling_rate", None)  # 44100
-            audio_other_sampling_rate_list = track.get("other_sampling_rate", [])
-            if len(audio_other_sampling_rate_list) > 0:
-                file_audio_sampling_rate_pretty = audio_other_sampling_rate_list[
-                    0
-                ]  # 44.1 kHz
-
-            file_audio_samples_count = track.get("samples_count", None)  # 1296000
-
-            file_audio_frame_rate = track.get("frame_rate", None)  # 38.281
-            audio_other_frame_rate_list = track.get("other_frame_rate", [])
-            if len(audio_other_frame_rate_list) > 0:
-                file_audio_frame_rate_pretty = audio_other_frame_rate_list[
-                    0
-                ]  # 38.281 FPS (1152 SPF)
-
-            file_audio_frame_count = track.get("frame_count", None)  # 1125
-            file_audio_compression_mode = track.get("compression_mode", None)  # Lossy
-
-            file_audio_stream_size_in_bytes = track.get("stream_size", None)  # 470203
-            audio_other_stream_size_list = track.get("other_stream_size", [])
-            if len(audio_other_stream_size_list) > 0:
-                file_audio_stream_size_pretty = audio_other_stream_size_list[4]  # 459.2 KiB
-
-            file_audio_proportion_of_this_stream = track.get(
-                "proportion_of_this_stream", None
-            )  # 0.66890
-
-        if track.get("track_type") == "Image":
-
-            ###########################################
-            # IMAGE STREAM SPECIFIC DATA
-
-            file_image_format_info = track.get(
-                "format_info", None
-            )  # Portable Network Graphic
-            file_image_commercial_name = track.get("commercial_name", None)  # PNG
-            file_image_compression = track.get("compression", None)  # Deflate
-            file_image_format_settings = track.get("format_settings", None)  # Linear
-            file_image_internet_media_type = track.get(
-                "internet_media_type", None
-            )  # image/png
-            file_image_width = track.get("width", None)  # 3200
-            file_image_height = track.get("height", None)  # 3200
-            file_image_pixel_aspect_ratio = track.get(
-                "pixel_aspect_ratio", None
-            )  # 1.000
-            file_image_display_aspect_ratio = track.get(
-                "display_aspect_ratio", None
-            )  # 1.000
-            file_image_color_space = track.get("color_space", None)  # RGB
-
-            file_image_bit_depth = track.get("bit_depth", None)  # 8
-            image_other_bit_depth_list = track.get("other_bit_depth", [])
-            if len(image_other_bit_depth_list) > 0:
-                file_image_bit_depth_pretty = image_other_bit_depth_list[0]  # 8 bits
-
-            file_image_compression_mode = track.get(
-                "compression_mode", None
-            )  # Lossless
-
-            file_image_stream_size_in_bytes = track.get("stream_size", None)  # 230064
-            image_other_stream_size = track.get("other_stream_size", [])
-            if len(image_other_stream_size) > 0:
-                file_image_stream_size_pretty = image_other_stream_size[4]  # 224.7 KiB
-
-            file_image_proportion_of_this_stream = track.get(
-                "proportion_of_this_stream", None
-            )  # 0.32729
+        _TRACK_HANDLERS.get(track.get("track_type"), _skip_track)(track, fields)
 
     utc_offset, matched_tz, tz_friendly_name = get_utc_offset_and_us_timezone(
-        file_general_file_creation_date__local, file_general_file_creation_date_utc
+        fields.file_general_file_creation_date__local,
+        fields.file_general_file_creation_date_utc,
     )
 
     full_recording_date_and_time = format_full_datetime(
-        file_general_recorded_date_utc, tz_friendly_name
+        fields.file_general_recorded_date_utc, tz_friendly_name
     )
 
     transcript_dict = {
-        "file_general_lyrics": file_general_lyrics,
-        "file_general_original_filename": file_general_original_filename,
+        "file_general_lyrics": fields.file_general_lyrics,
+        "file_general_original_filename": fields.file_general_original_filename,
     }
 
     random_raw_values = {
-        "file_image_bit_depth": file_image_bit_depth,
-        "file_image_stream_size_in_bytes": file_image_stream_size_in_bytes,
-        "file_image_internet_media_type": file_image_internet_media_type,
-        "file_image_commercial_name": file_image_commercial_name,
-        "file_audio_stream_size_in_bytes": file_audio_stream_size_in_bytes,
-        "file_audio_frame_rate": file_audio_frame_rate,
-        "file_audio_sampling_rate": file_audio_sampling_rate,
-        "file_audio_channel_s": file_audio_channel_s,
-        "file_audio_bit_rate": file_audio_bit_rate,
-        "file_audio_bit_rate_mode_pretty": file_audio_bit_rate_mode_pretty,
-        "file_audio_total_duration_in_milliseconds": file_audio_total_duration_in_milliseconds,
-        "file_general_total_file_size_in_bytes": file_general_total_file_size_in_bytes,
-        "file_general_total_duration_in_milliseconds": file_general_total_duration_in_milliseconds,
-        "file_general_overall_bitrate": file_general_overall_bitrate,
-        "file_general_stream_size_in_bytes": file_general_stream_size_in_bytes,
-        "file_general_stream_size_pretty": file_general_stream_size_pretty,
-        "file_general_proportion_of_this_stream": file_general_proportion_of_this_stream,
+        "file_image_bit_depth": fields.file_image_bit_depth,
+        "file_image_stream_size_in_bytes": fields.file_image_stream_size_in_bytes,
+        "file_image_internet_media_type": fields.file_image_internet_media_type,
+        "file_image_commercial_name": fields.file_image_commercial_name,
+        "file_audio_stream_size_in_bytes": fields.file_audio_stream_size_in_bytes,
+        "file_audio_frame_rate": fields.file_audio_frame_rate,
+        "file_audio_sampling_rate": fields.file_audio_sampling_rate,
+        "file_audio_channel_s": fields.file_audio_channel_s,
+        "file_audio_bit_rate": fields.file_audio_bit_rate,
+        "file_audio_bit_rate_mode_pretty": fields.file_audio_bit_rate_mode_pretty,
+        "file_audio_total_duration_in_milliseconds": fields.file_audio_total_duration_in_milliseconds,
+        "file_general_total_file_size_in_bytes": fields.file_general_total_file_size_in_bytes,
+        "file_general_total_duration_in_milliseconds": fields.file_general_total_duration_in_milliseconds,
+        "file_general_overall_bitrate": fields.file_general_overall_bitrate,
+        "file_general_stream_size_in_bytes": fields.file_general_stream_size_in_bytes,
+        "file_general_stream_size_pretty": fields.file_general_stream_size_pretty,
+        "file_general_proportion_of_this_stream": fields.file_general_proportion_of_this_stream,
     }
 
     time_info_dict = {
-        "file_general_tagged_date_utc": file_general_tagged_date_utc,
-        "file_general_file_creation_date__local": file_general_file_creation_date__local,
-        "file_general_file_creation_date_utc": file_general_file_creation_date_utc,
-        "file_general_file_last_modification_date__local": file_general_file_last_modification_date__local,
-        "file_gerneral_file_last_modification_date_utc": file_gerneral_file_last_modification_date_utc,
+        "file_general_tagged_date_utc": fields.file_general_tagged_date_utc,
+        "file_general_file_creation_date__local": fields.file_general_file_creation_date__local,
+        "file_general_file_creation_date_utc": fields.file_general_file_creation_date_utc,
+        "file_general_file_last_modification_date__local": fields.file_general_file_last_modification_date__local,
+        "file_gerneral_file_last_modification_date_utc": fields.file_gerneral_file_last_modification_date_utc,
         "utc_offset": utc_offset,
         "matched_tz": matched_tz,
     }
 
     image_info_dict = {
-        "file_general_has_cover": file_general_has_cover,
-        "file_general_cover_type": file_general_cover_type,
-        "file_image_format_info": file_image_format_info,
-        "file_general_cover_mime": file_general_cover_mime,
-        "file_image_compression_mode": file_image_compression_mode,
-        "file_image_compression": file_image_compression,
-        "file_image_format_settings": file_image_format_settings,
-        "file_image_pixel_aspect_ratio": file_image_pixel_aspect_ratio,
-        "file_image_display_aspect_ratio": file_image_display_aspect_ratio,
-        "file_image_width": file_image_width,
-        "file_image_height": file_image_height,
-        "file_image_color_space": file_image_color_space,
-        "file_image_bit_depth_pretty": file_image_bit_depth_pretty,
-        "file_image_stream_size_pretty": file_image_stream_size_pretty,
-        "file_image_proportion_of_this_stream": file_image_proportion_of_this_stream,
+        "file_general_has_cover": fields.file_general_has_cover,
+        "file_general_cover_type": fields.file_general_cover_type,
+        "file_image_format_info": fields.file_image_format_info,
+        "file_general_cover_mime": fields.file_general_cover_mime,
+        "file_image_compression_mode": fields.file_image_compression_mode,
+        "file_image_compression": fields.file_image_compression,
+        "file_image_format_settings": fields.file_image_format_settings,
+        "file_image_pixel_aspect_ratio": fields.file_image_pixel_aspect_ratio,
+        "file_image_display_aspect_ratio": fields.file_image_display_aspect_ratio,
+        "file_image_width": fields.file_image_width,
+        "file_image_height": fields.file_image_height,
+        "file_image_color_space": fields.file_image_color_space,
+        "file_image_bit_depth_pretty": fields.file_image_bit_depth_pretty,
+        "file_image_stream_size_pretty": fields.file_image_stream_size_pretty,
+        "file_image_proportion_of_this_stream": fields.file_image_proportion_of_this_stream,
     }
 
     audio_info_dict = {
-        "file_audio_commercial_name": file_audio_commercial_name,
-        "file_audio_format_version": file_audio_format_version,
-        "file_audio_format_profile": file_audio_format_profile,
-        "file_audio_compression_mode": file_audio_compression_mode,
-        "file_general_track_writing_library": file_general_track_writing_library,
-        "file_audio_total_duration_timestamp": file_audio_total_duration_timestamp,
-        "file_audio_bit_rate_pretty": file_audio_bit_rate_pretty,
-        "file_audio_sampling_rate_pretty": file_audio_sampling_rate_pretty,
-        "file_audio_bit_rate_mode": file_audio_bit_rate_mode,
-        "file_audio_channel_s_pretty": file_audio_channel_s_pretty,
-        "file_audio_frame_rate_pretty": file_audio_frame_rate_pretty,
-        "file_audio_frame_count": file_audio_frame_count,
-        "file_audio_samples_per_frame": file_audio_samples_per_frame,
-        "file_audio_samples_count": file_audio_samples_count,
-        "file_audio_stream_size_pretty": file_audio_stream_size_pretty,
-        "file_audio_proportion_of_this_stream": file_audio_proportion_of_this_stream,
+        "file_audio_commercial_name": fields.file_audio_commercial_name,
+        "file_audio_format_version": fields.file_audio_format_version,
+        "file_audio_format_profile": fields.file_audio_format_profile,
+        "file_audio_compression_mode": fields.file_audio_compression_mode,
+        "file_general_track_writing_library": fields.file_general_track_writing_library,
+        "file_audio_total_duration_timestamp": fields.file_audio_total_duration_timestamp,
+        "file_audio_bit_rate_pretty": fields.file_audio_bit_rate_pretty,
+        "file_audio_sampling_rate_pretty": fields.file_audio_sampling_rate_pretty,
+        "file_audio_bit_rate_mode": fields.file_audio_bit_rate_mode,
+        "file_audio_channel_s_pretty": fields.file_audio_channel_s_pretty,
+        "file_audio_frame_rate_pretty": fields.file_audio_frame_rate_pretty,
+        "file_audio_frame_count": fields.file_audio_frame_count,
+        "file_audio_samples_per_frame": fields.file_audio_samples_per_frame,
+        "file_audio_samples_count": fields.file_audio_samples_count,
+        "file_audio_stream_size_pretty": fields.file_audio_stream_size_pretty,
+        "file_audio_proportion_of_this_stream": fields.file_audio_proportion_of_this_stream,
     }
 
     track_dict = {
-        "file_general_track_album_performer": file_general_track_album_performer,
-        "file_general_track_genre": file_general_track_genre,
-        "file_general_track_grouping": file_general_track_grouping,
-        "file_general_track_more": file_general_track_more,
-        "file_general_track_album": file_general_track_album,
-        "file_general_track_title": file_general_track_title,
-        "track_position_of_total": f"{file_general_track_name_position} / {file_general_track_name_total}",
-        "file_general_track_name_position": file_general_track_name_position,
-        "file_general_track_name_total": file_general_track_name_total,
+        "file_general_track_album_performer": fields.file_general_track_album_performer,
+        "file_general_track_genre": fields.file_general_track_genre,
+        "file_general_track_grouping": fields.file_general_track_grouping,
+        "file_general_track_more": fields.file_general_track_more,
+        "file_general_track_album": fields.file_general_track_album,
+        "file_general_track_title": fields.file_general_track_title,
+        "track_position_of_total": f"{fields.file_general_track_name_position} / {fields.file_general_track_name_total}",
+        "file_general_track_name_position": fields.file_general_track_name_position,
+        "file_general_track_name_total": fields.file_general_track_name_total,
     }
 
     audio_file_metadata = {
         "audio_file_metadata":{
-            "file_general_file_name_extension": file_general_file_name_extension,
-            # "file_general_recorded_date_utc": file_general_recorded_date_utc,
+            "file_general_file_name_extension": fields.file_general_file_name_extension,
+            # "file_general_recorded_date_utc": fields.file_general_recorded_date_utc,
             "full_recording_date_and_time": full_recording_date_and_time,
             "tz_friendly_name": tz_friendly_name,
-            "file_general_internet_media_type": file_general_internet_media_type,
-            "file_general_audio_codec": file_general_audio_codec,
-            "file_general_number_of_audio_streams": file_general_number_of_audio_streams,
-            "file_general_image_codec": file_general_image_codec,
-            "file_general_number_of_image_streams": file_general_number_of_image_streams,
-            "file_general_overall_bitrate_pretty": file_general_overall_bitrate_pretty,
-            "file_general_total_duration_timestamp": file_general_total_duration_timestamp,
-            "file_general_total_file_size_pretty": file_general_total_file_size_pretty,
-            "file_general_folder_name": file_general_folder_name,
-            "file_general_complete_name": file_general_complete_name,
+            "file_general_internet_media_type": fields.file_general_internet_media_type,
+            "file_general_audio_codec": fields.file_general_audio_codec,
+            "file_general_number_of_audio_streams": fields.file_general_number_of_audio_streams,
+            "file_general_image_codec": fields.file_general_image_codec,
+            "file_general_number_of_image_streams": fields.file_general_number_of_image_streams,
+            "file_general_overall_bitrate_pretty": fields.file_general_overall_bitrate_pretty,
+            "file_general_total_duration_timestamp": fields.file_general_total_duration_timestamp,
+            "file_general_total_file_size_pretty": fields.file_general_total_file_size_pretty,
+            "file_general_folder_name": fields.file_general_folder_name,
+            "file_general_complete_name": fields.file_general_complete_name,
             "track_info": track_dict,
             "audio_info": audio_info_dict,
             "image_info": image_info_dict,
             "time_info": time_info_dict,
             "random_raw": random_raw_values,
             "transcript": transcript_dict,
-            "sha256_hash": sha256_hash,
+            f"{hash_algo}_hash": content_hash,
+            "hash_algo": hash_algo,
         }
     }
 
@@ -646,13 +711,17 @@ def extract_mp3_info(file_path, sha256_hash):
 def generate_audio_metadata(file_path):
     logger.info(f"Processing: {file_path.name}")
 
-    sha256_hash = compute_sha256(file_path)
+    hash_algo, content_hash = compute_content_hash(file_path)
 
     if str(file_path.suffix).strip().lower() == ".mp3":
-        formatted_media_info, orig_media_info = extract_mp3_info(file_path, sha256_hash)
+        formatted_media_info, orig_media_info = extract_mp3_info(
+            file_path, hash_algo, content_hash
+        )
 
     if str(file_path.suffix).strip().lower() == ".flac":
-        formatted_media_info, orig_media_info = extract_mp3_info(file_path, sha256_hash)
+        formatted_media_info, orig_media_info = extract_mp3_info(
+            file_path, hash_algo, content_hash
+        )
     
     return formatted_media_info, orig_media_info
 #####################################################################################################################################
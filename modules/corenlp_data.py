@@ -1,11 +1,46 @@
 #####################################################################################################################################
 # NATIVE MODULES
+from functools import lru_cache
+
 import requests
+from requests.adapters import HTTPAdapter
 
 #####################################################################################################################################
 # HELPER MODULES
 from loguru import logger
 
+# Keep-alive connections kept per CoreNLP server; at least as many as the concurrent chunk requests
+CORENLP_POOL_CONNECTIONS = 16
+CORENLP_POOL_MAXSIZE = 64
+
+
+#####################################################################################################################################
+@lru_cache(maxsize=None)
+def get_corenlp_session(corenlp_server_url):
+    """
+    Returns the shared HTTP session used for every request to one CoreNLP server.
+
+    Args:
+        corenlp_server_url (str): The URL endpoint of the CoreNLP server.
+
+    Returns:
+        requests.Session: A session whose connection pool keeps connections to the server alive between chunks.
+
+    Notes:
+        - lru_cache makes this one session per server URL for the life of the process, so chunks after the
+          first reuse an open TCP connection instead of connecting again.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=CORENLP_POOL_CONNECTIONS, pool_maxsize=CORENLP_POOL_MAXSIZE
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+#####################################################################################################################################
+
 
 #####################################################################################################################################
 def corenlp_annotate_text(
@@ -38,7 +73,8 @@ def corenlp_annotate_text(
 
     Side Effects:
         - Logs information about the annotation process.
-        - Performs an external HTTP POST request to the CoreNLP server.
+        - Performs an external HTTP POST request to the CoreNLP server, over the pooled session from
+          `get_corenlp_session`.
 
     Notes:
         - Requires a running and accessible Stanford CoreNLP server instance with the necessary annotators loaded.
@@ -61,7 +97,7 @@ def corenlp_annotate_text(
         #'regexner.verbose': 'true' FOR TROUBLE SHOOTING
     }
 
-    response = requests.post(
+    response = get_corenlp_session(corenlp_server_url).post(
         corenlp_server_url,
         params={"properties": str(properties)},
         data=chunk.encode("utf-8"),
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 from math import floor
 
 from immanuel import charts
@@ -50,6 +51,22 @@ def get_planet_sign(objects_dict, planet_name):
     raise ValueError(f"{planet_name} not found in natal_chart.objects")
 
 
+# The natal chart only depends on the birth data and the house system, so it is
+# built once and shared by every chunk instead of being recalculated each call
+@logger.catch
+@lru_cache(maxsize=None)
+def get_natal_chart(
+    natal_date_and_time_of_birth, natal_lat, natal_long, natal_timezone, house_system
+):
+    natal_subject = charts.Subject(
+        date_time=natal_date_and_time_of_birth,
+        latitude=natal_lat,
+        longitude=natal_long,
+        timezone=natal_timezone,
+    )
+    return charts.Natal(natal_subject)
+
+
 @logger.catch
 def calculate_current_profections(chunk_start_datetime, astrology_variables):
 
@@ -71,13 +88,13 @@ def calculate_current_profections(chunk_start_datetime, astrology_variables):
     natal_long = astrology_variables.natal_long
     natal_timezone = astrology_variables.natal_timezone
 
-    natal_subject = charts.Subject(
-        date_time=natal_date_and_time_of_birth,
-        latitude=natal_lat,
-        longitude=natal_long,
-        timezone=natal_timezone,
+    natal_chart = get_natal_chart(
+        natal_date_and_time_of_birth,
+        natal_lat,
+        natal_long,
+        natal_timezone,
+        astrology_variables.immanuel_house_system,
     )
-    natal_chart = charts.Natal(natal_subject)
 
     for house in natal_chart.houses.values():
         if house.number == 1:
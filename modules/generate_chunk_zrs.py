@@ -1,5 +1,6 @@
 import csv
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from loguru import logger
 
@@ -50,6 +51,14 @@ def build_active_periods(rows):
     return periods
 
 
+# The POS / POF files do not change during a run, so each one is read and
+# turned into periods once instead of for every chunk
+@logger.catch
+@lru_cache(maxsize=None)
+def load_active_periods(csv_file):
+    return build_active_periods(load_csv(csv_file))
+
+
 @logger.catch
 def find_active_row(periods, check_datetime):
     for period in periods:
@@ -89,13 +98,11 @@ def generate_zrs_data(pos_file, pof_file, chunk_start_datetime):
     logger.info(f"Checking datetime: {chunk_start_datetime}")
 
     # Process POS
-    pos_rows = load_csv(pos_file)
-    pos_periods = build_active_periods(pos_rows)
+    pos_periods = load_active_periods(pos_file)
     pos_match = find_active_row(pos_periods, check_datetime)
 
     # Process POF
-    pof_rows = load_csv(pof_file)
-    pof_periods = build_active_periods(pof_rows)
+    pof_periods = load_active_periods(pof_file)
     pof_match = find_active_row(pof_periods, check_datetime)
 
     # Build JSON output
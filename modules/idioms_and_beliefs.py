@@ -1,6 +1,7 @@
 #####################################################################################################################################
 # NATIVE MODULES
 import re
+from functools import lru_cache
 
 idiolect = None
 
@@ -315,7 +316,8 @@ def process_doc(chunk_text, model_config_name, models):
     tokenized, parsed, and annotated linguistic data.
 
     Args:
-        chunk_text (str): The text to be analyzed by the spaCy model.
+        chunk_text (str | spacy.tokens.Doc): The text to be analyzed by the spaCy model, or an
+            already parsed `Doc`.
         model_config_name (str): The key used to retrieve the correct model configuration
             from the `models` dictionary.
         models (dict): A dictionary containing loaded model configurations, each with keys
@@ -334,6 +336,8 @@ def process_doc(chunk_text, model_config_name, models):
           future extensions.
         - The returned `Doc` object can be further used for named entity recognition (NER),
           dependency parsing, part-of-speech tagging, etc.
+        - A `Doc` passed in as `chunk_text` is returned as is instead of being run through the
+          pipeline again.
 
     Caveats:
         - If the model is not found under the given `model_config_name`, `None` is returned
@@ -344,12 +348,42 @@ def process_doc(chunk_text, model_config_name, models):
         - If the model is not a callable spaCy object, runtime failure will occur.
     """
 
+    # Already parsed (e.g., by nlp.pipe() over a batch of chunks)
+    if not isinstance(chunk_text, str):
+        return chunk_text
+
     spacy_classifier_model = models[model_config_name].get("model", None)
 
     doc = spacy_classifier_model(chunk_text)
     return doc
 
 
+#####################################################################################################################################
+@lru_cache(maxsize=4)
+def compile_idiolect_patterns(idiolect):
+    """
+    Compiles the word-boundary pattern of every idiom in an idiolect once, for reuse across sentences and chunks.
+
+    Args:
+        idiolect (tuple[str, ...]): The idioms, as a tuple so the compiled result can be cached.
+
+    Returns:
+        list[tuple[str, re.Pattern]]: Each lowercased idiom with its compiled `\\b<idiom>\\b` pattern.
+
+    Notes:
+        - `re` only caches a few hundred compiled patterns, so with a large idiolect every sentence used to
+          recompile most of them.
+        - The lowercased idiom is kept so callers can skip the regex when the idiom is not even a substring.
+    """
+    return [
+        (idiom.lower(), re.compile(r"\b" + re.escape(idiom.lower()) + r"\b"))
+        for idiom in idiolect
+    ]
+
+
+#####################################################################################################################################
+
+
 #####################################################################################################################################
 def rank_idiolect_data(chunk_text, model_config_name, models, idiolect):
     """
@@ -389,18 +423,21 @@ def rank_idiolect_data(chunk_text, model_config_name, models, idiolect):
     spacy_classifier_model = models[model_config_name].get("model", None)
 
     ranked_idiolect_data = {"actions": [], "sentences": []}
-    doc = spacy_classifier_model(chunk_text)
-    for i, sentence in enumerate(doc.sents):
+    # Reuses the Doc when the caller already parsed the chunk
+    doc = process_doc(chunk_text, model_config_name, models)
+    sentences = list(doc.sents)
+    idiom_patterns = compile_idiolect_patterns(tuple(idiolect))
+    for i, sentence in enumerate(sentences):
         causes = get_causes(sentence.text, spacy_classifier_model)
         matched_idioms = {}
         all_matches = []
 
         # Check for exact single-word and multi-word idiom matches in the idiolect
+        # The substring test is a cheap necessary condition; most idioms fail it and skip the regex
         sent_text = sentence.text.lower()
-        for idiom in idiolect:
-            pattern = r"\b" + re.escape(idiom.lower()) + r"\b"
-            matches = re.findall(pattern, sent_text)
-            all_matches.extend(matches)
+        for idiom, pattern in idiom_patterns:
+            if idiom in sent_text:
+                all_matches.extend(pattern.findall(sent_text))
 
         # Count the occurrences of the longest matching phrases
         for match in set(all_matches):
@@ -410,7 +447,7 @@ def rank_idiolect_data(chunk_text, model_config_name, models, idiolect):
             matched_idioms[longest_idiom] = matched_idioms.get(longest_idiom, 0) + count
 
         if matched_idioms and len(matched_idioms.keys()) >= 4:
-            context_sentences = list(doc.sents)[max(0, i - 5) : i]
+            context_sentences = sentences[max(0, i - 5) : i]
             context = [sentence.text for sentence in context_sentences]
             sorted_idioms = dict(
                 sorted(matched_idioms.items(), key=lambda item: -item[1])
@@ -437,7 +474,7 @@ def rank_idiolect_data(chunk_text, model_config_name, models, idiolect):
                 for child in token.children:
                     if child.text == "me":
                         action = token.text
-                        context_sents = list(doc.sents)[max(0, i - 5) : i]
+                        context_sents = sentences[max(0, i - 5) : i]
                         context = [sent.text for sent in context_sents]
                         ranked_idiolect_data["actions"].append(
                             {
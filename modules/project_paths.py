@@ -28,6 +28,7 @@ class ProjectPaths:
 
     # Output subfolders
     output_corpus: Path = output / "corpus"
+    output_model_cache: Path = output / "_model_cache"
 
 
 # Single instance to import
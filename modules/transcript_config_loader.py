@@ -6,7 +6,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
-import toml
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
 from loguru import logger
 
 
@@ -67,7 +71,8 @@ def load_transcription_config(
         )
         sys.exit(1)
 
-    config = toml.load(config_path)
+    with open(config_path, "rb") as f:
+        config = tomllib.load(f)
     transcription_variables = config.get("transcription_variables", {})
 
     # === Environment variables & warnings ===